@@ -0,0 +1,368 @@
+#
+# PygamePal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+# Benchmarks:
+#  -- runs each scenario headless (using SDL's dummy video driver),
+#     with a fixed random seed, at several sizes
+#  -- measures frames per second and the time taken by each frame and phase
+#  -- results are written as JSON, and can be compared against a previous run
+#
+# Usage:
+#  -- python benchmarks/benchmark.py --output results.json
+#  -- python benchmarks/benchmark.py --scenarios sprites lights --sizes 100 1000
+#  -- python benchmarks/benchmark.py --compare baseline.json
+#
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+# run without a display, and without pygame's welcome message
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+import pygamepal
+
+# the size of the game screen for all scenarios
+screenSize = (640, 480)
+
+#
+# benchmark game
+#
+
+class BenchmarkGame(pygamepal.Game):
+
+    '''
+    A headless game that calls a scenario's update and draw functions each frame.
+    '''
+
+    def init(self):
+        self.updateFunction = None
+        self.drawFunction = None
+
+    def update(self):
+        if self.updateFunction is not None:
+            self.updateFunction()
+
+    def draw(self):
+        if self.drawFunction is not None:
+            self.drawFunction()
+
+#
+# scenarios
+#
+# each scenario sets up a game with n objects,
+# using rng for all random values
+#
+
+def spritesScenario(game, n, rng):
+
+    # n textured sprites on random layers, moving and changing
+    # layer so that they need re-sorting every frame
+    texture = pygame.Surface((16, 16), pygame.SRCALPHA)
+    texture.fill('orange')
+    sprites = []
+    for _ in range(n):
+        sprite = pygamepal.Sprite(texture = texture,
+                                  position = (rng.uniform(0, screenSize[0]), rng.uniform(0, screenSize[1])),
+                                  layer = rng.randrange(10))
+        sprite.velocity = (rng.uniform(-2, 2), rng.uniform(-2, 2))
+        game.addSprite(sprite)
+        sprites.append(sprite)
+
+    def update():
+        for sprite in sprites:
+            sprite.position = ((sprite.x + sprite.velocity[0]) % screenSize[0],
+                               (sprite.y + sprite.velocity[1]) % screenSize[1])
+        for sprite in rng.sample(sprites, max(1, n // 10)):
+            sprite.layer = rng.randrange(10)
+
+    game.updateFunction = update
+
+def collidersScenario(game, n, rng):
+
+    # n static colliders, with 10 moving sprites that collide with them
+    for _ in range(n):
+        game.addCollider(pygamepal.Collider(position = (rng.uniform(0, screenSize[0]), rng.uniform(0, screenSize[1])),
+                                            size = (rng.randint(4, 16), rng.randint(4, 16))))
+    movers = []
+    for _ in range(10):
+        sprite = pygamepal.Sprite(position = (rng.uniform(0, screenSize[0]), rng.uniform(0, screenSize[1])),
+                                  size = (8, 8), collider = pygamepal.Collider(size = (8, 8)))
+        sprite.velocity = (rng.uniform(-2, 2), rng.uniform(-2, 2))
+        game.addSprite(sprite)
+        movers.append(sprite)
+
+    def update():
+        for sprite in movers:
+            sprite.position = ((sprite.x + sprite.velocity[0]) % screenSize[0],
+                               (sprite.y + sprite.velocity[1]) % screenSize[1])
+
+    game.updateFunction = update
+
+def triggersScenario(game, n, rng):
+
+    # n moving triggers, which can all collide with each other
+    triggers = []
+    for _ in range(n):
+        trigger = pygamepal.Trigger(position = (rng.uniform(0, screenSize[0]), rng.uniform(0, screenSize[1])),
+                                    size = (16, 16), onCollide = lambda t, other: None)
+        trigger.velocity = (rng.randint(-2, 2), rng.randint(-2, 2))
+        game.addTrigger(trigger)
+        triggers.append(trigger)
+
+    def update():
+        for trigger in triggers:
+            trigger.x = (trigger.x + trigger.velocity[0]) % screenSize[0]
+            trigger.y = (trigger.y + trigger.velocity[1]) % screenSize[1]
+
+    game.updateFunction = update
+
+def particlesScenario(game, n, rng):
+
+    # an emitter with (around) n live particles
+    emitter = pygamepal.ParticleEmitter(
+        emitterPosition = (0, screenSize[1] // 2),
+        emitterSize = (screenSize[0], 0),
+        emitterLifetime = -1,
+        emitterParticleDelay = 100 / n,
+        particleLifetime = 100,
+        particleSize = 4,
+        particleSizeDecay = 0,
+        particleColors = ['white', 'gray80', 'gray60'],
+        seed = rng.randrange(2 ** 32)
+    )
+    emitter.prewarm(100)
+
+    game.updateFunction = lambda: emitter.update(game.deltaTime)
+    game.drawFunction = lambda: emitter.draw(game.screen)
+
+def lightsScenario(game, n, rng):
+
+    # n moving lights in a dark scene
+    lighting = game.currentScene.lighting
+    lighting.lightLevel = 0.2
+    lights = []
+    for _ in range(n):
+        light = pygamepal.Light(position = (rng.uniform(0, screenSize[0]), rng.uniform(0, screenSize[1])),
+                                radius = rng.randint(20, 100))
+        lighting.addLight(light)
+        lights.append(light)
+
+    def update():
+        for light in rng.sample(lights, max(1, n // 10)):
+            light.position[0] = (light.position[0] + rng.uniform(-4, 4)) % screenSize[0]
+            light.position[1] = (light.position[1] + rng.uniform(-4, 4)) % screenSize[1]
+
+    game.updateFunction = update
+
+def cameraScenario(game, n, rng):
+
+    # a camera zooming in and out of a large (n x n) scene
+    scene = pygamepal.Scene(game, surfaceSize = (n, n))
+    for _ in range(200):
+        sprite = pygamepal.Sprite(position = (rng.uniform(0, n), rng.uniform(0, n)), size = (32, 32))
+        scene.addSprite(sprite)
+    game.currentScene = scene
+    scene.camera.setTarget((n / 2, n / 2), instant = True)
+
+    def update():
+        frame = scene.frame
+        scene.camera.zoom = 0.5 + (frame % 120) / 60
+        scene.camera.target = (n / 2 + (frame % 200) - 100, n / 2)
+
+    game.updateFunction = update
+
+def textScenario(game, n, rng):
+
+    # a HUD with n lines of text, each with a value that
+    # changes every few frames (and so sometimes needs rendering)
+    fonts = [pygamepal.smallFont, pygamepal.sysFont]
+    lines = [('Label ' + str(i) + ': ', rng.choice(fonts), rng.randint(1, 30)) for i in range(n)]
+    lineHeight = 12
+
+    def draw():
+        frame = game.currentScene.frame
+        for i, (label, font, changeFrames) in enumerate(lines):
+            pygamepal.drawText(game.screen, label + str(frame // changeFrames),
+                               ((i // 40) * 120 % screenSize[0], (i % 40) * lineHeight), font = font)
+
+    game.drawFunction = draw
+
+def inputScenario(game, n, rng):
+
+    # n key presses or releases per frame, with actions bound to some keys
+    keys = sorted({getattr(pygame, name) for name in dir(pygame)
+                   if name.startswith('K_') and 0 < getattr(pygame, name) < 0x40000200})
+    down = set()
+    for i, key in enumerate(keys[:20]):
+        game.actions.bind('action ' + str(i), [key, (keys[-1], key)])
+
+    def update():
+        for key in rng.sample(keys, min(n, len(keys))):
+            if key in down:
+                down.remove(key)
+                pygame.event.post(pygame.event.Event(pygame.KEYUP, key = key, mod = 0))
+            else:
+                down.add(key)
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key = key, mod = 0))
+
+    game.updateFunction = update
+
+# each scenario's setup function, description and default sizes
+scenarios = {
+    'sprites': (spritesScenario, 'n sprites sorted and drawn', [100, 1000, 5000]),
+    'colliders': (collidersScenario, 'n colliders, with 10 moving sprites', [50, 200, 1000]),
+    'triggers': (triggersScenario, 'n moving triggers', [25, 100, 250]),
+    'particles': (particlesScenario, 'around n live particles', [1000, 5000, 20000]),
+    'lights': (lightsScenario, 'n lights, a tenth moving each frame', [10, 50, 200]),
+    'camera': (cameraScenario, 'camera zooming on an n x n scene', [1024, 2048, 4096]),
+    'text': (textScenario, 'n lines of HUD text', [10, 100, 400]),
+    'input': (inputScenario, 'n key presses / releases per frame', [1, 10, 100]),
+}
+
+#
+# running benchmarks
+#
+
+def runBenchmark(name, n, frames = 300, warmupFrames = 30, seed = 0):
+
+    '''
+    Runs a single scenario at a single size, returning its result.
+
+    :param str name: The scenario name.
+    :param int n: The scenario size.
+    :param int frames: The number of frames to measure (default = 300).
+    :param int warmupFrames: The number of frames to run before measuring (default = 30).
+    :param int seed: The random seed (default = 0).
+    '''
+
+    # colliders and triggers are stored for all games,
+    # so remove any created by this benchmark afterwards
+    colliderCount = len(pygamepal.Collider._allColliders)
+    triggerCount = len(pygamepal.Trigger._allTriggers)
+    pygame.event.clear()
+
+    random.seed(seed)
+    game = BenchmarkGame(screenSize, name, headless = True, render = True)
+    scenarios[name][0](game, n, random.Random(seed))
+
+    for _ in range(warmupFrames):
+        game._runFrame(game.render)
+
+    game.profiler = pygamepal.Profiler(frames)
+    startTime = time.perf_counter()
+    for _ in range(frames):
+        game._runFrame(game.render)
+    totalTime = time.perf_counter() - startTime
+
+    del pygamepal.Collider._allColliders[colliderCount:]
+    del pygamepal.Trigger._allTriggers[triggerCount:]
+
+    stats = game.profiler.getStats()
+    return {
+        'scenario': name,
+        'n': n,
+        'frames': frames,
+        'fps': frames / totalTime,
+        'frame': {k: v for k, v in stats.pop('frame').items() if k != 'allocations'},
+        'phases': {phase: phaseStats['mean'] for phase, phaseStats in stats.items()}
+    }
+
+def getEnvironment():
+
+    '''
+    Returns a dictionary describing the versions and machine used to run benchmarks.
+    '''
+
+    return {
+        'pygamepal': pygamepal.__version__,
+        'pygame': pygame.version.ver,
+        'sdl': '.'.join(str(v) for v in pygame.get_sdl_version()),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor()
+    }
+
+def compareResults(results, baseline, tolerance):
+
+    '''
+    Prints a comparison of median frame times with a baseline,
+    returning a list of (scenario, n) results that are slower by more than the tolerance.
+
+    :param list results: The benchmark results.
+    :param list baseline: The baseline benchmark results.
+    :param float tolerance: The fraction slower a result can be before it's a regression.
+    '''
+
+    baselineTimes = {(r['scenario'], r['n']): r['frame']['p50'] for r in baseline}
+    regressions = []
+    print()
+    print('{:<12}{:>8}{:>12}{:>12}{:>10}'.format('vs baseline', 'n', 'base ms', 'ms', 'change'))
+    for r in results:
+        key = (r['scenario'], r['n'])
+        if key not in baselineTimes:
+            continue
+        before = baselineTimes[key]
+        after = r['frame']['p50']
+        change = (after - before) / before if before > 0 else 0
+        flag = ''
+        if change > tolerance:
+            regressions.append(key)
+            flag = '  slower'
+        print('{:<12}{:>8}{:>12.3f}{:>12.3f}{:>+9.0%}{}'.format(r['scenario'], r['n'], before, after, change, flag))
+    return regressions
+
+def main():
+
+    parser = argparse.ArgumentParser(description = 'Benchmark pygamepal.')
+    parser.add_argument('--scenarios', nargs = '+', choices = list(scenarios), default = list(scenarios),
+                        help = 'the scenarios to run (default = all)')
+    parser.add_argument('--sizes', nargs = '+', type = int,
+                        help = 'the sizes to run each scenario at (default = the sizes for each scenario)')
+    parser.add_argument('--frames', type = int, default = 300, help = 'the number of frames to measure (default = 300)')
+    parser.add_argument('--warmup', type = int, default = 30, help = 'the number of frames to run before measuring (default = 30)')
+    parser.add_argument('--seed', type = int, default = 0, help = 'the random seed (default = 0)')
+    parser.add_argument('--output', help = 'the JSON file to write results to')
+    parser.add_argument('--compare', help = 'a JSON results file to compare with')
+    parser.add_argument('--tolerance', type = float, default = 0.1,
+                        help = 'the fraction slower than the compared results that counts as a regression (default = 0.1)')
+    args = parser.parse_args()
+
+    print('{:<12}{:>8}{:>10}{:>10}{:>10}{:>10}'.format('scenario', 'n', 'fps', 'p50 ms', 'p95 ms', 'p99 ms'))
+    results = []
+    for name in args.scenarios:
+        for n in (args.sizes or scenarios[name][2]):
+            result = runBenchmark(name, n, args.frames, args.warmup, args.seed)
+            results.append(result)
+            print('{:<12}{:>8}{:>10.1f}{:>10.3f}{:>10.3f}{:>10.3f}'.format(
+                name, n, result['fps'], result['frame']['p50'], result['frame']['p95'], result['frame']['p99']))
+
+    output = {
+        'environment': getEnvironment(),
+        'settings': {'frames': args.frames, 'warmup': args.warmup, 'seed': args.seed},
+        'results': results
+    }
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(output, file, indent = 2)
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+        if len(compareResults(results, baseline, args.tolerance)) > 0:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -7,10 +7,17 @@ import pygame
 from .globals import *
 
 from .game import *
+from .simulation import *
+from .profiler import *
+from .tracer import *
+from .memorySnapshot import *
 from .scene import *
 from .sprite import *
+from .spritePool import *
+from .world import *
 
 from .input import *
+from .actionMap import *
 from .camera import *
 from .spriteImage import *
 from .collider import *
@@ -25,7 +32,9 @@ from .lighting import *
 from .dialogue import *
 from .dialoguePage import *
 
+from .fonts import *
 from .drawText import *
+from .bitmapFont import *
 from .spriteTextureList import *
 from .splitTexture import *
 from .flatten import *
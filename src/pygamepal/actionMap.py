@@ -0,0 +1,311 @@
+#
+# pygamepal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+
+import pygame
+
+# input source types
+_KEY = 0
+_MOUSE_BUTTON = 1
+_JOYSTICK_BUTTON = 2
+_JOYSTICK_AXIS = 3
+_JOYSTICK_HAT = 4
+
+_hatDirections = {
+    'up': (0, 1),
+    'down': (0, -1),
+    'left': (-1, 0),
+    'right': (1, 0)
+}
+
+class ActionMap:
+
+    '''
+    Maps named actions (such as 'jump') to keys, mouse buttons, joystick inputs and chords,
+    so that game code can check actions instead of individual inputs.
+
+    Bindings are compiled when they are set, and all actions are evaluated once per frame
+    by update(), so checking an action is a single lookup.
+
+    Each action has a list of bindings, and is down if any of its bindings are down.
+    A binding can be:
+
+    - a key code (e.g. pygame.K_SPACE) or key name (e.g. 'space', 'left ctrl').
+    - a mouse button, e.g. 'mouse 0'.
+    - a joystick button, e.g. 'joystick button 0' (joystick 0), or 'joystick 1 button 0' (joystick 1).
+    - a joystick axis direction, e.g. 'joystick axis 0 -' or 'joystick 1 axis 1 +'.
+    - a joystick hat (d-pad) direction, e.g. 'joystick hat 0 up'.
+    - a chord of the above as a tuple, which is down if all of its inputs are down, e.g. ('left ctrl', 's').
+
+    :param pygamepal.Input input: The input to read from.
+    :param dict bindings: A dictionary of actions and their bindings, e.g. {'jump': ['space', 'joystick button 0']} (default = None).
+    :param float axisThreshold: The distance a joystick axis must be moved for an axis binding to be down (default = 0.5).
+    '''
+
+    def __init__(self, input, bindings = None, axisThreshold = 0.5):
+
+        self.input = input
+        self.axisThreshold = axisThreshold
+
+        # the bindings for each action, as given
+        self._bindings = {}
+        # each action is a bit in the down / pressed / released bitsets
+        self._actionBits = {}
+
+        # compiled bindings:
+        # each unique input source is checked once per update,
+        # and each action is a list of chords of source indexes
+        self._sources = []
+        self._sourceStates = []
+        # sources that were down at any point this frame
+        # (including keys pressed and released within the frame)
+        self._sourceActiveStates = []
+        self._actionChords = []
+
+        # bitsets of actions for the current frame
+        self._down = 0
+        self._pressed = 0
+        self._released = 0
+
+        if bindings is not None:
+            for action, actionBindings in bindings.items():
+                self._bindings[action] = self._toBindingList(actionBindings)
+                self._actionBits.setdefault(action, 1 << len(self._actionBits))
+            self._compile()
+
+    def update(self):
+
+        '''
+        Call once per frame, after the input has been updated, to update all actions.
+        (Note: only needs to be called if using independently (i.e. not as part of a game).)
+        '''
+
+        # check each input source once
+        sourceStates = self._sourceStates
+        sourceActiveStates = self._sourceActiveStates
+        for i, source in enumerate(self._sources):
+            sourceStates[i] = self._isSourceDown(source)
+            sourceActiveStates[i] = sourceStates[i] or self._isSourcePressed(source)
+
+        down = self._getChordActions(sourceStates)
+        active = self._getChordActions(sourceActiveStates)
+
+        # an action tapped within the frame (active, but not down before or after)
+        # is both pressed and released
+        self._pressed = active & ~self._down
+        self._released = (self._down & ~down) | (active & ~down & ~self._down)
+        self._down = down
+
+    def _getChordActions(self, sourceStates):
+
+        '''
+        Returns the bitset of actions with all inputs of any of their chords in the state given.
+
+        :param list(bool) sourceStates: The state of each input source.
+        '''
+
+        actions = 0
+        for bit, chords in self._actionChords:
+            for chord in chords:
+                for i in chord:
+                    if not sourceStates[i]:
+                        break
+                else:
+                    actions |= bit
+                    break
+        return actions
+
+    #
+    # bindings
+    #
+
+    def bind(self, action, bindings):
+
+        '''
+        Sets the bindings for an action, replacing any existing bindings.
+
+        :param str action: The action name.
+        :param list bindings: The bindings for the action (or a single binding).
+        '''
+
+        self._bindings[action] = self._toBindingList(bindings)
+        self._actionBits.setdefault(action, 1 << len(self._actionBits))
+        self._compile()
+
+    def unbind(self, action):
+
+        '''
+        Removes all bindings for an action.
+
+        :param str action: The action name.
+        '''
+
+        if action in self._bindings:
+            self._bindings[action] = []
+            self._compile()
+
+    def getBindings(self, action):
+
+        '''
+        Returns the list of bindings for an action.
+
+        :param str action: The action name.
+        '''
+
+        return list(self._bindings.get(action, []))
+
+    #
+    # action methods
+    #
+
+    def down(self, action):
+
+        '''
+        Returns true if the action is held down during the current frame.
+
+        :param str action: The action to check.
+        '''
+
+        return self._down & self._actionBits.get(action, 0) != 0
+
+    def pressed(self, action):
+
+        '''
+        Returns true if the action has been pressed during the current frame.
+
+        :param str action: The action to check.
+        '''
+
+        return self._pressed & self._actionBits.get(action, 0) != 0
+
+    def released(self, action):
+
+        '''
+        Returns true if the action has been released during the current frame.
+
+        :param str action: The action to check.
+        '''
+
+        return self._released & self._actionBits.get(action, 0) != 0
+
+    #
+    # compiling bindings
+    #
+
+    def _toBindingList(self, bindings):
+
+        '''
+        Returns bindings as a list, checking that each binding is valid.
+
+        :param list bindings: The bindings (or a single binding).
+        '''
+
+        if isinstance(bindings, (int, str, tuple)):
+            bindings = [bindings]
+        bindings = list(bindings)
+        for binding in bindings:
+            for source in (binding if isinstance(binding, tuple) else (binding,)):
+                self._parseSource(source)
+        return bindings
+
+    def _compile(self):
+
+        '''
+        Compiles all bindings into a list of unique input sources,
+        and a list of chords of source indexes for each action.
+        '''
+
+        sourceIndexes = {}
+        actionChords = []
+        for action, bindings in self._bindings.items():
+            chords = []
+            for binding in bindings:
+                chord = []
+                for source in (binding if isinstance(binding, tuple) else (binding,)):
+                    source = self._parseSource(source)
+                    if source not in sourceIndexes:
+                        sourceIndexes[source] = len(sourceIndexes)
+                    chord.append(sourceIndexes[source])
+                chords.append(tuple(chord))
+            if len(chords) > 0:
+                actionChords.append((self._actionBits[action], tuple(chords)))
+
+        self._sources = list(sourceIndexes)
+        self._sourceStates = [False] * len(self._sources)
+        self._sourceActiveStates = [False] * len(self._sources)
+        self._actionChords = actionChords
+
+    def _parseSource(self, source):
+
+        '''
+        Returns an input source as a (type, code, joystick, direction) tuple.
+
+        :param source: A key code or input name.
+        '''
+
+        if isinstance(source, int):
+            return (_KEY, source, 0, 0)
+
+        words = source.lower().split()
+        try:
+            if words[0] == 'mouse' and len(words) == 2:
+                return (_MOUSE_BUTTON, int(words[1]), 0, 0)
+
+            if words[0] == 'joystick':
+                words = words[1:]
+                joystick = 0
+                if words[0].isdigit():
+                    joystick = int(words.pop(0))
+                if words[0] == 'button' and len(words) == 2:
+                    return (_JOYSTICK_BUTTON, int(words[1]), joystick, 0)
+                if words[0] == 'axis' and len(words) == 3 and words[2] in ('+', '-'):
+                    return (_JOYSTICK_AXIS, int(words[1]), joystick, 1 if words[2] == '+' else -1)
+                if words[0] == 'hat' and len(words) == 3 and words[2] in _hatDirections:
+                    return (_JOYSTICK_HAT, int(words[1]), joystick, _hatDirections[words[2]])
+                raise ValueError
+
+            return (_KEY, pygame.key.key_code(source), 0, 0)
+
+        except (ValueError, IndexError):
+            raise ValueError('Invalid binding: ' + repr(source))
+
+    def _isSourceDown(self, source):
+
+        '''
+        Returns true if an input source is down.
+
+        :param tuple source: The (type, code, joystick, direction) input source.
+        '''
+
+        sourceType, code, joystick, direction = source
+        if sourceType == _KEY:
+            return self.input.isKeyDown(code)
+        if sourceType == _MOUSE_BUTTON:
+            return self.input.isMouseButtonDown(code)
+        if sourceType == _JOYSTICK_BUTTON:
+            return self.input.isJoystickButtonDown(code, joystick)
+        if sourceType == _JOYSTICK_AXIS:
+            return self.input.getJoystickAxis(code, joystick) * direction >= self.axisThreshold
+        x, y = self.input.getJoystickHat(code, joystick)
+        return (direction[0] != 0 and x == direction[0]) or (direction[1] != 0 and y == direction[1])
+
+    def _isSourcePressed(self, source):
+
+        '''
+        Returns true if an input source was pressed this frame.
+        (Axes and hats are only checked using their current state.)
+
+        :param tuple source: The (type, code, joystick, direction) input source.
+        '''
+
+        sourceType, code, joystick, _ = source
+        if sourceType == _KEY:
+            return self.input.isKeyPressed(code)
+        if sourceType == _MOUSE_BUTTON:
+            return self.input.isMouseButtonPressed(code)
+        if sourceType == _JOYSTICK_BUTTON:
+            return self.input.isJoystickButtonPressed(code, joystick)
+        return False
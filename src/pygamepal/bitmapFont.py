@@ -0,0 +1,229 @@
+#
+# pygamepal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+
+import pygame
+import string
+from collections import OrderedDict
+from .fonts import sysFont
+
+class BitmapFont:
+
+    '''
+    A font that renders each character once into a glyph atlas (one per color), and then draws text
+    by copying characters from the atlas. Drawing text costs the same whether or not the text has changed,
+    making it suitable for text that changes every frame (such as scores, timers and damage numbers).
+
+    A BitmapFont can be used in place of a pygame.Font in pygamepal.drawText, pygamepal.Dialogue and pygamepal.Button.
+
+    :param pygame.Font font: The font to create glyphs from (default = None, which uses pygamepal.sysFont).
+    :param str characters: The characters to add to the atlas. Other characters are added individually when first used (default = all printable ASCII characters).
+    :param int maxAtlases: The number of atlases (colors) to store, after which the least recently used is removed (default = 16).
+    :param int maxExtraGlyphs: The number of characters not in the atlas to store for each color, after which they are removed and rendered again when next used (default = 256).
+    '''
+
+    def __init__(self, font = None, characters = None, maxAtlases = 16, maxExtraGlyphs = 256):
+
+        if font is None:
+            font = sysFont
+        if characters is None:
+            characters = ''.join(c for c in string.printable if c not in '\t\n\r\x0b\x0c')
+
+        self.font = font
+        self.characters = characters
+        self.maxAtlases = maxAtlases
+        self.maxExtraGlyphs = maxExtraGlyphs
+        # the characters in each atlas, which are never removed
+        self._atlasCharacters = set(characters)
+
+        # maps (color, antialias) to a dictionary of character glyph surfaces
+        # (glyphs in the same color share an atlas),
+        # ordered from least to most recently used
+        self._glyphs = OrderedDict()
+        # maps colors as given (e.g. 'white') to their (color, antialias) key
+        self._glyphKeys = {}
+
+    def draw(self, surface, text, position, color = 'white', antialias = True):
+
+        '''
+        Draws text directly to a surface, using a single fblits() call.
+
+        :param pygame.Surface surface: The surface to draw to.
+        :param str text: The text to draw.
+        :param (int, int) position: The (x, y) top-left position to draw the text.
+        :param pygame.Color color: Text color (default = 'white').
+        :param bool antialias: Antialias text (default = True).
+        '''
+
+        glyphs = self._getGlyphs(color, antialias)
+        x, y = position
+        blits = []
+        for c in text:
+            glyph = glyphs.get(c)
+            if glyph is None:
+                glyph = self._addGlyph(glyphs, c, color, antialias)
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.fblits(blits)
+
+    #
+    # pygame.Font methods, allowing use in place of a pygame.Font
+    #
+
+    def render(self, text, antialias, color, background = None):
+
+        '''
+        Returns a new surface containing the text, in the same way as pygame.Font.render().
+
+        :param str text: The text to render.
+        :param bool antialias: Antialias text.
+        :param pygame.Color color: Text color.
+        :param pygame.Color background: Background color (default = None, which is transparent).
+        '''
+
+        textSurface = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        if background is not None:
+            textSurface.fill(background)
+        self.draw(textSurface, text, (0, 0), color, antialias)
+        return textSurface
+
+    def size(self, text):
+
+        '''
+        Returns the (w, h) size of the text.
+
+        :param str text: The text to measure.
+        '''
+
+        glyphs = self._getGlyphs('white', True)
+        width = 0
+        for c in text:
+            glyph = glyphs.get(c)
+            if glyph is None:
+                glyph = self._addGlyph(glyphs, c, 'white', True)
+            width += glyph.get_width()
+        return (width, self._glyphHeight)
+
+    def metrics(self, text):
+
+        '''
+        Returns the metrics for each character of the text, in the same way as pygame.Font.metrics(),
+        with each character's advance set to the width of its glyph.
+
+        :param str text: The text to measure.
+        '''
+
+        glyphs = self._getGlyphs('white', True)
+        metrics = []
+        for c, fontMetrics in zip(text, self.font.metrics(text)):
+            glyph = glyphs.get(c)
+            if glyph is None:
+                glyph = self._addGlyph(glyphs, c, 'white', True)
+            width = glyph.get_width()
+            if fontMetrics is None:
+                metrics.append((0, width, 0, self._glyphHeight, width))
+            else:
+                metrics.append(fontMetrics[:4] + (width,))
+        return metrics
+
+    def get_height(self):
+
+        '''
+        Returns the height of the font.
+        '''
+
+        return self.font.get_height()
+
+    def get_linesize(self):
+
+        '''
+        Returns the recommended space between lines of text.
+        '''
+
+        return self.font.get_linesize()
+
+    #
+    # glyph atlas
+    #
+
+    def _getGlyphs(self, color, antialias):
+
+        '''
+        Returns the glyphs for a color, creating a new atlas if required.
+
+        :param pygame.Color color: The text color.
+        :param bool antialias: Antialias text.
+        '''
+
+        # look up glyphs using the color as given, to avoid
+        # converting the color each time text is drawn
+        if isinstance(color, (str, tuple)):
+            rawKey = (color, antialias)
+            key = self._glyphKeys.get(rawKey)
+            if key is not None:
+                self._glyphs.move_to_end(key)
+                return self._glyphs[key]
+        else:
+            rawKey = None
+
+        color = pygame.Color(color)
+        key = (tuple(color), antialias)
+        glyphs = self._glyphs.get(key)
+        if glyphs is not None:
+            self._glyphs.move_to_end(key)
+            if rawKey is not None:
+                self._glyphKeys[rawKey] = key
+            return glyphs
+
+        # render each character once, and store them side by side in an atlas
+        rendered = [self.font.render(c, antialias, color) for c in self.characters]
+        self._glyphHeight = max([r.get_height() for r in rendered] + [self.font.size('')[1]])
+        atlas = pygame.Surface((max(1, sum(r.get_width() for r in rendered)), self._glyphHeight), pygame.SRCALPHA)
+        x = 0
+        for r in rendered:
+            atlas.blit(r, (x, 0))
+            x += r.get_width()
+
+        # each glyph is an area of the atlas
+        glyphs = {}
+        x = 0
+        for c, r in zip(self.characters, rendered):
+            glyphs[c] = atlas.subsurface((x, 0, r.get_width(), self._glyphHeight))
+            if color.a < 255:
+                glyphs[c].set_alpha(color.a)
+            x += r.get_width()
+
+        self._glyphs[key] = glyphs
+        if rawKey is not None:
+            self._glyphKeys[rawKey] = key
+        # remove the least recently used atlas
+        if len(self._glyphs) > self.maxAtlases:
+            removedKey, _ = self._glyphs.popitem(last = False)
+            self._glyphKeys = {k: v for k, v in self._glyphKeys.items() if v != removedKey}
+        return glyphs
+
+    def _addGlyph(self, glyphs, character, color, antialias):
+
+        '''
+        Renders and stores a glyph for a character that isn't in the atlas.
+
+        :param dict glyphs: The glyphs to add to.
+        :param str character: The character to add.
+        :param pygame.Color color: The text color.
+        :param bool antialias: Antialias text.
+        '''
+
+        # remove the characters added outside of the atlas, if too many are stored
+        if len(glyphs) - len(self._atlasCharacters) >= self.maxExtraGlyphs:
+            for c in [c for c in glyphs if c not in self._atlasCharacters]:
+                del glyphs[c]
+
+        color = pygame.Color(color)
+        glyph = self.font.render(character, antialias, color)
+        if color.a < 255:
+            glyph.set_alpha(color.a)
+        glyphs[character] = glyph
+        return glyph
@@ -32,6 +32,7 @@ class Button:
     :param function(pygamepal.Button) updateMethod: Used to override the default update method of a button (default = None).
     :param function(pygamepal.Button, pygame.Surface) drawMethod: Used to override the default draw method of a button (default = None).
     :param pygame.Key keyCode: The keypress associated with selecting the button (default = None).
+    :param pygame.Font font: The font of the button text, which can also be a pygamepal.BitmapFont (default = None, which uses pygamepal.sysFont).
     '''
 
     def __init__(self,
@@ -53,7 +54,8 @@ class Button:
         drawMethod = None,
         # a keycode can also be associated with a button
         # (only works if pygamepal.input is specified)
-        keyCode = None
+        keyCode = None,
+        font = None
     ):
         
         self._scene = None
@@ -77,6 +79,7 @@ class Button:
         self.updateMethod = updateMethod
         self.drawMethod = drawMethod
         self.keyCode = keyCode
+        self.font = font
 
         self._isHighlighted = False
         self._isSelected = False
@@ -195,6 +198,7 @@ class Button:
 
         drawText(surface, text = self.text,
                  position = (self.position[0] + self.size[0] / 2, self.position[1] + self.size[1] / 2),
+                 font = self.font,
                  color = self.foregroundColor, centerX = True, centerY = True)
 
     def drawBorder(self, surface):
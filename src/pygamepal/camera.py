@@ -6,6 +6,7 @@
 #
 
 import pygame
+import math
 from math import sin
 from random import uniform
 
@@ -66,6 +67,8 @@ class Camera:
         # sets the camera target info
         self.target = target
         self._currentTarget = self.target
+        # the target before the last update, used to interpolate drawing
+        self._previousTarget = None
         self._lazyFollow = lazyFollow
 
         # sets the zoom info
@@ -74,6 +77,7 @@ class Camera:
         self.zoom = zoom
         self._currentZoom = zoom
         self._lazyZoom = lazyZoom
+        self._previousZoom = None
         
         # background
         self.backgroundColor = backgroundColor
@@ -133,8 +137,10 @@ class Camera:
         # update the current target using the target and 'lazy follow' values
         #
 
-        self._currentTarget = (self._currentTarget[0] * self._lazyFollow + self.target[0] * (1 - self._lazyFollow),
-                               self._currentTarget[1] * self._lazyFollow + self.target[1] * (1 - self._lazyFollow))
+        # (the lazy follow value applies per frame, so is scaled by the time elapsed)
+        lazyFollow = self._lazyFollow ** deltaTime
+        self._currentTarget = (self._currentTarget[0] * lazyFollow + self.target[0] * (1 - lazyFollow),
+                               self._currentTarget[1] * lazyFollow + self.target[1] * (1 - lazyFollow))
         
         #
         # update screen shake
@@ -152,15 +158,40 @@ class Camera:
         self._shakeCurrent = (shakeOffset[0] * self._shakeCurrentMagnitude * self.shakeDirection[0],
                               shakeOffset[1] * self._shakeCurrentMagnitude * self.shakeDirection[1])
         # reduce the shake magnitude by the dampening amount
-        self._shakeCurrentMagnitude = max(0, self._shakeCurrentMagnitude - self.shakeDampening)
+        self._shakeCurrentMagnitude = max(0, self._shakeCurrentMagnitude - self.shakeDampening * deltaTime)
         # reset the shake time once the shake is complete
         if self._shakeCurrentMagnitude == 0:
             self._shakeTime = 0
 
         # update the current zoom amount using the target and 'lazy zoom' values
-        self._currentZoom = self._currentZoom * self._lazyZoom + self.zoom * (1 - self._lazyZoom)
+        lazyZoom = self._lazyZoom ** deltaTime
+        self._currentZoom = self._currentZoom * lazyZoom + self.zoom * (1 - lazyZoom)
+
+    def _storePreviousState(self):
+
+        '''
+        Stores the camera target and zoom before an update,
+        so that drawing can be interpolated between updates.
+        '''
+
+        self._previousTarget = self._currentTarget
+        self._previousZoom = self._currentZoom
+
+    def _getDrawState(self, interpolation):
+
+        '''
+        Returns the (target, zoom) to draw with, between the previous and current states.
+
+        :param float interpolation: How far between the previous and current states (0-1).
+        '''
+
+        if interpolation >= 1 or self._previousTarget is None:
+            return self._currentTarget, self._currentZoom
+        return ((self._previousTarget[0] + (self._currentTarget[0] - self._previousTarget[0]) * interpolation,
+                 self._previousTarget[1] + (self._currentTarget[1] - self._previousTarget[1]) * interpolation),
+                self._previousZoom + (self._currentZoom - self._previousZoom) * interpolation)
                                   
-    def draw(self, surface, destSurface):
+    def draw(self, surface, destSurface, interpolation = 1):
 
         '''
         Draws the source surface to the destination surface, using the camera attributes.
@@ -169,8 +200,11 @@ class Camera:
 
         :param pygame.Surface surface: the surface to draw.
         :param pygame.Surface destSurface: the surface to draw to.
+        :param float interpolation: how far between the previous and current update states to draw (0-1, default = 1).
         '''
 
+        target, zoom = self._getDrawState(interpolation)
+
         # draw border
         pygame.draw.rect(destSurface, self.borderColor, 
                          (self.position[0] - self.borderThickness, self.position[1] - self.borderThickness, 
@@ -181,20 +215,38 @@ class Camera:
         destSurface.fill(self.backgroundColor)
 
         # blit the (zoomed) surface to the destination, and set the target as the center
-        x = 0 - (self.size[0] / 2 - self._currentTarget[0] * self._currentZoom)
-        y = 0 - (self.size[1] / 2 - self._currentTarget[1] * self._currentZoom)
+        x = 0 - (self.size[0] / 2 - target[0] * zoom)
+        y = 0 - (self.size[1] / 2 - target[1] * zoom)
         # add screen shake
         x += self._shakeCurrent[0]
         y += self._shakeCurrent[1]
 
         # draw the surface to the destination using the correct position, size, center and zoom
-        destSurface.blit(pygame.transform.scale(surface, (surface.get_width() * self._currentZoom, surface.get_height() * self._currentZoom)), 
+        destSurface.blit(pygame.transform.scale(surface, (surface.get_width() * zoom, surface.get_height() * zoom)), 
                          self.position, 
                          (x, y,
                           self.size[0], self.size[1]))
         # reset surface clipping
         destSurface.set_clip()
 
+    def getViewRect(self, interpolation = 1):
+
+        '''
+        Returns the (x, y, w, h) area of the source surface currently visible to the camera, as a pygame.Rect.
+
+        :param float interpolation: how far between the previous and current update states (0-1, default = 1).
+        '''
+
+        target, zoom = self._getDrawState(interpolation)
+        # the top-left of the visible area, as calculated in draw()
+        x = (target[0] * zoom - self.size[0] / 2 + self._shakeCurrent[0]) / zoom
+        y = (target[1] * zoom - self.size[1] / 2 + self._shakeCurrent[1]) / zoom
+        left = math.floor(x)
+        top = math.floor(y)
+        return pygame.Rect(left, top,
+                           math.ceil(x + self.size[0] / zoom) - left + 1,
+                           math.ceil(y + self.size[1] / zoom) - top + 1)
+
     def shake(self, direction = None):
 
         '''
@@ -218,6 +270,7 @@ class Camera:
         self.target = value
         if instant is True:
             self._currentTarget = value
+            self._previousTarget = None
 
     def setZoom(self, value, instant = False):
 
@@ -230,6 +283,7 @@ class Camera:
         self.zoom = value
         if instant is True:
             self._currentZoom = value
+            self._previousTarget = None
 
     #
     # properties
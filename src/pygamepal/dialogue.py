@@ -6,7 +6,7 @@
 #
 
 import pygame
-from .drawText import drawText, splitText, sysFont
+from .drawText import drawText, sysFont
 from .dialoguePage import DialoguePage
 
 class Dialogue:
@@ -29,6 +29,7 @@ class Dialogue:
     :param int borderWidth: The width of the border, in pixels (default = 0).
     :param int paddingWidth: The space in pixels between elements (default = 10).
     :param str textEffect: Either 'none' or 'tick' (default = 'none').
+    :param str textAlignment: Either 'left', 'center' or 'right' (default = 'left').
     :param int tickSpeed: The delay between showing each character (if textEffect == 'tick' only, default = 4).
     :param str advanceTextSymbol: The string to show at the end of pages 0 to n-1 of dialogue (default = '>').
     :param pygame.Sound tickSound: Sound to play when advancing the text (if textEffect == 'tick' only, default = None).
@@ -52,7 +53,8 @@ class Dialogue:
         tickSound = None,
         borderRadius = 0,
         visible = True,
-        custonDrawMethod = None
+        custonDrawMethod = None,
+        textAlignment = 'left'
     ):
 
         self.position = position
@@ -70,6 +72,7 @@ class Dialogue:
         self.borderWidth = borderWidth
         self.padding = padding        
         self.textEffect = textEffect
+        self.textAlignment = textAlignment
         self.tickSpeed = tickSpeed
         self.advanceTextSymbol = advanceTextSymbol
         self.tickSound = tickSound
@@ -78,6 +81,9 @@ class Dialogue:
         self.customDrawMethod = custonDrawMethod
 
         self.pages = []
+        # pages still to be loaded from a script
+        self._script = None
+        self.preloadPages = 2
         self._pageIndex = 0
         self._characterIndex = 0
         self._tickTimer = 0
@@ -86,8 +92,10 @@ class Dialogue:
         # create a main dialogue box surface
         self._surface = pygame.Surface(self.size, pygame.SRCALPHA)
 
-        # calculate the text position
-        
+        # the dialogue box surface stores the box, texture and any complete lines
+        # of text, and is only redrawn when the page or appearance changes
+        self._drawnState = None
+        self._drawnLineCount = 0
 
     def update(self, deltaTime = 1):
 
@@ -111,10 +119,16 @@ class Dialogue:
 
         if self.complete is False and self.textEffect == 'tick' and self._characterIndex < len(self.pages[self._pageIndex].text):
             self._tickTimer += deltaTime
-            # advance the tick effect
+            # advance the tick effect, by more than one character
+            # if more than one tick has elapsed
             if self._tickTimer >= self.tickSpeed:
-                self._tickTimer = 0
-                self._characterIndex += 1
+                if self.tickSpeed > 0:
+                    characters = int(self._tickTimer // self.tickSpeed)
+                    self._tickTimer -= characters * self.tickSpeed
+                else:
+                    characters = len(self._currentPage.text)
+                    self._tickTimer = 0
+                self._characterIndex = min(self._characterIndex + characters, len(self._currentPage.text))
                 # play a sound if one has been specified
                 if self.tickSound is not None:
                     pygame.mixer.Sound.play(self.tickSound)
@@ -140,6 +154,72 @@ class Dialogue:
             self.customDrawMethod(surface)
             return
 
+        lines = self._currentPage.splitText
+
+        # redraw the dialogue box if the page (or its text) or appearance has changed
+        # (e.g. addPage() adds the advance symbol to the text of the page being shown)
+        drawnState = (self._currentPage, self._currentPage.text, lines, tuple(self.size), self.backgroundColor,
+                      self.textColor, self.borderColor, self.borderWidth, self.borderRadius, self.padding,
+                      self.font, self.textEffect, self.textAlignment)
+        if drawnState != self._drawnState:
+            self._drawnState = drawnState
+            self._drawBox()
+            self._drawnLineCount = 0
+
+        #
+        # draw each split line of text
+        # (nothing is drawn for other text effects)
+        #
+
+        completeLineCount = 0
+        partialLine = None
+
+        if self.textEffect == 'none':
+            completeLineCount = len(lines)
+        
+        # if 'tick', only draw currently visible characters
+        if self.textEffect == 'tick':
+
+            # find the complete lines, and the visible part of the line being ticked
+            charsLeft = self._characterIndex
+            for line in lines:
+                if charsLeft < len(line):
+                    break
+                charsLeft -= len(line)
+                completeLineCount += 1
+            if completeLineCount < len(lines) and charsLeft > 0:
+                partialLine = lines[completeLineCount][0:charsLeft]
+
+        # add any newly completed lines to the dialogue box surface
+        for i in range(self._drawnLineCount, completeLineCount):
+            self._drawLine(self._surface, i, lines[i], (0, 0))
+        self._drawnLineCount = max(self._drawnLineCount, completeLineCount)
+
+        # draw the dialogue surface to the surface passed
+        surface.blit(self._surface, (self.position[0], self.position[1]))
+        if partialLine is None:
+            return
+
+        # the line being ticked changes each frame, so is drawn straight to the surface passed,
+        # clipped to the text area of the box, without storing each version of the line in the text cache
+        textRect = pygame.Rect(self.position[0] + self._textPosition[0], self.position[1] + self._textPosition[1],
+                               self._currentPage.textWidthAvailable,
+                               self.size[1] - self._textPosition[1] - self.borderWidth - self.padding)
+        previousClip = surface.get_clip()
+        surface.set_clip(textRect.clip(previousClip))
+        self._drawLine(surface, completeLineCount, partialLine, self.position, cache = False)
+        surface.set_clip(previousClip)
+
+    def _drawBox(self):
+
+        '''
+        Draws the dialogue box background, border and texture for the current page, without any text.
+        '''
+
+        # resize the main surface if required
+        if self._surface.get_size() != tuple(self.size):
+            self._surface = pygame.Surface(self.size, pygame.SRCALPHA)
+
         # clear the main surface
         self._surface.fill((0, 0, 0, 0), (0, 0, *self.size))
 
@@ -197,49 +277,27 @@ class Dialogue:
                                     border_radius=self.borderRadius
                     )
 
-        #
-        # draw each split line of text
-        #
-
-        if self.textEffect == 'none':
-
-            heightOffset = 0
-            for line in self._currentPage.splitText:
-
-                drawText(
-                    self._surface,
-                    line,
-                    (self._textPosition[0], self._textPosition[1] + heightOffset),
-                    self.font,
-                    color = self.textColor
-                )
+    def _drawLine(self, surface, lineIndex, text, offset, cache = True):
 
-                heightOffset += self.font.get_height() + self.padding // 2
-        
-        # if 'tick', only draw currently visible characters
-        if self.textEffect == 'tick':
-
-            charsLeft = self._characterIndex
-
-            heightOffset = 0
-            for line in self._currentPage.splitText:
-
-                if charsLeft > 0:
-
-                    drawText(
-                        self._surface,
-                        line[0:charsLeft],
-                        (self._textPosition[0], self._textPosition[1] + heightOffset),
-                        self.font,
-                        color = self.textColor
-                    )
-
-                    charsLeft -= len(line)
+        '''
+        Draws (all or part of) a line of text from the current page.
 
-                heightOffset += self.font.get_height() + self.padding // 2 
+        :param pygame.Surface surface: The surface to draw to.
+        :param int lineIndex: The index of the line on the page.
+        :param str text: The text to draw.
+        :param (int, int) offset: The (x, y) position of the dialogue box on the surface.
+        :param bool cache: Store the rendered text in pygamepal.textCache (default = True).
+        '''
 
-        # draw the dialogue surface to the surface passed
-        surface.blit(self._surface, (self.position[0], self.position[1]))     
+        drawText(
+            surface,
+            text,
+            (offset[0] + self._textPosition[0] + self._currentPage.lineOffsets[lineIndex],
+             offset[1] + self._textPosition[1] + lineIndex * (self.font.get_height() + self.padding // 2)),
+            self.font,
+            color = self.textColor,
+            cache = cache
+        )
     
     def addPage(
         self,
@@ -273,15 +331,52 @@ class Dialogue:
         # and remove from the final page
         if self.advanceTextSymbol is not None:
 
-            # add the symbol to all but the last page, if it hasn't been added already
-            for i in range(0, len(self.pages) - 1):
-                if self.pages[i].text[-len(self.advanceTextSymbol):] != self.advanceTextSymbol:
-                    self.pages[i].text = self.pages[i].text + ' ' + self.advanceTextSymbol
+            # add the symbol to the previous page, which is no longer the last page
+            # (earlier pages will already have had the symbol added)
+            if len(self.pages) > 1 and self.pages[-2].text[-len(self.advanceTextSymbol):] != self.advanceTextSymbol:
+                self.pages[-2].text = self.pages[-2].text + ' ' + self.advanceTextSymbol
 
             # remove the symbol from the final page, but only if it needs adding
             if self.pages[-1].text[-len(self.advanceTextSymbol):] == self.advanceTextSymbol:
                 self.pages[-1].text = self.pages[-1].text[:-len(self.advanceTextSymbol)-1]
         
+    def loadScript(self, script, preloadPages = 2):
+
+        '''
+        Adds pages of dialogue from a script, which are loaded as they are needed rather than all at once.
+        Only the current page and the next few pages are loaded and laid out ahead of time.
+
+        :param script: Either the filename of a text file (with pages separated by blank lines), or an iterable (such as a list or generator) of page text strings or dictionaries of addPage() arguments.
+        :param int preloadPages: The number of pages to load ahead of the current page (default = 2).
+        '''
+
+        if isinstance(script, str):
+            script = _readScriptFile(script)
+        self._script = iter(script)
+        self.preloadPages = preloadPages
+        self._loadPages()
+
+    def _loadPages(self):
+
+        '''
+        Loads pages from the script until the pages after the current page are loaded,
+        and lays them out so that they are ready to draw.
+        '''
+
+        if self._script is not None:
+            while len(self.pages) <= self._pageIndex + self.preloadPages:
+                page = next(self._script, None)
+                if page is None:
+                    self._script = None
+                    break
+                if isinstance(page, dict):
+                    self.addPage(**page)
+                else:
+                    self.addPage(page)
+
+        for page in self.pages[self._pageIndex:self._pageIndex + self.preloadPages + 1]:
+            page.splitText
+
     def advance(self):
     
         '''
@@ -302,6 +397,7 @@ class Dialogue:
         else:
             self._pageIndex += 1
             self._characterIndex = 0
+            self._loadPages()
             
             # if at the last page then hide the box and mark as completed
             if self._pageIndex > len(self.pages) - 1:
@@ -341,5 +437,30 @@ class Dialogue:
             if self.textEffect == 'tick':
                 return self._currentPage.text[:self._characterIndex]
             else:
-                return self._currentPage.text            
+                return self._currentPage.text
+
+def _readScriptFile(filename):
+
+    '''
+    Reads a dialogue script file, returning a list of the text of each page.
+    Pages are separated by blank lines, and lines within a page are joined with spaces.
+    (The file is closed once read, and pages are still only added to the dialogue as they are needed.)
+
+    :param str filename: The script filename.
+    '''
 
+    with open(filename, encoding = 'utf-8') as file:
+        fileLines = file.readlines()
+
+    pages = []
+    lines = []
+    for line in fileLines:
+        line = line.strip()
+        if line:
+            lines.append(line)
+        elif lines:
+            pages.append(' '.join(lines))
+            lines = []
+    if lines:
+        pages.append(' '.join(lines))
+    return pages
@@ -5,7 +5,13 @@
 #  -- run 'pip install pygamepal' to use
 #
 
-from .drawText import splitText
+from collections import OrderedDict
+from .drawText import layoutText, _getFontKey
+
+# wrapped text layouts, stored against (text, font, width, alignment), so that
+# pages with the same text and appearance (in any Dialogue) are only wrapped once
+_layouts = OrderedDict()
+maxStoredLayouts = 1000
 
 class DialoguePage:
 
@@ -105,6 +111,48 @@ class DialoguePage:
     
     @text.setter
     def text(self, value):
+        # the text is wrapped when first needed
+        if hasattr(self, '_text') and value == self._text:
+            return
         self._text = value
+        self._splitText = None
+        self._lineOffsets = None
+
+    @property
+    def splitText(self):
+        '''
+        Get the page text, wrapped into a list of lines.
+        '''
+        if self._splitText is None:
+            self.layout()
+        return self._splitText
+
+    @property
+    def lineOffsets(self):
+        '''
+        Get the x offset of each line of text, for the text alignment.
+        '''
+        if self._lineOffsets is None:
+            self.layout()
+        return self._lineOffsets
+
+    def layout(self):
+
+        '''
+        Wraps the page text to the available width, reusing a stored layout if one exists.
+        (This is called automatically when the wrapped text is first needed.)
+        '''
+
         self.calculateTextWidth()
-        self.splitText = splitText(self.text, font = self.parent.font, width = self.textWidthAvailable)
\ No newline at end of file
+        key = (self.text, _getFontKey(self.parent.font), self.textWidthAvailable, self.parent.textAlignment)
+        layout = _layouts.get(key)
+        if layout is not None:
+            _layouts.move_to_end(key)
+        else:
+            lines = layoutText(self.text, self.textWidthAvailable, self.parent.font, self.parent.textAlignment)
+            layout = (tuple(line for line, _ in lines), tuple(offset for _, offset in lines))
+            _layouts[key] = layout
+            if len(_layouts) > maxStoredLayouts:
+                _layouts.popitem(last = False)
+        # (each page has its own copy of the stored lists, so changing one page doesn't change others)
+        self._splitText, self._lineOffsets = list(layout[0]), list(layout[1])
\ No newline at end of file
@@ -6,20 +6,121 @@
 #
 
 import pygame
+from collections import OrderedDict
+from .fonts import sysFont, smallFont, regularFont, largeFont
+from .bitmapFont import BitmapFont
 
-# create a default 'system' font
-pygame.font.init()
-sysFont = pygame.font.SysFont(None, 24)
-smallFont = pygame.font.SysFont(None, 14)
-regularFont = pygame.font.SysFont(None, 24)
-largeFont = pygame.font.SysFont(None, 34)
+def _getFontKey(font):
+
+    '''
+    Returns a key for a font and its current style, for storing text rendered or measured in the font.
+    (pygame fonts can be changed, e.g. font.bold = True, after text has been stored.)
+
+    :param pygame.Font font: The font.
+    '''
+
+    return (font, getattr(font, 'bold', None), getattr(font, 'italic', None),
+            getattr(font, 'underline', None), getattr(font, 'strikethrough', None),
+            getattr(font, 'point_size', None))
+
+class TextCache:
+
+    '''
+    Stores rendered text surfaces, so that the same text doesn't need to be rendered again.
+    The least recently used text is removed once the cache is larger than its size limit.
+    (A TextCache is used automatically by pygamepal.drawText, as pygamepal.textCache).
+
+    :param int maxBytes: The approximate maximum size of the stored text surfaces, in bytes (default = 8MB).
+    '''
+
+    def __init__(self, maxBytes = 8 * 1024 * 1024):
+        self.maxBytes = maxBytes
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+        self._bytes = 0
+
+    def render(self, text, font, antialias, color, backgroundColor = None):
+
+        '''
+        Returns a text surface, rendering and storing it if not already stored.
+
+        :param str text: The text to render.
+        :param pygame.Font font: The font to render the text in.
+        :param bool antialias: Antialias text.
+        :param pygame.Color color: Text color.
+        :param pygame.Color backgroundColor: Background text color (default = None).
+        '''
+
+        color = pygame.Color(color)
+        if backgroundColor is not None:
+            backgroundColor = tuple(pygame.Color(backgroundColor))
+        key = (text, _getFontKey(font), tuple(color), backgroundColor, antialias)
+
+        textSurface = self._surfaces.get(key)
+        if textSurface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return textSurface
+
+        self.misses += 1
+        textSurface = font.render(text, antialias, color, backgroundColor)
+        if len(color) > 3:
+            textSurface.set_alpha(color[3])
+
+        # store the surface, and remove the least recently used if too large
+        self._surfaces[key] = textSurface
+        self._bytes += self._getSize(textSurface)
+        while self._bytes > self.maxBytes and len(self._surfaces) > 1:
+            _, removed = self._surfaces.popitem(last = False)
+            self._bytes -= self._getSize(removed)
+
+        return textSurface
+
+    def clear(self):
+
+        '''
+        Removes all stored text, and resets the hit and miss counts.
+        '''
+
+        self._surfaces.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _getSize(self, textSurface):
+
+        '''
+        Returns the approximate size of a text surface, in bytes.
+
+        :param pygame.Surface textSurface: The text surface.
+        '''
+
+        return textSurface.get_width() * textSurface.get_height() * textSurface.get_bytesize()
+
+    #
+    # properties
+    #
+
+    @property
+    def size(self):
+        '''
+        Get the approximate size of the stored text surfaces, in bytes.
+        '''
+        return self._bytes
+
+    def __len__(self):
+        return len(self._surfaces)
+
+textCache = TextCache()
 
 def drawText(surface, text,
              position = [0, 0],
              font = None,
              antialias = True,
              color = 'white', backgroundColor = None,
-             centerX = False, centerY = False):
+             centerX = False, centerY = False,
+             cache = True):
     
     '''
     Draw text.
@@ -27,26 +128,40 @@ def drawText(surface, text,
     :param pygame.Surface surface: The surface to draw to.
     :param str text: The text to draw.
     :param (int, int) position: The (x, y) position to draw on the specified surface (default = (0, 0)).
-    :param pygame.Font font: The font to draw the text in (default = pygamepal.sysFont).
+    :param pygame.Font font: The font to draw the text in, which can also be a pygamepal.BitmapFont (default = pygamepal.sysFont).
     :param bool antialias: Antialias text (default = True).
     :param pygame.Color color: Text color (default = 'white').
     :param pygame.Color backgroundColor: Background text color (default = None).
     :param bool centerX: Center horizontally (default = False).
     :param bool centerY: Center vertically (default = False).
+    :param bool cache: Reuse previously rendered text, stored in pygamepal.textCache (default = True).
     '''
 
     # use the default 'system' font if none specified
     if font is None:
         font = sysFont
 
-    # ensure the color is a pygame color
-    color = pygame.Color(color)
+    # bitmap fonts draw directly to the surface
+    if isinstance(font, BitmapFont):
+        size = font.size(text)
+        if centerX == True:
+            position = (position[0] - size[0] // 2, position[1])
+        if centerY == True:
+            position = (position[0], position[1] - size[1] // 2)
+        if backgroundColor is not None:
+            surface.fill(backgroundColor, (position[0], position[1], size[0], size[1]))
+        font.draw(surface, text, position, color, antialias)
+        return
 
     # create text surface
-    textSurface = font.render(text, antialias, color, backgroundColor)
-    #print(color)
-    if len(color) > 3:
-        textSurface.set_alpha(color[3])
+    if cache:
+        textSurface = textCache.render(text, font, antialias, color, backgroundColor)
+    else:
+        # ensure the color is a pygame color
+        color = pygame.Color(color)
+        textSurface = font.render(text, antialias, color, backgroundColor)
+        if len(color) > 3:
+            textSurface.set_alpha(color[3])
 
     # center
     if centerX == True:
@@ -57,43 +172,147 @@ def drawText(surface, text,
     # draw text to surface
     surface.blit(textSurface, position)
 
-def splitText(text = None, width = None, font = None):
+# the width of each word, stored against (font key, word), so
+# that each word only needs to be measured once per font
+_wordWidths = {}
+maxStoredWordWidths = 100000
+
+def _getWordWidth(font, fontKey, word):
+
+    '''
+    Returns the width of a word in the font given, measuring and storing it if required.
+
+    :param pygame.Font font: The font to measure the word in.
+    :param tuple fontKey: The font's key, from _getFontKey().
+    :param str word: The word to measure.
+    '''
+
+    key = (fontKey, word)
+    width = _wordWidths.get(key)
+    if width is None:
+        if len(_wordWidths) >= maxStoredWordWidths:
+            _wordWidths.clear()
+        width = font.size(word)[0]
+        _wordWidths[key] = width
+    return width
+
+def _splitWord(word, width, font):
+
+    '''
+    Splits a word that is too wide into pieces that fit within the width given.
+
+    :param str word: The word to split.
+    :param int width: The available width.
+    :param pygame.Font font: The font to measure the word in.
+    '''
+
+    pieces = []
+    start = 0
+    pieceWidth = 0
+    for i, metrics in enumerate(font.metrics(word)):
+        # use the character advance, or measure it if not available
+        charWidth = metrics[4] if metrics is not None else font.size(word[i])[0]
+        if pieceWidth + charWidth > width and i > start:
+            pieces.append(word[start:i])
+            start = i
+            pieceWidth = 0
+        pieceWidth += charWidth
+    pieces.append(word[start:])
+    return pieces
+
+def wrapText(text, width, font = None):
+
+    '''
+    Wraps text into lines that fit within the width given, returning a list of (line, lineWidth) tuples.
+    Words are measured once, and are wrapped in a single pass.
+    Newlines always start a new line, and words wider than the width are split between lines.
+    (Each line except the last keeps the space or newline that follows it (as a space), so that
+    the lines add up to the same number of characters as the text.)
+
+    :param str text: The text to wrap.
+    :param int width: The available width, in pixels.
+    :param pygame.Font font: The font of the text (default = pygamepal.sysFont).
+    '''
 
     if font is None:
         font = sysFont
-    
-    #print('>>>font')
-    #print(font)
 
-    returnList = []
-    h = font.get_height()
-    
-    words = text.split(' ')
-    #print(words)
-
-    position = 0
-    currentLine = ''
-
-    fin = False
-    while not fin:
-        currentLine += words[position] + ' '
-        position += 1
-        #print(currentLine)
-        if font.size(currentLine)[0] >= width:
-            #print('ggg')
-            #print(currentLine.split(' ')[:-2])
-            currentLine = ' '.join(currentLine.split(' ')[:-2]) + ' '
-            position -= 1
-            returnList.append(currentLine)
-            currentLine = ''
-        if position >= len(words):
-            fin = True
-    if len(currentLine) > 0:
-        returnList.append(currentLine)
-    # remove trailing space
-    returnList[-1] = returnList[-1][:-1]
-    #print(returnList[-1][-1])
-    #print('***')
-    #print(returnList[-1])
-    #print(returnList)
-    return returnList
+    fontKey = _getFontKey(font)
+    spaceWidth = _getWordWidth(font, fontKey, ' ')
+    lines = []
+
+    paragraphs = text.split('\n')
+    for p, paragraph in enumerate(paragraphs):
+
+        lineWords = []
+        lineWidth = 0
+
+        for word in paragraph.split(' '):
+
+            wordWidth = _getWordWidth(font, fontKey, word)
+
+            # split words that are too wide for a line
+            if wordWidth > width and len(word) > 1:
+                pieces = _splitWord(word, width, font)
+                for piece in pieces[:-1]:
+                    if lineWords:
+                        lines.append((' '.join(lineWords) + ' ', lineWidth))
+                    lines.append((piece, _getWordWidth(font, fontKey, piece)))
+                    lineWords = []
+                    lineWidth = 0
+                word = pieces[-1]
+                wordWidth = _getWordWidth(font, fontKey, word)
+
+            # start a new line if the word doesn't fit
+            if lineWords and lineWidth + spaceWidth + wordWidth >= width:
+                lines.append((' '.join(lineWords) + ' ', lineWidth))
+                lineWords = []
+                lineWidth = 0
+
+            if lineWords:
+                lineWidth += spaceWidth
+            lineWords.append(word)
+            lineWidth += wordWidth
+
+        # the newline between paragraphs is kept as a space
+        line = ' '.join(lineWords)
+        if p < len(paragraphs) - 1:
+            line += ' '
+        lines.append((line, lineWidth))
+
+    return lines
+
+def splitText(text = None, width = None, font = None):
+
+    '''
+    Splits text into a list of lines that fit within the width given (see pygamepal.wrapText).
+
+    :param str text: The text to split.
+    :param int width: The available width, in pixels.
+    :param pygame.Font font: The font of the text (default = pygamepal.sysFont).
+    '''
+
+    if not text:
+        return ['']
+    return [line for line, _ in wrapText(text, width, font)]
+
+def layoutText(text, width, font = None, alignment = 'left'):
+
+    '''
+    Splits text into lines that fit within the width given (see pygamepal.wrapText),
+    returning a list of (line, xOffset) tuples for the alignment specified.
+
+    :param str text: The text to split.
+    :param int width: The available width, in pixels.
+    :param pygame.Font font: The font of the text (default = pygamepal.sysFont).
+    :param str alignment: Either 'left', 'center' or 'right' (default = 'left').
+    '''
+
+    if not text:
+        return [('', 0)]
+    lines = wrapText(text, width, font)
+    if alignment == 'center':
+        return [(line, (width - lineWidth) // 2) for line, lineWidth in lines]
+    if alignment == 'right':
+        return [(line, width - lineWidth) for line, lineWidth in lines]
+    return [(line, 0) for line, _ in lines]
@@ -0,0 +1,15 @@
+#
+# pygamepal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+
+import pygame
+
+# create a default 'system' font
+pygame.font.init()
+sysFont = pygame.font.SysFont(None, 24)
+smallFont = pygame.font.SysFont(None, 14)
+regularFont = pygame.font.SysFont(None, 24)
+largeFont = pygame.font.SysFont(None, 34)
@@ -5,8 +5,43 @@
 #  -- run 'pip install pygamepal' to use
 #
 
+import os
 import pygame
 import pygamepal
+import random
+from .recording import _openRecording, _openReplay, _writeFrame, _readFrame
+from .globals import _callUpdate
+
+# the fraction of a time step that an update can run early
+_timeStepTolerance = 0.1
+
+def _initHeadlessDisplay():
+
+    '''
+    Sets a display for headless games using SDL's dummy video driver, so that surfaces
+    can still be converted (e.g. using convert_alpha()) without opening a window.
+    '''
+
+    if pygame.display.get_surface() is not None:
+        return
+    # pygame.init() has already chosen a video driver, so the display
+    # is restarted (the driver is only read when the display is initialised)
+    if pygame.display.get_init():
+        if pygame.display.get_driver() == 'dummy':
+            pygame.display.set_mode((1, 1))
+            return
+        pygame.display.quit()
+    previousDriver = os.environ.get('SDL_VIDEODRIVER')
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    try:
+        pygame.display.init()
+    finally:
+        # (so that other games in the same program can still open a window)
+        if previousDriver is None:
+            del os.environ['SDL_VIDEODRIVER']
+        else:
+            os.environ['SDL_VIDEODRIVER'] = previousDriver
+    pygame.display.set_mode((1, 1))
 
 class Game:
 
@@ -22,25 +57,60 @@ class Game:
     :param str caption: The game window caption (default = '').
     :param int fps: The frames-per-second of the game (default = 60).
     :param bool fullscreen: Fullscreen flag.
+    :param int tickRate: The number of game updates per second, which stays the same however fast the game is drawn (default = None, which uses the fps).
+    :param int maxUpdatesPerFrame: The maximum number of updates to catch up on before drawing, if the game is running slowly (default = 5).
+    :param bool interpolate: Draw sprites and the camera between their previous and current states, for smoother movement when the tick rate and drawing rate differ (default = False).
+    :param bool headless: Run without a window, as fast as possible, using a virtual clock that advances one time step per frame (e.g. for simulations and tests on servers without a display) (default = False).
+    :param bool render: Draw the game each frame. Headless games can still be drawn, to the game screen surface (default = None, which draws unless headless).
     '''
 
-    def __init__(self, size = (640, 480), caption = '', fps = 60, fullscreen = False):
+    def __init__(self, size = (640, 480), caption = '', fps = 60, fullscreen = False,
+                 tickRate = None, maxUpdatesPerFrame = 5, interpolate = False,
+                 headless = False, render = None):
        
         pygame.init()
 
+        self.headless = headless
+        self.render = not headless if render is None else render
+        if self.headless:
+            _initHeadlessDisplay()
+
         self.size = size
         self.caption = caption
         self.fps = fps
         self.fullscreen = fullscreen
 
+        # the game is updated in fixed time steps
+        self.tickRate = fps if tickRate is None else tickRate
+        self.maxUpdatesPerFrame = maxUpdatesPerFrame
+        self.interpolate = interpolate
+        # time elapsed during the current update, measured in frames at the game fps
+        # (i.e. 1 when the tick rate is the same as the fps)
+        self.deltaTime = 1
+        # how far between the previous and current update states to draw (0-1)
+        self.interpolation = 1
+        # the number of updates run
+        self.updateCount = 0
+        # time (in seconds) not yet simulated
+        self._accumulator = 0
+        # events not yet passed to an update
+        self._pendingEvents = []
+
+        # set to a pygamepal.Profiler (or pygamepal.Tracer) to time each frame
+        self.profiler = None
+
         self.input = pygamepal.Input()
+        self.actions = pygamepal.ActionMap(self.input)
         self.currentScene = None
         self.previousScene = None
         
         self.currentScene = pygamepal.Scene(self)
 
         # start window in windowed or fullscreen mode
-        if self.fullscreen:
+        # (headless games draw to a surface instead)
+        if self.headless:
+            self.screen = pygame.Surface(self.size)
+        elif self.fullscreen:
             self.screen = pygame.display.set_mode(self.size, pygame.FULLSCREEN)
         else:
             self.screen = pygame.display.set_mode(self.size)
@@ -50,12 +120,16 @@ class Game:
 
         # total elapsed game time
         self.startTime = pygame.time.get_ticks()
-        self.gameTime = self.startTime
+        self.gameTime = 0
         self._running = False
         
         # store events so that they aren't 'consumed' by the class
         self.events = []
 
+        # open input recording and replay files
+        self._recording = None
+        self._replay = None
+
         self.init()
 
     #
@@ -66,41 +140,133 @@ class Game:
 
         '''
         The root update method called automatically once per frame.
-        This handles all scenes, etc. and doesn't need to be called by the user.
+        This runs the number of fixed time step updates needed to catch up with the
+        time elapsed, and doesn't need to be called by the user.
+        '''
+
+        if self._replay is None and not self.headless:
+            # update clock and calculate delta time
+            frameTime = self.clock.tick(self.fps) / 1000
+            # calculate total elapsed time
+            self.gameTime = pygame.time.get_ticks() - self.startTime
+
+        # (time spent waiting for the clock isn't profiled)
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.startFrame()
+            profiler.start('events')
+
+        if self._replay is not None:
+            # read recorded input, without waiting for the clock
+            frame = _readFrame(self._replay)
+            if frame is None:
+                self._running = False
+                if profiler is not None:
+                    profiler.stop('events')
+                return
+            frameTime, events, mouseButtons, mousePosition = frame
+            self._replayedFrames += 1
+            pygame.event.pump()
+            self.gameTime += frameTime * 1000
+        else:
+            if self.headless:
+                # advance a virtual clock by one time step, without waiting
+                frameTime = 1 / self.tickRate
+                self.gameTime += frameTime * 1000
+
+            events = []
+            # respond to quit event
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self._running = False
+                else:
+                    events.append(event)
+            mouseButtons = pygame.mouse.get_pressed()
+            mousePosition = pygame.mouse.get_pos()
+
+            if self._recording is not None:
+                _writeFrame(self._recording, frameTime, events, mouseButtons, mousePosition)
+
+        # events are kept until the next update
+        # (there may be no updates this frame)
+        self._pendingEvents.extend(events)
+
+        if profiler is not None:
+            profiler.stop('events')
+
+        # run an update for each time step elapsed, allowing updates to run slightly early
+        # so that small differences in frame times don't cause frames with no updates
+        timeStep = 1 / self.tickRate
+        self._accumulator += frameTime
+        updates = 0
+        while self._accumulator > timeStep * (1 - _timeStepTolerance):
+            if updates == self.maxUpdatesPerFrame:
+                # too far behind to catch up, so slow down instead
+                self._accumulator = 0
+                break
+            self._accumulator -= timeStep
+            self._tick(self.fps * timeStep, mouseButtons, mousePosition)
+            updates += 1
+
+        # draw between the last two updates, using the time not yet simulated
+        self.interpolation = max(0, min(1, self._accumulator / timeStep)) if self.interpolate else 1
+
+    def _tick(self, deltaTime, mouseButtons, mousePosition):
+
+        '''
+        A single fixed time step update of the game.
+
+        :param float deltaTime: The time step, measured in frames at the game fps.
+        :param tuple mouseButtons: The mouse button states.
+        :param (int, int) mousePosition: The mouse position.
         '''
 
         self.previousScene = self.currentScene
+        self.deltaTime = deltaTime
+        self.updateCount += 1
 
-        # update clock and calculate delta time
-        deltaTime = self.clock.tick(self.fps) / 1000
-        # calculate total elapsed time
-        self.gameTime = pygame.time.get_ticks() - self.startTime
+        # pass events to this update
+        self.events = self._pendingEvents
+        self._pendingEvents = []
 
-        # reset events
-        self.events = []
-        # respond to quit event
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self._running = False
-            else:
-                self.events.append(event)
+        # store the previous states to draw between
+        if self.interpolate and self.currentScene is not None:
+            self.currentScene._storePreviousState()
+
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.startSpan('tick')
 
         # call user-defined update method
-        self.update() 
+        if profiler is not None:
+            profiler.start('update')
+        _callUpdate(self.update, deltaTime)
+        if profiler is not None:
+            profiler.stop('update')
 
         # update input
         if self.input is not None:
-            self.input.update()
+            if profiler is not None:
+                profiler.start('input')
+            self.input.update(deltaTime, self.events, mouseButtons, mousePosition)
+            # update actions
+            if self.actions is not None:
+                self.actions.update()
+            if profiler is not None:
+                profiler.stop('input')
 
         # update the current scene
         if self.currentScene is not None:
-            self.currentScene._update()
+            self.currentScene._update(deltaTime)
         
         # call user-defined active methods
         if self.currentScene is not self.previousScene:
             self.previousScene.onInactive()
             self.currentScene.onActive()
 
+        if profiler is not None:
+            profiler.stopSpan()
+
     def _draw(self):
 
         '''
@@ -108,11 +274,39 @@ class Game:
         Does not need to be called by the user.
         '''
 
+        profiler = self.profiler
+
         if self.currentScene is not None:
-            self.currentScene._draw()
+            self.currentScene._draw(self.interpolation)
         # call user-defined draw() method
+        if profiler is not None:
+            profiler.start('draw')
         self.draw()
-        pygame.display.flip()
+        if profiler is not None:
+            profiler.stop('draw')
+            if profiler.showOverlay:
+                profiler.draw(self.screen)
+
+        if not self.headless:
+            if profiler is not None:
+                profiler.start('flip')
+            pygame.display.flip()
+            if profiler is not None:
+                profiler.stop('flip')
+
+    def _runFrame(self, draw = True):
+
+        '''
+        Runs a single frame of the game (updating, and optionally drawing).
+
+        :param bool draw: Draw the frame (default = True).
+        '''
+
+        self._update()
+        if draw:
+            self._draw()
+        if self.profiler is not None:
+            self.profiler.endFrame()
 
     def run(self):
 
@@ -122,10 +316,64 @@ class Game:
 
         self._running = True
         while self._running:
-            self._update()
-            self._draw()
+            self._runFrame(self.render)
+        self.stopRecording()
         pygame.quit()
 
+    def startRecording(self, filename, seed = None):
+
+        '''
+        Starts recording the game's input (events, mouse state and frame time) each frame
+        to a file, which can be replayed using replay().
+        For the replay to match, recording should start in the same game state as the replay
+        (e.g. before calling run()).
+
+        :param str filename: The file to record to.
+        :param int seed: The random seed to use, which is stored in the recording (default = None, which chooses a seed).
+        '''
+
+        self.stopRecording()
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+        random.seed(seed)
+        self._recording = _openRecording(filename, seed, self.fps, self.tickRate)
+
+    def stopRecording(self):
+
+        '''
+        Stops recording the game's input.
+        '''
+
+        if self._recording is not None:
+            self._recording.close()
+            self._recording = None
+
+    def replay(self, filename, draw = False):
+
+        '''
+        Runs the game using input recorded with startRecording(), until the recording ends or the game quits.
+        The replay runs as fast as possible rather than at the game's fps, using the recorded frame times,
+        fps and tick rate.
+        Returns the number of frames replayed.
+
+        :param str filename: The recording to replay.
+        :param bool draw: Draw each frame (default = False).
+        '''
+
+        self._replay, seed, self.fps, self.tickRate = _openReplay(filename)
+        self._replayedFrames = 0
+        self._accumulator = 0
+        self._pendingEvents = []
+        random.seed(seed)
+        try:
+            self._running = True
+            while self._running:
+                self._runFrame(draw)
+        finally:
+            self._replay.close()
+            self._replay = None
+        return self._replayedFrames
+
     # call quit() to end the game
     def quit(self):
 
@@ -152,9 +400,11 @@ class Game:
 
         '''
         Optional, user-defined method.
-        Called once per frame of the game.
+        Called once per game update (tickRate times per second).
+        The time elapsed since the last update is also available as self.deltaTime.
+        (update(self) without a deltaTime argument can also be used.)
 
-        :param float deltaTime: Time elapsed since last update call.
+        :param float deltaTime: Time elapsed since last update call (default = 1).
         '''
         
         pass
@@ -168,6 +418,16 @@ class Game:
 
         pass
 
+    def summary(self):
+
+        '''
+        Optional, user-defined method.
+        Returns a (picklable) summary of the game state, e.g. the winner of a match.
+        Used to collect results from pygamepal.runSimulations().
+        '''
+
+        return {}
+
     #
     # alternative methods to add / remove
     # sprites, triggers, colliders and buttons
@@ -186,6 +446,17 @@ class Game:
         
         if self.currentScene is not None:
             self.currentScene.addSprite(sprite)
+
+    def addSprites(self, sprites):
+
+        '''
+        Adds a list of pygamepal.Sprite objects to the game.
+
+        :param list(pygamepal.Sprite) sprites: The sprites to add to the game.
+        '''
+
+        if self.currentScene is not None:
+            self.currentScene.addSprites(sprites)
     
     def removeSprite(self, sprite):
 
@@ -197,6 +468,17 @@ class Game:
 
         if self.currentScene is not None:
             self.currentScene.removeSprite(sprite)
+
+    def removeSprites(self, sprites):
+
+        '''
+        Removes a list of pygamepal.Sprite objects from the game.
+
+        :param list(pygamepal.Sprite) sprites: The sprites to remove from the game.
+        '''
+
+        if self.currentScene is not None:
+            self.currentScene.removeSprites(sprites)
     
     # trigger
 
@@ -6,6 +6,35 @@
 #
 
 import os
+import inspect
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# whether each user-defined update() function takes a deltaTime argument,
+# stored against the function so that each is only checked once
+_deltaTimeFunctions = {}
+
+def _callUpdate(update, deltaTime):
+
+    '''
+    Calls a user-defined update() method, passing deltaTime if it takes an argument
+    (so that methods written as update(self) still work).
+
+    :param method update: The update method.
+    :param float deltaTime: The time elapsed since the last update.
+    '''
+
+    function = getattr(update, '__func__', update)
+    takesDeltaTime = _deltaTimeFunctions.get(function)
+    if takesDeltaTime is None:
+        try:
+            parameters = inspect.signature(update).parameters.values()
+        except (TypeError, ValueError):
+            parameters = []
+        takesDeltaTime = any(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD, p.VAR_POSITIONAL) for p in parameters)
+        _deltaTimeFunctions[function] = takesDeltaTime
+    if takesDeltaTime:
+        update(deltaTime)
+    else:
+        update()
+
 DEBUG = False
\ No newline at end of file
@@ -7,10 +7,37 @@
 
 import pygame
 
+# button press states
+_NONE = 0
+_SINGLE = 1
+_DOUBLE = 2
+
+# maps get_pressed() scancode indexes to key codes,
+# shared between Input instances
+_scancodeKeyCodes = None
+
+class _KeyStates:
+
+    '''
+    A read-only view of a set of keys that are down, indexed by key code
+    in the same way as pygame.key.get_pressed().
+
+    :param frozenset keysDown: The key codes that are down.
+    '''
+
+    def __init__(self, keysDown):
+        self._keysDown = keysDown
+
+    def __getitem__(self, keyCode):
+        return keyCode in self._keysDown
+
+    def __len__(self):
+        return len(pygame.key.get_pressed())
+
 class Input():
 
     '''
-    Handle Pygame input more easily, including key/mouse press, release, long-press and double-press.
+    Handle Pygame input more easily, including key/mouse press, release, long-press and double-press, and joystick buttons, axes and hats.
 
     `Example Key Input code`_.
 
@@ -29,9 +56,16 @@ class Input():
         self.longPressDuration = longPressDuration
         self.doublePressTimeout = doublePressTimeout
 
+        # keys are stored by key code, and state is only
+        # kept for keys that are down or recently pressed
+        self._keysDown = set()
+        self._keysPressed = set()
+        self._keysReleased = set()
+
+        # used to find key changes when updating without events
+        self._polledKeyStates = pygame.key.get_pressed()
+
         # set current and previous states
-        self.currentKeyStates = pygame.key.get_pressed()
-        self.previousKeyStates = pygame.key.get_pressed()
         self.currentMouseButtonStates = pygame.mouse.get_pressed()
         self.previousMouseButtonStates = pygame.mouse.get_pressed()
 
@@ -40,25 +74,41 @@ class Input():
         self.previousMousePosition = pygame.mouse.get_pos()
 
         # set long press durations
-        self._keyPressDurations = [0 for _ in range(len(self.currentKeyStates))]
+        # (keys that are down)
+        self._keyPressDurations = {}
         self._mouseButtonDurations = [0 for _ in range(len(self.currentMouseButtonStates))]
 
         # store info to determine button double-press
-        self._keyTimeSinceLastPressed = [0 for _ in range(len(self.currentKeyStates))]
+        # (keys in the 'single' press state)
+        self._keyTimeSinceLastPressed = {}
         self._mouseTimeSinceLastPressed = [0 for _ in range(len(self.currentMouseButtonStates))]
         
         # stores the press state of each button
-        # 'none' -> 'single' -> 'double'
-        self._keyPressStates = ["none" for _ in range(len(self.currentKeyStates))]
-        self._mousePressStates = ["none" for _ in range(len(self.currentMouseButtonStates))]
+        # none -> single -> double
+        # (keys in the none state aren't stored)
+        self._keyPressStates = {}
+        self._mousePressStates = [_NONE for _ in range(len(self.currentMouseButtonStates))]
+
+        # connected joysticks, in the order they were connected
+        self._joysticks = []
+        # joystick buttons are stored as (joystick instance id, button)
+        self._joystickButtonsDown = set()
+        self._joystickButtonsPressed = set()
+        self._joystickButtonsReleased = set()
+        # joystick axes and hats are stored by (joystick instance id, axis / hat)
+        self._joystickAxes = {}
+        self._joystickHats = {}
 
-    def update(self, deltaTime = 1):
+    def update(self, deltaTime = 1, events = None, mouseButtons = None, mousePosition = None):
 
         '''
         Call once per frame to update.
         (Note: only needs to be called if using independently (i.e. not as part of a game).)
 
         :param float deltaTime: Time elapsed since last frame (default = 1).
+        :param list events: This frame's pygame events, used to update key and joystick states. If None, states are polled instead (default = None).
+        :param tuple mouseButtons: The mouse button states to use, e.g. when replaying recorded input (default = None, which uses pygame.mouse.get_pressed()).
+        :param (int, int) mousePosition: The mouse position to use, e.g. when replaying recorded input (default = None, which uses pygame.mouse.get_pos()).
         '''
 
         #
@@ -66,38 +116,57 @@ class Input():
         #
 
         # update key presses
-        self.previousKeyStates = self.currentKeyStates
-        self.currentKeyStates = pygame.key.get_pressed()
+        self._keysPressed.clear()
+        self._keysReleased.clear()
+        self._joystickButtonsPressed.clear()
+        self._joystickButtonsReleased.clear()
+        if events is None:
+            self._pollKeys()
+            self._pollJoysticks()
+        else:
+            for event in events:
+                if event.type == pygame.KEYDOWN:
+                    self._keyDown(event.key)
+                elif event.type == pygame.KEYUP:
+                    self._keyUp(event.key)
+                elif event.type == pygame.JOYBUTTONDOWN:
+                    self._joystickButtonDown((event.instance_id, event.button))
+                elif event.type == pygame.JOYBUTTONUP:
+                    self._joystickButtonUp((event.instance_id, event.button))
+                elif event.type == pygame.JOYAXISMOTION:
+                    self._joystickAxes[(event.instance_id, event.axis)] = event.value
+                elif event.type == pygame.JOYHATMOTION:
+                    self._joystickHats[(event.instance_id, event.hat)] = event.value
+                elif event.type == pygame.JOYDEVICEADDED:
+                    self._addJoystick(pygame.joystick.Joystick(event.device_index))
+                elif event.type == pygame.JOYDEVICEREMOVED:
+                    self._removeJoystick(event.instance_id)
 
         # update key press durations
-        for i in range(len(self._keyPressDurations)):
-            if self.currentKeyStates[i]:
-                self._keyPressDurations[i] += deltaTime
-            else:
-                self._keyPressDurations[i] = 0
+        for key in self._keysDown:
+            self._keyPressDurations[key] = self._keyPressDurations.get(key, 0) + deltaTime
 
-        # update mouse button time sinse last pressed
-        for i in range(len(self._keyTimeSinceLastPressed)):
-            if self.isKeyPressed(i) == True :
-                self._keyTimeSinceLastPressed[i] = 0
-            else:
-                self._keyTimeSinceLastPressed[i] += deltaTime
-
-        # update mouse button press state between
-        # 'none', 'single' and 'double'
-        for i in range(len(self._keyPressStates)):
-            # none -> single
-            if self._keyPressStates[i] == "none" and self.isKeyPressed(i):
-                self._keyPressStates[i] = "single"
-            # single -> double
-            elif self._keyPressStates[i] == "single" and self.isKeyPressed(i):
-                self._keyPressStates[i] = "double"
-            # single -> none
-            elif self._keyPressStates[i] == "single" and self._keyTimeSinceLastPressed[i] > self.doublePressTimeout:
-                self._keyPressStates[i] = "none"
+        # update key press state between
+        # none, single and double
+        newlyPressed = [key for key in self._keysPressed if key not in self._keyPressStates]
+        for key in list(self._keyPressStates):
             # double -> none
-            elif self._keyPressStates[i] == "double":
-                self._keyPressStates[i] = "none"
+            if self._keyPressStates[key] == _DOUBLE:
+                del self._keyPressStates[key]
+            # single -> double
+            elif key in self._keysPressed:
+                self._keyPressStates[key] = _DOUBLE
+                del self._keyTimeSinceLastPressed[key]
+            else:
+                # single -> none
+                self._keyTimeSinceLastPressed[key] += deltaTime
+                if self._keyTimeSinceLastPressed[key] > self.doublePressTimeout:
+                    del self._keyPressStates[key]
+                    del self._keyTimeSinceLastPressed[key]
+        # none -> single
+        for key in newlyPressed:
+            self._keyPressStates[key] = _SINGLE
+            self._keyTimeSinceLastPressed[key] = 0
 
         #
         # update mouse button info
@@ -105,11 +174,15 @@ class Input():
 
         # update mouse presses
         self.previousMouseButtonStates = self.currentMouseButtonStates
-        self.currentMouseButtonStates = pygame.mouse.get_pressed()
+        if mouseButtons is None:
+            mouseButtons = pygame.mouse.get_pressed()
+        self.currentMouseButtonStates = mouseButtons
 
         # update mouse position
         self.previousMousePosition = self.currentMousePosition
-        self.currentMousePosition = pygame.mouse.get_pos()
+        if mousePosition is None:
+            mousePosition = pygame.mouse.get_pos()
+        self.currentMousePosition = mousePosition
         
         # update mouse button press durations
         for i in range(len(self._mouseButtonDurations)):
@@ -126,20 +199,171 @@ class Input():
                 self._mouseTimeSinceLastPressed[i] += deltaTime
 
         # update mouse button press state between
-        # 'none', 'single' and 'double'
+        # none, single and double
         for i in range(len(self._mousePressStates)):
             # none -> single
-            if self._mousePressStates[i] == "none" and self.isMouseButtonPressed(i):
-                self._mousePressStates[i] = "single"
+            if self._mousePressStates[i] == _NONE and self.isMouseButtonPressed(i):
+                self._mousePressStates[i] = _SINGLE
             # single -> double
-            elif self._mousePressStates[i] == "single" and self.isMouseButtonPressed(i):
-                self._mousePressStates[i] = "double"
+            elif self._mousePressStates[i] == _SINGLE and self.isMouseButtonPressed(i):
+                self._mousePressStates[i] = _DOUBLE
             # single -> none
-            elif self._mousePressStates[i] == "single" and self._mouseTimeSinceLastPressed[i] > self.doublePressTimeout:
-                self._mousePressStates[i] = "none"
+            elif self._mousePressStates[i] == _SINGLE and self._mouseTimeSinceLastPressed[i] > self.doublePressTimeout:
+                self._mousePressStates[i] = _NONE
             # double -> none
-            elif self._mousePressStates[i] == "double":
-                self._mousePressStates[i] = "none"
+            elif self._mousePressStates[i] == _DOUBLE:
+                self._mousePressStates[i] = _NONE
+
+    def _keyDown(self, keyCode):
+
+        '''
+        Records a key being pressed.
+
+        :param pygame.Key keyCode: The key pressed.
+        '''
+
+        if keyCode not in self._keysDown:
+            self._keysDown.add(keyCode)
+            self._keysPressed.add(keyCode)
+
+    def _keyUp(self, keyCode):
+
+        '''
+        Records a key being released.
+
+        :param pygame.Key keyCode: The key released.
+        '''
+
+        if keyCode in self._keysDown:
+            self._keysDown.discard(keyCode)
+            self._keysReleased.add(keyCode)
+            self._keyPressDurations.pop(keyCode, None)
+
+    def _pollKeys(self):
+
+        '''
+        Finds key changes since the last update using pygame.key.get_pressed(),
+        for when events aren't passed to update().
+        '''
+
+        global _scancodeKeyCodes
+
+        keyStates = pygame.key.get_pressed()
+        # only search for changes if any key has changed
+        if keyStates == self._polledKeyStates:
+            return
+        if _scancodeKeyCodes is None:
+            # get_pressed() is indexed by scancode, so find the key code for each scancode
+            scancodes = type(keyStates)(range(len(keyStates)))
+            _scancodeKeyCodes = {}
+            for name in dir(pygame):
+                if name.startswith('K_'):
+                    keyCode = getattr(pygame, name)
+                    _scancodeKeyCodes.setdefault(scancodes[keyCode], keyCode)
+        # (key states can't be iterated directly, as indexing uses key codes)
+        for scancode, (current, previous) in enumerate(zip(tuple.__iter__(keyStates), tuple.__iter__(self._polledKeyStates))):
+            if current != previous and scancode in _scancodeKeyCodes:
+                if current:
+                    self._keyDown(_scancodeKeyCodes[scancode])
+                else:
+                    self._keyUp(_scancodeKeyCodes[scancode])
+        self._polledKeyStates = keyStates
+
+    #
+    # joystick state
+    #
+
+    def _joystickButtonDown(self, button):
+
+        '''
+        Records a joystick button being pressed.
+
+        :param (int, int) button: The (joystick instance id, button) pressed.
+        '''
+
+        if button not in self._joystickButtonsDown:
+            self._joystickButtonsDown.add(button)
+            self._joystickButtonsPressed.add(button)
+
+    def _joystickButtonUp(self, button):
+
+        '''
+        Records a joystick button being released.
+
+        :param (int, int) button: The (joystick instance id, button) released.
+        '''
+
+        if button in self._joystickButtonsDown:
+            self._joystickButtonsDown.discard(button)
+            self._joystickButtonsReleased.add(button)
+
+    def _addJoystick(self, joystick):
+
+        '''
+        Adds a connected joystick, if it hasn't already been added.
+
+        :param pygame.joystick.Joystick joystick: The joystick to add.
+        '''
+
+        instanceId = joystick.get_instance_id()
+        if all(j.get_instance_id() != instanceId for j in self._joysticks):
+            self._joysticks.append(joystick)
+
+    def _removeJoystick(self, instanceId):
+
+        '''
+        Removes a disconnected joystick, along with its stored state.
+
+        :param int instanceId: The instance id of the joystick to remove.
+        '''
+
+        self._joysticks = [j for j in self._joysticks if j.get_instance_id() != instanceId]
+        for button in [b for b in self._joystickButtonsDown if b[0] == instanceId]:
+            self._joystickButtonUp(button)
+        self._joystickAxes = {k: v for k, v in self._joystickAxes.items() if k[0] != instanceId}
+        self._joystickHats = {k: v for k, v in self._joystickHats.items() if k[0] != instanceId}
+
+    def _pollJoysticks(self):
+
+        '''
+        Finds joystick changes since the last update,
+        for when events aren't passed to update().
+        '''
+
+        if not pygame.joystick.get_init():
+            return
+        # find connected and disconnected joysticks
+        if pygame.joystick.get_count() != len(self._joysticks):
+            joysticks = [pygame.joystick.Joystick(i) for i in range(pygame.joystick.get_count())]
+            connected = [j.get_instance_id() for j in joysticks]
+            for joystick in list(self._joysticks):
+                if joystick.get_instance_id() not in connected:
+                    self._removeJoystick(joystick.get_instance_id())
+            for joystick in joysticks:
+                self._addJoystick(joystick)
+        for joystick in self._joysticks:
+            instanceId = joystick.get_instance_id()
+            for i in range(joystick.get_numbuttons()):
+                if joystick.get_button(i):
+                    self._joystickButtonDown((instanceId, i))
+                else:
+                    self._joystickButtonUp((instanceId, i))
+            for i in range(joystick.get_numaxes()):
+                self._joystickAxes[(instanceId, i)] = joystick.get_axis(i)
+            for i in range(joystick.get_numhats()):
+                self._joystickHats[(instanceId, i)] = joystick.get_hat(i)
+
+    def _getJoystickId(self, joystick):
+
+        '''
+        Returns the instance id of a connected joystick, or None if it isn't connected.
+
+        :param int joystick: The joystick number, in the order joysticks were connected.
+        '''
+
+        if 0 <= joystick < len(self._joysticks):
+            return self._joysticks[joystick].get_instance_id()
+        return None
 
     #
     # key methods
@@ -153,9 +377,7 @@ class Input():
         :param pygame.Key keyCode: The key to check.
         '''
         
-        if self.currentKeyStates is None or self.previousKeyStates is None:
-            return False
-        return self.currentKeyStates[keyCode] == True
+        return keyCode in self._keysDown
 
     def isKeyPressed(self, keyCode):
 
@@ -165,9 +387,7 @@ class Input():
         :param pygame.Key keyCode: The key to check.
         '''
         
-        if self.currentKeyStates is None or self.previousKeyStates is None:
-            return False
-        return self.currentKeyStates[keyCode] == True and self.previousKeyStates[keyCode] == False
+        return keyCode in self._keysPressed
 
     def isKeyDoublePressed(self, keyCode):
 
@@ -177,7 +397,7 @@ class Input():
         :param pygame.Key keyCode: The key to check.
         '''
         
-        return self._keyPressStates[keyCode] == "double"
+        return self._keyPressStates.get(keyCode) == _DOUBLE
     
     def isKeyReleased(self, keyCode):
 
@@ -187,9 +407,7 @@ class Input():
         :param pygame.Key keyCode: The key to check.
         '''
         
-        if self.currentKeyStates is None or self.previousKeyStates is None:
-            return False
-        return self.currentKeyStates[keyCode] == False and self.previousKeyStates[keyCode] == True
+        return keyCode in self._keysReleased
 
     def getKeyDownDuration(self, keyCode):
 
@@ -199,7 +417,7 @@ class Input():
         :param pygame.Key keyCode: The key to check.
         '''
         
-        return self._keyPressDurations[keyCode]
+        return self._keyPressDurations.get(keyCode, 0)
 
     def isKeyLongDown(self, keyCode):
 
@@ -209,7 +427,7 @@ class Input():
         :param pygame.Key keyCode: The key to check.
         '''
         
-        return self._keyPressDurations[keyCode] >= self.longPressDuration
+        return self._keyPressDurations.get(keyCode, 0) >= self.longPressDuration
 
     def isKeyLongPressed(self, keyCode):
 
@@ -219,7 +437,7 @@ class Input():
         :param pygame.Key keyCode: The key to check.
         '''
         
-        return self._keyPressDurations[keyCode] == self.longPressDuration
+        return self._keyPressDurations.get(keyCode, 0) == self.longPressDuration
 
     def getKeyLongPressPercentage(self, keyCode):
 
@@ -229,7 +447,39 @@ class Input():
         :param pygame.Key keyCode: The key to check.
         '''
         
-        return min(100, self._keyPressDurations[keyCode] / self.longPressDuration * 100)
+        return min(100, self._keyPressDurations.get(keyCode, 0) / self.longPressDuration * 100)
+
+    def getKeysDown(self):
+
+        '''
+        Returns the set of key codes held down during the current frame.
+        '''
+
+        return frozenset(self._keysDown)
+
+    def getKeysPressed(self):
+
+        '''
+        Returns the set of key codes pressed during the current frame.
+        '''
+
+        return frozenset(self._keysPressed)
+
+    def getKeysDoublePressed(self):
+
+        '''
+        Returns the set of key codes double-pressed during the current frame.
+        '''
+
+        return frozenset(key for key, state in self._keyPressStates.items() if state == _DOUBLE)
+
+    def getKeysReleased(self):
+
+        '''
+        Returns the set of key codes released during the current frame.
+        '''
+
+        return frozenset(self._keysReleased)
 
     #
     # mouse methods
@@ -296,7 +546,7 @@ class Input():
         :param int mouseButton: The mouse button to check.
         '''
         
-        return self._mousePressStates[mouseButton] == "double"
+        return self._mousePressStates[mouseButton] == _DOUBLE
 
     def isMouseButtonReleased(self, mouseButton):
 
@@ -349,3 +599,90 @@ class Input():
         '''
         
         return min(100, self._mouseButtonDurations[mouseButton] / self.longPressDuration * 100)
+
+    #
+    # joystick methods
+    #
+
+    def getJoystickCount(self):
+
+        '''
+        Returns the number of connected joysticks.
+        '''
+
+        return len(self._joysticks)
+
+    def isJoystickButtonDown(self, button, joystick = 0):
+
+        '''
+        Returns true if the joystick button specified is held down during the current frame.
+
+        :param int button: The joystick button to check.
+        :param int joystick: The joystick to check, in the order joysticks were connected (default = 0).
+        '''
+
+        return (self._getJoystickId(joystick), button) in self._joystickButtonsDown
+
+    def isJoystickButtonPressed(self, button, joystick = 0):
+
+        '''
+        Returns true if the joystick button specified has been pressed in the current frame.
+
+        :param int button: The joystick button to check.
+        :param int joystick: The joystick to check, in the order joysticks were connected (default = 0).
+        '''
+
+        return (self._getJoystickId(joystick), button) in self._joystickButtonsPressed
+
+    def isJoystickButtonReleased(self, button, joystick = 0):
+
+        '''
+        Returns true if the joystick button specified has been released in the current frame.
+
+        :param int button: The joystick button to check.
+        :param int joystick: The joystick to check, in the order joysticks were connected (default = 0).
+        '''
+
+        return (self._getJoystickId(joystick), button) in self._joystickButtonsReleased
+
+    def getJoystickAxis(self, axis, joystick = 0):
+
+        '''
+        Returns the position of a joystick axis, between -1 and 1.
+
+        :param int axis: The joystick axis to check.
+        :param int joystick: The joystick to check, in the order joysticks were connected (default = 0).
+        '''
+
+        return self._joystickAxes.get((self._getJoystickId(joystick), axis), 0)
+
+    def getJoystickHat(self, hat, joystick = 0):
+
+        '''
+        Returns the (x, y) position of a joystick hat (d-pad), e.g. (-1, 0) = left.
+
+        :param int hat: The joystick hat to check.
+        :param int joystick: The joystick to check, in the order joysticks were connected (default = 0).
+        '''
+
+        return self._joystickHats.get((self._getJoystickId(joystick), hat), (0, 0))
+
+    #
+    # properties
+    #
+
+    @property
+    def currentKeyStates(self):
+        '''
+        Get the state of each key during the current frame, indexed by key code (e.g. currentKeyStates[pygame.K_SPACE]).
+        (Kept for compatibility; use isKeyDown() or getKeysDown() instead.)
+        '''
+        return _KeyStates(frozenset(self._keysDown))
+
+    @property
+    def previousKeyStates(self):
+        '''
+        Get the state of each key during the previous frame, indexed by key code.
+        (Kept for compatibility; use isKeyDown() or getKeysDown() instead.)
+        '''
+        return _KeyStates(frozenset((self._keysDown - self._keysPressed) | self._keysReleased))
@@ -7,6 +7,15 @@
 
 import pygame
 import os
+import math
+from collections import OrderedDict
+import random
+
+# numpy is only required for colored lighting
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from .globals import ROOT_DIR
 
@@ -25,13 +34,56 @@ class Light:
     :param int radius: The radius of the light.
     :param str name: Light name (for getting and controlling if required, default = None).
     :param bool on: Light visibility (default = True).
+    :param bool castShadows: Block the light using the colliders in the lighting system (default = False).
+    :param pygame.Color color: The light color (colored lighting only, default = 'white').
+    :param float intensity: The light brightness, where lights add together (colored lighting only, default = 1).
+    :param float flicker: The maximum fraction of intensity randomly lost each update (colored lighting only, default = 0).
+    :param float flickerSpeed: How quickly the flicker changes, between 0 and 1 (default = 0.2).
+    :param int seed: Seed for the light's random number generator, so that flicker can be reproduced (default = None, which takes a seed from Python's random module).
     '''
 
-    def __init__(self, position = (0, 0), radius = 100, name = None, on = True):
+    def __init__(self, position = (0, 0), radius = 100, name = None, on = True, castShadows = False,
+                 color = 'white', intensity = 1, flicker = 0, flickerSpeed = 0.2, seed = None):
         self.position = list(position)
         self.name = name
         self.radius = radius
-        self.on = True
+        self.on = on
+        self.castShadows = castShadows
+        self.color = color
+        self.intensity = intensity
+        self.flicker = flicker
+        self.flickerSpeed = flickerSpeed
+        # the current intensity multiplier due to flicker
+        self._flickerAmount = 1
+        # each light has its own random number generator, so that flicker doesn't
+        # use the random module's state in an order that depends on drawing
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def update(self, deltaTime = 1):
+
+        '''
+        Updates the light flicker. Called automatically by the lighting system.
+
+        :param float deltaTime: The elapsed time since the last update (default = 1).
+        '''
+
+        if self.flicker <= 0:
+            self._flickerAmount = 1
+            return
+        # move towards a new random amount
+        target = self.rng.uniform(1 - self.flicker, 1)
+        self._flickerAmount += (target - self._flickerAmount) * min(1, self.flickerSpeed * deltaTime)
+
+    def getIntensity(self):
+
+        '''
+        Returns the current light intensity, including any flicker.
+        '''
+
+        return self.intensity * self._flickerAmount
     
     def toggle(self):
 
@@ -56,8 +108,107 @@ class Light:
     def radius(self, value):
         self._radius = max(0, value)
 
+def _getVisibilityPolygon(position, radius, rects):
+
+    '''
+    Returns the polygon of points visible from a position, within a square of
+    the radius given, with the rects given blocking visibility.
+    (Rays are cast towards each rect corner, and just either side of it.)
+
+    :param (float, float) position: The (x, y) position to cast rays from.
+    :param float radius: Half the width of the square around the position.
+    :param list((int, int, int, int)) rects: The (x, y, w, h) rects that block visibility.
+    '''
+
+    px, py = position
+    left, top, right, bottom = px - radius, py - radius, px + radius, py + radius
+
+    # store rects as (distance, x1, y1, x2, y2) clipped to the bounds, ignoring
+    # any surrounding the position (which would block everything), nearest first
+    boxes = []
+    for x, y, w, h in rects:
+        x1, y1, x2, y2 = max(x, left), max(y, top), min(x + w, right), min(y + h, bottom)
+        if x1 >= x2 or y1 >= y2 or (x1 < px < x2 and y1 < py < y2):
+            continue
+        dx = x1 - px if px < x1 else px - x2 if px > x2 else 0
+        dy = y1 - py if py < y1 else py - y2 if py > y2 else 0
+        boxes.append((math.hypot(dx, dy), x1, y1, x2, y2))
+    boxes.sort()
+
+    # cast rays towards the corners of the bounds and of each rect
+    angles = [math.atan2(y - py, x - px) for x, y in ((left, top), (right, top), (right, bottom), (left, bottom))]
+    for _, x1, y1, x2, y2 in boxes:
+        for cx, cy in ((x1, y1), (x2, y1), (x2, y2), (x1, y2)):
+            a = math.atan2(cy - py, cx - px)
+            angles.extend((a - 0.0001, a, a + 0.0001))
+    angles.sort()
+
+    polygon = []
+    for a in angles:
+        dx, dy = math.cos(a), math.sin(a)
+
+        # distance to the edge of the bounds
+        nearest = math.inf
+        if dx != 0:
+            nearest = ((right if dx > 0 else left) - px) / dx
+        if dy != 0:
+            t = ((bottom if dy > 0 else top) - py) / dy
+            if t < nearest:
+                nearest = t
+
+        # distance to the nearest rect, using the 'slab' method
+        for distance, x1, y1, x2, y2 in boxes:
+            # no remaining rect can be nearer
+            if distance >= nearest:
+                break
+            if dx != 0:
+                tMin, tMax = (x1 - px) / dx, (x2 - px) / dx
+                if tMin > tMax:
+                    tMin, tMax = tMax, tMin
+            elif x1 <= px <= x2:
+                tMin, tMax = -math.inf, math.inf
+            else:
+                continue
+            if dy != 0:
+                t1, t2 = (y1 - py) / dy, (y2 - py) / dy
+                if t1 > t2:
+                    t1, t2 = t2, t1
+                if t1 > tMin:
+                    tMin = t1
+                if t2 < tMax:
+                    tMax = t2
+            elif not y1 <= py <= y2:
+                continue
+            if tMax >= tMin and 0 <= tMin < nearest:
+                nearest = tMin
+
+        polygon.append((px + dx * nearest, py + dy * nearest))
+
+    return polygon
+
 class Lighting:
 
+    '''
+    A lighting system, which darkens a surface except for the area around each light added.
+
+    :param (int, int) surfaceSize: The size of the surface to light.
+    :param float lightLevel: The ambient light level (between 0 (dark) and 1 (light), default = 0).
+    :param int radiusQuantization: Light radii are rounded to a multiple of this value, so that lights of similar size can share a scaled light mask (default = 1).
+    :param int maskCacheSize: The maximum number of scaled light masks to keep, with the least recently used removed first (default = 64).
+    :param float lightmapScale: The resolution of the lightmap relative to the surface size. For example, 0.25 draws lights to a quarter-size lightmap, which is smoothly scaled up once when drawn (default = 1).
+    :param int gridCellSize: The size of each cell of the grid used to look up lights by area (default = 256).
+
+    Only the areas of the lightmap affected by lights that have been added, removed, moved, resized or toggled are redrawn each frame.
+
+    Lights with castShadows set are blocked by the (x, y, w, h) areas of any pygamepal.Collider objects (or rects) in the colliders list.
+    (Colliders added to a pygamepal.Scene are added to the scene lighting automatically.)
+
+    :param bool colored: Use colored lighting, in which the color, intensity and flicker of each light are added together and multiplied with the surface. Requires numpy (default = False).
+    '''
+
+    # the number of changed areas to keep before combining them into one
+    maxDirtyRects = 32
+
     @property
     def lightLevel(self):
         '''
@@ -69,16 +220,66 @@ class Lighting:
     def lightLevel(self, value):
         self._lightLevel = min(max(0, value), 1)
 
-    def __init__(self, surfaceSize, lightLevel = 0):
+    def __init__(self, surfaceSize, lightLevel = 0, radiusQuantization = 1, maskCacheSize = 64, lightmapScale = 1, gridCellSize = 256, colored = False):
         
-        # create a new lighting surface in the specified size
-        self.surface = pygame.Surface(surfaceSize, pygame.SRCALPHA)
+        if colored and numpy is None:
+            raise ImportError('colored lighting requires numpy (pip install numpy)')
+
+        self.surfaceSize = surfaceSize
+        self.lightmapScale = lightmapScale
+        self.colored = colored
+
+        # create a new lighting surface (lightmap) in the specified size and resolution
+        # (colored lighting stores the amount of light rather than darkness, and has no alpha)
+        lightmapSize = (max(1, math.ceil(surfaceSize[0] * lightmapScale)), max(1, math.ceil(surfaceSize[1] * lightmapScale)))
+        flags = 0 if colored else pygame.SRCALPHA
+        self.surface = pygame.Surface(lightmapSize, flags, 32)
+        # a reduced resolution lightmap is scaled into this surface before drawing
+        self._scaledSurface = None
+        if lightmapScale != 1:
+            self._scaledSurface = pygame.Surface(surfaceSize, flags, 32)
         self.lightLevel = lightLevel
-        self.lightMask = pygame.image.load(os.path.join(ROOT_DIR, 'lightMask.png'))
+        # (the mask is converted to the lightmap pixel format, which makes blending much faster)
+        self.lightMask = pygame.image.load(os.path.join(ROOT_DIR, 'lightMask.png')).convert(pygame.Surface((1, 1), pygame.SRCALPHA, 32))
+
+        # colored light is added together in a (w, h, rgb) buffer, then converted to the lightmap
+        self._lightBuffer = None
+        self._maskArrayCache = OrderedDict()
+        self._lightStyles = {}
+        self._drawnLightLevel = self.lightLevel
+        if colored:
+            self._lightBuffer = numpy.zeros((lightmapSize[0], lightmapSize[1], 3), numpy.float32)
+
+        # scaled light masks, stored against their (quantized) radius
+        # and ordered from least to most recently used
+        self.radiusQuantization = radiusQuantization
+        self.maskCacheSize = maskCacheSize
+        self._maskCache = OrderedDict()
         
         self.lights = []
         self.surface.fill( 'black' )
 
+        # lights stored by name
+        self._namedLights = {}
+        # the lightmap area last drawn for each light (None if not drawn)
+        self._lightRects = {}
+        # maps (x, y) grid cells to the lights drawn in them
+        self._gridCellSize = max(1, int(gridCellSize * lightmapScale))
+        self._grid = {}
+        # lightmap areas that need redrawing, starting with the whole lightmap
+        self._dirtyRects = [self.surface.get_rect()]
+        self._scaledSurfaceDirty = True
+
+        # colliders that block lights that cast shadows
+        self.colliders = []
+        # the collider areas as last drawn, and a grid of the areas in each cell
+        self._occluders = ()
+        self._occluderGrid = {}
+        # the lightmap area and nearby collider areas used to draw each shadow
+        # casting light, along with the light surface created using them
+        self._shadowKeys = {}
+        self._shadowSurfaces = {}
+
     def update(self, deltaTime = 1):
 
         '''
@@ -87,22 +288,432 @@ class Lighting:
         :param float deltaTime: The elapsed time cince the last update (default = 1).
         '''
         
-        pass
+        for l in self.lights:
+            l.update(deltaTime)
 
-    def draw(self, surface):
+    def draw(self, surface, viewRects = None):
 
         '''
         Draws all light in the lighting system.
 
         :param pygame.Surface surface: The surface to draw to.
+        :param list((int, int, int, int)) viewRects: The (x, y, w, h) areas of the surface that are visible, for example to each camera. Lights outside of these areas are not drawn (default = None, which draws the whole surface).
         '''
-        
-        self.surface.fill('black')
-        for l in [x for x in self.lights if x.on]:
-            lightSize = (l.radius * 2, l.radius * 2)
-            self.surface.blit(pygame.transform.scale(self.lightMask, lightSize), (l.position[0] - (lightSize[0] / 2), l.position[1] - (lightSize[1] / 2)), special_flags=pygame.BLEND_RGBA_SUB)
-        surface.blit(self.surface, (0,0))
-        self.surface.set_alpha(255 * (1 - self.lightLevel))
+
+        self._refresh()
+
+        # nothing to draw in full light
+        if self.lightLevel >= 1:
+            return
+
+        # convert visible areas to lightmap coordinates
+        lightmapRect = self.surface.get_rect()
+        if viewRects is None:
+            lightmapViews = [lightmapRect]
+        else:
+            lightmapViews = [self._toLightmapRect(r) for r in viewRects]
+
+        # colored lighting includes the light level in the lightmap
+        if self.colored and self.lightLevel != self._drawnLightLevel:
+            self._drawnLightLevel = self.lightLevel
+            self._convertLightBuffer(lightmapRect)
+            self._scaledSurfaceDirty = True
+
+        # redraw changed areas that are visible, keeping the rest for later
+        pendingRects = []
+        for dirtyRect in self._dirtyRects:
+            if dirtyRect.collidelist(lightmapViews) == -1:
+                pendingRects.append(dirtyRect)
+                continue
+            dirtyRect = dirtyRect.clip(lightmapRect)
+            if dirtyRect.w > 0 and dirtyRect.h > 0:
+                if self.colored:
+                    self._redrawColored(dirtyRect)
+                else:
+                    self._redraw(dirtyRect)
+                self._scaledSurfaceDirty = True
+        self._dirtyRects = pendingRects
+
+        # scale a reduced resolution lightmap up to the surface size
+        lightmap = self.surface
+        if self._scaledSurface is not None:
+            if self._scaledSurfaceDirty:
+                pygame.transform.smoothscale(self.surface, self.surfaceSize, self._scaledSurface)
+                self._scaledSurfaceDirty = False
+            lightmap = self._scaledSurface
+
+        # colored light is multiplied with the surface, and
+        # darkness is subtracted using the lightmap alpha
+        if self.colored:
+            blendMode = pygame.BLEND_RGB_MULT
+        else:
+            blendMode = 0
+            lightmap.set_alpha(255 * (1 - self.lightLevel))
+        if viewRects is None:
+            surface.blit(lightmap, (0,0), special_flags = blendMode)
+        else:
+            for r in viewRects:
+                surface.blit(lightmap, r[0:2], r, blendMode)
+
+    def _refresh(self):
+
+        '''
+        Finds lights that have changed since they were last drawn,
+        marking their previous and current areas of the lightmap for redrawing.
+        '''
+
+        occludersChanged = self._refreshOccluders()
+
+        for l in self.lights:
+            rect = self._getLightRect(l)
+            previousRect = self._lightRects.get(l)
+
+            # check whether the colliders near a shadow casting light have changed
+            shadowChanged = False
+            if l.castShadows and rect is not None:
+                if occludersChanged or rect != previousRect or l not in self._shadowKeys:
+                    shadowKey = (rect, self._queryOccluders(rect))
+                    if self._shadowKeys.get(l) != shadowKey:
+                        self._shadowKeys[l] = shadowKey
+                        self._shadowSurfaces.pop(l, None)
+                        shadowChanged = True
+            elif l in self._shadowKeys:
+                del self._shadowKeys[l]
+                self._shadowSurfaces.pop(l, None)
+                shadowChanged = True
+
+            # check whether the color or intensity of colored lights have changed
+            if self.colored and rect is not None:
+                style = (tuple(pygame.Color(l.color))[0:3], l.getIntensity())
+                if self._lightStyles.get(l) != style:
+                    self._lightStyles[l] = style
+                    shadowChanged = True
+
+            if l in self._lightRects:
+                if rect == previousRect and not shadowChanged:
+                    continue
+                self._removeFromGrid(l, previousRect)
+            else:
+                previousRect = None
+                if l.name is not None:
+                    self._namedLights.setdefault(l.name, l)
+            self._lightRects[l] = rect
+            self._addToGrid(l, rect)
+            self._addDirtyRect(previousRect)
+            if rect != previousRect:
+                self._addDirtyRect(rect)
+
+        # remove lights that are no longer in the list of lights
+        if len(self._lightRects) > len(self.lights):
+            currentLights = set(self.lights)
+            for l in [l for l in self._lightRects if l not in currentLights]:
+                self._forgetLight(l)
+
+    def _redraw(self, area):
+
+        '''
+        Redraws an area of the lightmap, including all lights within that area.
+
+        :param pygame.Rect area: The lightmap area to redraw.
+        '''
+
+        self.surface.set_clip(area)
+        self.surface.fill('black', area)
+
+        # group light positions by radius, so that lights of the
+        # same size can be drawn together using the same mask
+        # (shadow casting lights each have their own surface)
+        lightGroups = {}
+        shadowLights = []
+        for l in self._queryGrid(area):
+            rect = self._lightRects[l]
+            if l in self._shadowKeys:
+                shadowLights.append((self._getShadowSurface(l), rect.topleft))
+            else:
+                lightGroups.setdefault(rect.w // 2, []).append(rect.topleft)
+
+        for radius, positions in lightGroups.items():
+            mask = self._getScaledMask(radius)
+            self.surface.fblits([(mask, p) for p in positions], pygame.BLEND_RGBA_SUB)
+        if shadowLights:
+            self.surface.fblits(shadowLights, pygame.BLEND_RGBA_SUB)
+
+        self.surface.set_clip(None)
+
+    def _redrawColored(self, area):
+
+        '''
+        Redraws an area of the lightmap for colored lighting, by adding together
+        the light from all lights within that area.
+
+        :param pygame.Rect area: The lightmap area to redraw.
+        '''
+
+        buffer = self._lightBuffer[area.left:area.right, area.top:area.bottom]
+        buffer.fill(0)
+
+        for l in self._queryGrid(area):
+            rect = self._lightRects[l]
+            if l in self._shadowKeys:
+                alpha = pygame.surfarray.array_alpha(self._getShadowSurface(l)) * numpy.float32(1 / 255)
+            else:
+                alpha = self._getMaskArray(rect.w // 2)
+            color, intensity = self._lightStyles[l]
+            # add the part of the light inside the area
+            overlap = rect.clip(area)
+            buffer[overlap.left - area.left:overlap.right - area.left, overlap.top - area.top:overlap.bottom - area.top] += \
+                alpha[overlap.left - rect.left:overlap.right - rect.left, overlap.top - rect.top:overlap.bottom - rect.top, None] * \
+                numpy.array(color, numpy.float32) * numpy.float32(intensity / 255)
+
+        self._convertLightBuffer(area)
+
+    def _convertLightBuffer(self, area):
+
+        '''
+        Converts an area of the colored light buffer to the lightmap surface,
+        adding the ambient light level.
+
+        :param pygame.Rect area: The lightmap area to convert.
+        '''
+
+        buffer = self._lightBuffer[area.left:area.right, area.top:area.bottom]
+        light = buffer * numpy.float32((1 - self.lightLevel) * 255) + numpy.float32(self.lightLevel * 255)
+        numpy.clip(light, 0, 255, out = light)
+        pygame.surfarray.blit_array(self.surface.subsurface(area), light.astype(numpy.uint8))
+
+    def _getMaskArray(self, radius):
+
+        '''
+        Returns the alpha values (between 0 and 1) of the light mask scaled to the radius given,
+        as a numpy array, creating and caching it if required.
+
+        :param int radius: The (quantized) radius of the mask.
+        '''
+
+        maskArray = self._maskArrayCache.get(radius)
+        if maskArray is not None:
+            self._maskArrayCache.move_to_end(radius)
+            return maskArray
+
+        maskArray = pygame.surfarray.array_alpha(self._getScaledMask(radius)) * numpy.float32(1 / 255)
+        self._maskArrayCache[radius] = maskArray
+        # remove the least recently used mask
+        if len(self._maskArrayCache) > self.maskCacheSize:
+            self._maskArrayCache.popitem(last = False)
+        return maskArray
+
+    def _getLightRect(self, light):
+
+        '''
+        Returns the area of the lightmap covered by a light, or None if the light isn't drawn.
+        (Positions and radii are scaled to the lightmap resolution.)
+
+        :param pygamepal.Light light: The light.
+        '''
+
+        if not light.on:
+            return None
+        radius = self._quantizeRadius(light.radius * self.lightmapScale)
+        if radius <= 0:
+            return None
+        return pygame.Rect(
+            int(light.position[0] * self.lightmapScale) - radius,
+            int(light.position[1] * self.lightmapScale) - radius,
+            radius * 2, radius * 2)
+
+    def _toLightmapRect(self, rect):
+
+        '''
+        Converts an (x, y, w, h) surface area to the lightmap area that covers it.
+
+        :param (int, int, int, int) rect: The area to convert.
+        '''
+
+        scale = self.lightmapScale
+        left = math.floor(rect[0] * scale)
+        top = math.floor(rect[1] * scale)
+        return pygame.Rect(left, top,
+                           math.ceil((rect[0] + rect[2]) * scale) - left,
+                           math.ceil((rect[1] + rect[3]) * scale) - top)
+
+    def _addDirtyRect(self, rect):
+
+        '''
+        Marks an area of the lightmap for redrawing.
+
+        :param pygame.Rect rect: The lightmap area (ignored if None).
+        '''
+
+        if rect is None:
+            return
+        self._dirtyRects.append(rect)
+        # combine areas if there are too many to redraw separately
+        if len(self._dirtyRects) > self.maxDirtyRects:
+            self._dirtyRects = [self._dirtyRects[0].unionall(self._dirtyRects[1:])]
+
+    #
+    # shadows
+    #
+
+    def _refreshOccluders(self):
+
+        '''
+        Rebuilds the grid of collider areas if any have changed since the last frame,
+        returning True if they have.
+        '''
+
+        occluders = tuple(tuple(getattr(c, '_rect', c)) for c in self.colliders)
+        if occluders == self._occluders:
+            return False
+
+        self._occluders = occluders
+        self._occluderGrid = {}
+        for o in occluders:
+            rect = self._toLightmapRect(o)
+            for cell in self._getGridCells(rect):
+                self._occluderGrid.setdefault(cell, []).append(o)
+        return True
+
+    def _queryOccluders(self, rect):
+
+        '''
+        Returns a (sorted) tuple of the (x, y, w, h) collider areas that overlap a lightmap area.
+
+        :param pygame.Rect rect: The lightmap area.
+        '''
+
+        found = set()
+        for cell in self._getGridCells(rect):
+            occluders = self._occluderGrid.get(cell)
+            if occluders is not None:
+                found.update(o for o in occluders if self._toLightmapRect(o).colliderect(rect))
+        return tuple(sorted(found))
+
+    def _getShadowSurface(self, light):
+
+        '''
+        Returns the light mask for a shadow casting light, with the areas
+        hidden from the light by colliders removed. The surface is created when
+        the light or nearby colliders change, and reused otherwise.
+
+        :param pygamepal.Light light: The shadow casting light.
+        '''
+
+        surface = self._shadowSurfaces.get(light)
+        if surface is not None:
+            return surface
+
+        rect, occluders = self._shadowKeys[light]
+        scale = self.lightmapScale
+        surface = self._getScaledMask(rect.w // 2).copy()
+
+        # draw the visible area, in light surface coordinates
+        polygon = [(x * scale - rect.x, y * scale - rect.y)
+                   for x, y in _getVisibilityPolygon(light.position, rect.w / 2 / scale, occluders)]
+        visibleArea = pygame.Surface(rect.size, pygame.SRCALPHA)
+        if len(polygon) > 2:
+            pygame.draw.polygon(visibleArea, (255, 255, 255, 255), polygon)
+        # keep only the visible part of the light
+        surface.blit(visibleArea, (0, 0), special_flags = pygame.BLEND_RGBA_MULT)
+
+        self._shadowSurfaces[light] = surface
+        return surface
+
+    #
+    # light grid
+    #
+
+    def _getGridCells(self, rect):
+
+        '''
+        Returns the (x, y) grid cells overlapped by a lightmap area.
+
+        :param pygame.Rect rect: The lightmap area.
+        '''
+
+        size = self._gridCellSize
+        return [(x, y)
+                for x in range(rect.left // size, (rect.right - 1) // size + 1)
+                for y in range(rect.top // size, (rect.bottom - 1) // size + 1)]
+
+    def _addToGrid(self, light, rect):
+
+        '''
+        Adds a light to each grid cell that its lightmap area overlaps.
+
+        :param pygamepal.Light light: The light to add.
+        :param pygame.Rect rect: The lightmap area of the light (ignored if None).
+        '''
+
+        if rect is None:
+            return
+        for cell in self._getGridCells(rect):
+            self._grid.setdefault(cell, set()).add(light)
+
+    def _removeFromGrid(self, light, rect):
+
+        '''
+        Removes a light from each grid cell that its lightmap area overlapped.
+
+        :param pygamepal.Light light: The light to remove.
+        :param pygame.Rect rect: The previous lightmap area of the light (ignored if None).
+        '''
+
+        if rect is None:
+            return
+        for cell in self._getGridCells(rect):
+            lights = self._grid.get(cell)
+            if lights is not None:
+                lights.discard(light)
+                if not lights:
+                    del self._grid[cell]
+
+    def _queryGrid(self, rect):
+
+        '''
+        Returns the set of drawn lights that overlap a lightmap area.
+
+        :param pygame.Rect rect: The lightmap area.
+        '''
+
+        found = set()
+        for cell in self._getGridCells(rect):
+            lights = self._grid.get(cell)
+            if lights is not None:
+                found.update(lights)
+        return {l for l in found if self._lightRects[l].colliderect(rect)}
+
+    def _quantizeRadius(self, radius):
+
+        '''
+        Returns the radius rounded to the nearest multiple of radiusQuantization.
+
+        :param float radius: The radius to round.
+        '''
+
+        if self.radiusQuantization <= 1:
+            return round(radius)
+        return round(radius / self.radiusQuantization) * self.radiusQuantization
+
+    def _getScaledMask(self, radius):
+
+        '''
+        Returns the light mask scaled to the radius given, scaling and caching it if required.
+
+        :param int radius: The (quantized) radius of the mask.
+        '''
+
+        mask = self._maskCache.get(radius)
+        if mask is not None:
+            self._maskCache.move_to_end(radius)
+            return mask
+
+        mask = pygame.transform.scale(self.lightMask, (radius * 2, radius * 2))
+        self._maskCache[radius] = mask
+        # remove the least recently used mask
+        if len(self._maskCache) > self.maskCacheSize:
+            self._maskCache.popitem(last = False)
+        return mask
 
     def addLight(self, light):
         
@@ -113,6 +724,38 @@ class Lighting:
         '''
         
         self.lights.append(light)
+        if light.name is not None:
+            self._namedLights.setdefault(light.name, light)
+
+    def removeLight(self, light):
+
+        '''
+        Removes a light from the lighting system.
+
+        :param pygamepal.Light: The light to remove.
+        '''
+
+        self.lights.remove(light)
+        self._forgetLight(light)
+
+    def _forgetLight(self, light):
+
+        '''
+        Removes any stored information about a light that is no longer in the lighting system.
+
+        :param pygamepal.Light: The removed light.
+        '''
+
+        if light in self._lightRects:
+            rect = self._lightRects.pop(light)
+            self._removeFromGrid(light, rect)
+            self._addDirtyRect(rect)
+        self._shadowKeys.pop(light, None)
+        self._shadowSurfaces.pop(light, None)
+        self._lightStyles.pop(light, None)
+        if light.name is not None and self._namedLights.get(light.name) is light:
+            # another light may share the same name
+            self._findLight(light.name)
 
     def getLight(self, name):
 
@@ -122,7 +765,35 @@ class Lighting:
         :param str name: The name of the light to get.
         '''
         
+        light = self._namedLights.get(name)
+        # lights added to the list directly aren't stored by name,
+        # and a light's name can be changed after it is stored
+        if light is None or light.name != name:
+            light = self._findLight(name)
+        return light
+
+    def _findLight(self, name):
+
+        '''
+        Finds the first light with a name, storing it by name. Returns None if no light exists.
+
+        :param str name: The name of the light to find.
+        '''
+
         for l in self.lights:
             if l.name == name:
+                self._namedLights[name] = l
                 return l
+        self._namedLights.pop(name, None)
         return None
+
+    def getLightsInRect(self, rect):
+
+        '''
+        Returns a list of the lights that are on and overlap an area of the surface.
+
+        :param (int, int, int, int) rect: The (x, y, w, h) area to check.
+        '''
+
+        self._refresh()
+        return list(self._queryGrid(self._toLightmapRect(rect)))
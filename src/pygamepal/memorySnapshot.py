@@ -0,0 +1,316 @@
+#
+# pygamepal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+
+import gc
+import sys
+import types
+import pygame
+from collections import deque
+
+# numpy is only required for entity worlds
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# containers whose items are checked
+_containerTypes = (list, tuple, set, frozenset, dict, deque)
+# objects that are never checked
+_ignoredTypes = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+                 types.MethodType, str, bytes, int, float, bool, type(None))
+# attributes that refer back to an owner, which aren't followed when
+# finding the objects in use by a game (so that, for example, a scene
+# kept alive only by its sprites' currentScene is reported as leaked)
+_backReferences = ('currentScene', 'previousScene', 'game', '_scene', '_sprite')
+# attributes that store cached textures
+_cacheAttributes = ('_maskCache', '_shadowSurfaces', '_glyphs', '_surfaces')
+
+class MemorySnapshot:
+
+    '''
+    Counts the live objects used by a game and their approximate size in bytes,
+    by category, for the whole program and for each scene. Objects that are still alive
+    but no longer used by the game (e.g. colliders and triggers of a scene that has been replaced,
+    which are kept in global lists) are reported as leaks.
+
+    Take snapshots before and after loading a scene, and compare them using diff(), e.g.:
+
+    ``before = pygamepal.MemorySnapshot(game)``
+
+    ``print(pygamepal.MemorySnapshot(game).diff(before))``
+
+    Sprites waiting in a pygamepal.SpritePool are counted as 'pooledSprites' rather than 'sprites',
+    and the size of each pygamepal.World includes the arrays storing its entities.
+    Each category has a dictionary containing its 'count' and 'bytes' in:
+
+    - totals: all live objects.
+    - scenes: the objects in each live scene, stored against the scene's class name.
+    - leaks: live objects not used by the game (if a game is given).
+
+    Sizes are approximate, and include surface pixels, but not the memory used by pygame and SDL themselves.
+    Taking a snapshot checks every object, and so can take some time for large games.
+
+    :param pygamepal.Game game: The game to find leaks for (default = None, which doesn't look for leaks).
+    :param bool collect: Run the garbage collector before counting, so that unreachable objects aren't counted (default = True).
+    '''
+
+    categories = ['scenes', 'sprites', 'pooledSprites', 'spritePools', 'colliders', 'triggers', 'buttons', 'lights', 'particles',
+                  'worlds', 'surfaces', 'cachedTextures']
+
+    def __init__(self, game = None, collect = True):
+
+        from pygamepal import Game, Scene, Sprite, SpritePool, Collider, Trigger, Button, Light, Particle, World, textCache
+
+        self._spriteType = Sprite
+        self._categoryTypes = [
+            (Scene, 'scenes'),
+            (Sprite, 'sprites'),
+            (SpritePool, 'spritePools'),
+            (Collider, 'colliders'),
+            (Trigger, 'triggers'),
+            (Button, 'buttons'),
+            (Light, 'lights'),
+            (Particle, 'particles'),
+            (World, 'worlds')
+        ]
+        self._worldType = World
+        self._gameType = Game
+
+        if collect:
+            gc.collect()
+
+        # all live objects are found from the global lists and caches, and any tracked pygamepal objects
+        globalRoots = [Collider._allColliders, Trigger._allTriggers, textCache]
+        globalRoots += [o for o in gc.get_objects()
+                        if type(o).__module__.startswith('pygamepal') or isinstance(o, (Game, Scene, Sprite))]
+        scenes = [o for o in globalRoots if isinstance(o, Scene)]
+
+        liveObjects = self._findObjects(globalRoots)
+        self.totals = self._getTotals(liveObjects)
+
+        # the objects in each scene, not including other scenes or the game
+        self.scenes = {}
+        for scene in scenes:
+            name = type(scene).__name__
+            i = 2
+            while name in self.scenes:
+                name = type(scene).__name__ + ' ' + str(i)
+                i += 1
+            sceneObjects = self._findObjects([scene], followBackReferences = False, stopAt = (Scene, Game))
+            self.scenes[name] = self._getTotals(sceneObjects)
+
+        # objects in use are those that can be reached from the game (or global caches)
+        self.leaks = {}
+        if game is not None:
+            usedObjects = self._findObjects([game, textCache], followBackReferences = False)
+            self.leaks = self._getTotals({k: v for k, v in liveObjects.items() if k not in usedObjects})
+
+    def diff(self, other):
+
+        '''
+        Returns the difference between this snapshot and an earlier one,
+        as a dictionary of 'totals', 'scenes' and 'leaks' (in the same format as a snapshot),
+        containing the change in count and bytes for each category.
+
+        :param pygamepal.MemorySnapshot other: The earlier snapshot.
+        '''
+
+        return {
+            'totals': _diffTotals(self.totals, other.totals),
+            'scenes': {name: _diffTotals(self.scenes.get(name, {}), other.scenes.get(name, {}))
+                       for name in list(other.scenes) + [s for s in self.scenes if s not in other.scenes]},
+            'leaks': _diffTotals(self.leaks, other.leaks)
+        }
+
+    def report(self):
+
+        '''
+        Returns a table of counts and sizes (in KB) for each category,
+        with columns for the totals, leaks and each scene.
+        '''
+
+        columns = [('total', self.totals)]
+        if len(self.leaks) > 0:
+            columns.append(('leaked', self.leaks))
+        columns += list(self.scenes.items())
+
+        widths = [max(14, len(name) + 2) for name, _ in columns]
+        lines = ['{:<16}'.format('') + ''.join('{:>{}}'.format(name, w) for (name, _), w in zip(columns, widths))]
+        for category in self.categories:
+            line = '{:<16}'.format(category)
+            for (_, totals), w in zip(columns, widths):
+                values = totals.get(category, {'count': 0, 'bytes': 0})
+                line += '{:>{}}'.format('{} ({:.1f}KB)'.format(values['count'], values['bytes'] / 1024), w)
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.report()
+
+    #
+    # finding objects
+    #
+
+    def _findObjects(self, roots, followBackReferences = True, stopAt = ()):
+
+        '''
+        Returns a dictionary of the objects that can be reached from the roots,
+        storing the (category, bytes) of each object against its id
+        (with a category of None for objects that aren't counted).
+
+        :param list roots: The objects to start from.
+        :param bool followBackReferences: Follow attributes that refer back to an owner (default = True).
+        :param tuple stopAt: Types of (non-root) objects not to check (default = ()).
+        '''
+
+        found = {}
+        # (object, inCache) pairs still to check
+        stack = [(root, False) for root in roots]
+        rootIds = set(id(root) for root in roots)
+
+        while len(stack) > 0:
+            obj, inCache = stack.pop()
+            if id(obj) in found or isinstance(obj, _ignoredTypes):
+                continue
+            if id(obj) not in rootIds and isinstance(obj, stopAt):
+                continue
+
+            # surfaces (and the surfaces they are part of) aren't checked further
+            if isinstance(obj, pygame.Surface):
+                found[id(obj)] = ('cachedTextures' if inCache else 'surfaces', self._getSurfaceSize(obj, found))
+                continue
+
+            if isinstance(obj, _containerTypes):
+                found[id(obj)] = (None, 0)
+                if isinstance(obj, dict):
+                    stack.extend((v, inCache) for v in obj.values())
+                    stack.extend((k, inCache) for k in obj.keys() if not isinstance(k, _ignoredTypes))
+                else:
+                    # (tuple subclasses such as pygame's key states can't always be iterated directly)
+                    items = tuple.__iter__(obj) if isinstance(obj, tuple) else obj
+                    stack.extend((item, inCache) for item in items)
+                continue
+
+            # (numpy arrays are counted as part of the world that stores them,
+            # but any objects stored in them, such as images, are still checked)
+            if numpy is not None and isinstance(obj, numpy.ndarray):
+                found[id(obj)] = (None, 0)
+                if obj.dtype == object:
+                    stack.extend((item, inCache) for item in {id(item): item for item in obj.ravel().tolist()}.values())
+                continue
+
+            attributes = getattr(obj, '__dict__', None)
+            if not isinstance(attributes, dict):
+                found[id(obj)] = (None, 0)
+                continue
+            category = self._getCategory(obj)
+            found[id(obj)] = (category, 0 if category is None else self._getObjectSize(obj))
+            # (a game's current and previous scenes aren't back references)
+            skipBackReferences = not followBackReferences and not isinstance(obj, self._gameType)
+            for name, value in attributes.items():
+                if skipBackReferences and name in _backReferences:
+                    continue
+                stack.append((value, inCache or name in _cacheAttributes))
+
+        return found
+
+    def _getCategory(self, obj):
+
+        '''
+        Returns the category of an object, or None if it isn't counted.
+
+        :param obj: The object.
+        '''
+
+        if isinstance(obj, self._spriteType) and getattr(obj, '_inPool', False):
+            return 'pooledSprites'
+        for categoryType, category in self._categoryTypes:
+            if isinstance(obj, categoryType):
+                return category
+        return None
+
+    def _getObjectSize(self, obj):
+
+        '''
+        Returns the approximate size of an object in bytes,
+        including its attributes (but not objects they refer to).
+
+        :param obj: The object.
+        '''
+
+        attributes = vars(obj)
+        size = sys.getsizeof(obj) + sys.getsizeof(attributes)
+        for value in attributes.values():
+            if isinstance(value, (_containerTypes, pygame.Rect, pygame.math.Vector2, pygame.Color)):
+                size += sys.getsizeof(value)
+        if isinstance(obj, self._worldType):
+            size += self._getWorldStorageSize(obj)
+        return size
+
+    def _getWorldStorageSize(self, world):
+
+        '''
+        Returns the approximate size of the arrays and locations storing a world's entities, in bytes.
+
+        :param pygamepal.World world: The world.
+        '''
+
+        size = 0
+        for archetype in world._archetypes.values():
+            size += sys.getsizeof(archetype) + sys.getsizeof(vars(archetype)) + archetype.entities.nbytes
+            size += sum(column.nbytes for column in archetype.columns.values())
+        # each entity's (archetype, row) location
+        size += len(world._locations) * sys.getsizeof((None, 0))
+        return size
+
+    def _getSurfaceSize(self, surface, found):
+
+        '''
+        Returns the approximate size of a surface in bytes.
+        A subsurface includes the pixels of its parent surface, unless already counted.
+
+        :param pygame.Surface surface: The surface.
+        :param dict found: The objects already found.
+        '''
+
+        size = sys.getsizeof(surface)
+        parent = surface.get_abs_parent()
+        if parent is surface:
+            return size + surface.get_pitch() * surface.get_height()
+        if id(parent) not in found:
+            found[id(parent)] = (None, 0)
+            size += parent.get_pitch() * parent.get_height()
+        return size
+
+    def _getTotals(self, objects):
+
+        '''
+        Returns the count and bytes of each category of objects.
+
+        :param dict objects: The (category, bytes) of each object, stored against its id.
+        '''
+
+        totals = {category: {'count': 0, 'bytes': 0} for category in self.categories}
+        for category, size in objects.values():
+            if category is not None:
+                totals[category]['count'] += 1
+                totals[category]['bytes'] += size
+        return totals
+
+def _diffTotals(totals, otherTotals):
+
+    '''
+    Returns the change in count and bytes of each category between two totals.
+
+    :param dict totals: The later totals.
+    :param dict otherTotals: The earlier totals.
+    '''
+
+    empty = {'count': 0, 'bytes': 0}
+    return {category: {key: totals.get(category, empty)[key] - otherTotals.get(category, empty)[key]
+                       for key in ('count', 'bytes')}
+            for category in MemorySnapshot.categories}
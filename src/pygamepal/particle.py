@@ -54,6 +54,31 @@ class Particle():
             self.position[1] + self.velocity[1] * deltaTime 
         )
 
+    def _advance(self, steps, deltaTime = 1):
+
+        '''
+        Advances the particle by a number of update steps at once, giving the same
+        result as calling update() once per step.
+
+        :param int steps: The number of update steps to advance.
+        :param float deltaTime: The time of each step (default = 1).
+        '''
+
+        elapsed = steps * deltaTime
+        # velocity is updated before position in each step
+        accelerationFactor = deltaTime * deltaTime * steps * (steps + 1) / 2
+
+        self.size -= self.sizeDecay * elapsed
+        self.lifetime -= elapsed
+        self.position = (
+            self.position[0] + self.velocity[0] * elapsed + self.acceleration[0] * accelerationFactor,
+            self.position[1] + self.velocity[1] * elapsed + self.acceleration[1] * accelerationFactor
+        )
+        self.velocity = (
+            self.velocity[0] + self.acceleration[0] * elapsed,
+            self.velocity[1] + self.acceleration[1] * elapsed
+        )
+
     def draw(self, surface):
 
         '''
@@ -5,6 +5,7 @@
 #  -- run 'pip install pygamepal' to use
 #
 
+import math
 import random
 from .particle import Particle
 
@@ -26,7 +27,9 @@ class ParticleEmitter():
     :param int emitterLifetime: The emitter only emits particles during its lifetime (-1 = forever, default = 100).
     :param (float, float) emitterVelocity: The (x, y) velocity of the emitter (default = no velocity (0, 0)).
     :param (float, float) emitterAcceleration: The (x, y) acceleration of the emitter (default = no acceleration (0, 0)).
-    :param float emitterParticleDelay: The delay between particles emitted (default = 5).
+    :param float emitterParticleDelay: The delay between particles emitted (default = 5). More than one particle is emitted in a single update if deltaTime exceeds the delay.
+    :param int seed: Seed for the emitter's random number generator, so that emitted particles can be reproduced (default = None, which takes a seed from Python's random module).
+    :param float fixedTimeStep: If specified, each update is split into fixed substeps of this size, with any remaining time carried over to the next update (default = None).
 
     Particle attributes:
 
@@ -56,7 +59,10 @@ class ParticleEmitter():
         particleLifetime = 100,
         particleSize = 20,
         particleSizeDecay = 0.2,
-        particleColors = ['white']
+        particleColors = ['white'],
+        # simulation attributes
+        seed = None,
+        fixedTimeStep = None
     ):
         
         self.particleList = []
@@ -79,6 +85,21 @@ class ParticleEmitter():
         self.timeSinceLastParticle = 0
         self.particleColors = particleColors
 
+        # each emitter has its own random number generator,
+        # so that a seeded emitter always behaves the same
+        # (without a seed, one is taken from the random module,
+        # so that seeding the random module seeds the emitter)
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # time accumulated towards the next emitted particle
+        self._emitAccumulator = 0
+        # time accumulated towards the next fixed substep
+        self.fixedTimeStep = fixedTimeStep
+        self._stepAccumulator = 0
+
         # this is set to true once the emitter lifetime is reached
         self.finished = False
     
@@ -92,7 +113,119 @@ class ParticleEmitter():
 
         if self.finished:
             return
-        
+
+        # variable step
+        if self.fixedTimeStep is None:
+            self._step(deltaTime)
+            return
+
+        # fixed substeps, carrying any remaining time over to the next update
+        self._stepAccumulator += deltaTime
+        while self._stepAccumulator >= self.fixedTimeStep and not self.finished:
+            self._stepAccumulator -= self.fixedTimeStep
+            self._step(self.fixedTimeStep)
+
+    def prewarm(self, duration, deltaTime = None):
+
+        '''
+        Fast-forwards the emitter by the duration specified, as if update() had been called
+        repeatedly. Particle positions are calculated directly rather than simulated step by step,
+        and only particles still alive at the end of the duration are created.
+
+        :param float duration: The amount of time to fast-forward.
+        :param float deltaTime: The size of each (virtual) update step (default = None, which uses fixedTimeStep, or 1 if not set).
+        '''
+
+        if self.finished:
+            return
+
+        if deltaTime is None:
+            deltaTime = self.fixedTimeStep if self.fixedTimeStep is not None else 1
+
+        steps = int(duration // deltaTime)
+        if steps <= 0:
+            return
+
+        #
+        # calculate how many of the steps emit particles
+        #
+
+        if self.lifetime == -1:
+            emittingSteps = steps
+        elif self.lifetime > 0:
+            emittingSteps = min(steps, math.ceil(self.lifetime / deltaTime) - 1)
+        else:
+            emittingSteps = 0
+
+        # the step (from 1) at which particle number i (from 1) is emitted
+        if self.particleDelay <= 0:
+            emitted = emittingSteps
+            emitStep = lambda i: i
+        else:
+            emitted = int((self._emitAccumulator + emittingSteps * deltaTime) // self.particleDelay)
+            emitStep = lambda i: max(1, math.ceil((i * self.particleDelay - self._emitAccumulator) / deltaTime))
+
+        #
+        # create the particles that are still alive, newest first
+        #
+
+        emitSteps = []
+        i = emitted
+        while i > 0:
+            k = emitStep(i)
+            age = (steps - k + 1) * deltaTime
+            if age >= self.particleLifetime or self.particleSize - self.sizeDecay * age <= 0:
+                break
+            emitSteps.append(k)
+            i -= 1
+
+        # advance existing particles
+        for p in self.particleList:
+            p._advance(steps, deltaTime)
+
+        # emit surviving particles in order, from the emitter position at the time of emitting
+        for k in reversed(emitSteps):
+            position = (
+                self.position[0] + k * self.velocity[0] * deltaTime + self.acceleration[0] * deltaTime * deltaTime * k * (k + 1) / 2,
+                self.position[1] + k * self.velocity[1] * deltaTime + self.acceleration[1] * deltaTime * deltaTime * k * (k + 1) / 2
+            )
+            particle = self._emitParticles(1, position)[0]
+            particle._advance(steps - k + 1, deltaTime)
+
+        self.particleList = [p for p in self.particleList if p.size > 0 and p.lifetime > 0]
+
+        #
+        # update this particle emitter
+        #
+
+        if self.lifetime > 0:
+            self.lifetime -= min(steps, math.ceil(self.lifetime / deltaTime)) * deltaTime
+
+        self.position = (
+            self.position[0] + steps * self.velocity[0] * deltaTime + self.acceleration[0] * deltaTime * deltaTime * steps * (steps + 1) / 2,
+            self.position[1] + steps * self.velocity[1] * deltaTime + self.acceleration[1] * deltaTime * deltaTime * steps * (steps + 1) / 2
+        )
+        self.velocity = (self.velocity[0] + self.acceleration[0] * steps * deltaTime,
+                         self.velocity[1] + self.acceleration[1] * steps * deltaTime)
+
+        if emitted > 0:
+            self.timeSinceLastParticle = (steps - emitStep(emitted)) * deltaTime
+        else:
+            self.timeSinceLastParticle += steps * deltaTime
+        if self.particleDelay > 0:
+            self._emitAccumulator += emittingSteps * deltaTime - emitted * self.particleDelay
+
+        if self.lifetime > -1 and self.lifetime <= 0 and len(self.particleList) == 0:
+            self.finished = True
+
+    def _step(self, deltaTime):
+
+        '''
+        Advances the emitter and its particles by a single step.
+
+        :param float deltaTime: The time elapsed since the last step.
+        '''
+
         #
         # update this particle emitter
         #
@@ -111,41 +244,64 @@ class ParticleEmitter():
         # emit more particles
         #
 
-        self.timeSinceLastParticle += 1
+        self.timeSinceLastParticle += deltaTime
 
         if self.lifetime > -1 and self.lifetime <= 0 and len(self.particleList) == 0:
             self.finished = True
 
-        # create new particles
-        if self.timeSinceLastParticle >= self.particleDelay and (self.lifetime == -1 or self.lifetime > 0):
-
-            self.timeSinceLastParticle = 0
-
-            # choose random acceleration, velocity and position between limits
-            randomAcceleration = (random.uniform(self.particleAccelerationMin[0], self.particleAccelerationMax[0]),
-                                  random.uniform(self.particleAccelerationMin[1], self.particleAccelerationMax[1]))
-            randomVelocity = (random.uniform(self.particleVelocityMin[0], self.particleVelocityMax[0]),
-                              random.uniform(self.particleVelocityMin[1], self.particleVelocityMax[1]))
-            # particle can emit from anywhere within the emitter bounds
-            randomPosition = (random.uniform(self.position[0], self.position[0] + self.size[0]),
-                              random.uniform(self.position[1], self.position[1] + self.size[1]))
-            
-            # add new particle to the list
-            self.particleList.append(Particle(
+        # create new particles, emitting as many as the elapsed time allows
+        if self.lifetime == -1 or self.lifetime > 0:
+
+            if self.particleDelay <= 0:
+                count = 1
+            else:
+                self._emitAccumulator += deltaTime
+                count = int(self._emitAccumulator // self.particleDelay)
+                self._emitAccumulator -= count * self.particleDelay
+
+            if count > 0:
+                self.timeSinceLastParticle = 0
+                self._emitParticles(count)
+
+        # update each particle, removing any that have expired
+        for p in self.particleList:
+            p.update(deltaTime)
+        self.particleList = [p for p in self.particleList if p.size > 0 and p.lifetime > 0]
+
+    def _emitParticles(self, count, position = None):
+
+        '''
+        Creates a batch of new particles, and returns them.
+
+        :param int count: The number of particles to create.
+        :param (float, float) position: The emitter position to emit from (default = None, which uses the current position).
+        '''
+
+        if position is None:
+            position = self.position
+
+        rng = self.rng
+        newParticles = [
+            Particle(
                 lifetime = self.particleLifetime,
-                acceleration = randomAcceleration,
-                position = randomPosition,
-                velocity = randomVelocity,
-                color = random.choice(self.particleColors),
+                # choose random acceleration, velocity and position between limits
+                acceleration = (rng.uniform(self.particleAccelerationMin[0], self.particleAccelerationMax[0]),
+                                rng.uniform(self.particleAccelerationMin[1], self.particleAccelerationMax[1])),
+                velocity = (rng.uniform(self.particleVelocityMin[0], self.particleVelocityMax[0]),
+                            rng.uniform(self.particleVelocityMin[1], self.particleVelocityMax[1])),
+                # particle can emit from anywhere within the emitter bounds
+                position = (rng.uniform(position[0], position[0] + self.size[0]),
+                            rng.uniform(position[1], position[1] + self.size[1])),
+                color = rng.choice(self.particleColors),
                 size = self.particleSize,
                 sizeDecay = self.sizeDecay
-            ))
+            )
+            for _ in range(count)
+        ]
 
-        # update each particle
-        for p in self.particleList:
-            p.update(deltaTime)
-            if p.size <= 0 or p.lifetime <= 0:
-                self.particleList.remove(p)
+        # add new particles to the list
+        self.particleList.extend(newParticles)
+        return newParticles
 
     def draw(self, surface):
 
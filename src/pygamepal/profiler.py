@@ -0,0 +1,232 @@
+#
+# pygamepal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+
+import pygame
+import math
+import sys
+from collections import deque
+from time import perf_counter
+
+class Profiler:
+
+    '''
+    Times each phase of a game's frames, keeping the timings of recent frames
+    so that percentiles can be calculated. Set a game's profiler to start profiling, e.g.:
+
+    ``game.profiler = pygamepal.Profiler()``
+
+    The phases timed are:
+
+    - 'events': getting pygame events and mouse state.
+    - 'input': updating the game input and actions.
+    - 'update': the user-defined game and scene update() methods.
+    - 'sort': sorting scene sprites.
+    - 'colliders': updating scene colliders, triggers and buttons.
+    - 'sprites': updating scene sprites and world entities.
+    - 'lighting': updating and drawing scene lighting.
+    - 'draw': drawing the scene and the user-defined draw() methods.
+    - 'camera': updating and drawing (scaling) the scene camera.
+    - 'flip': updating the display.
+
+    :param int frames: The number of recent frames to keep timings for (default = 300).
+    :param bool countAllocations: Also count the net memory blocks allocated (allocated minus freed) in each phase. This can be slow for games with many objects (default = False).
+    :param bool showOverlay: Draw the timings on top of the game each frame (default = False).
+    '''
+
+    phases = ['events', 'input', 'update', 'sort', 'colliders', 'sprites', 'lighting', 'draw', 'camera', 'flip']
+
+    # record a span for each sprite update (used by pygamepal.Tracer)
+    traceSprites = False
+
+    def __init__(self, frames = 300, countAllocations = False, showOverlay = False):
+
+        self.frames = frames
+        self.countAllocations = countAllocations
+        self.showOverlay = showOverlay
+
+        # the total time and allocations for each phase
+        # of recent frames (including the whole frame)
+        self._times = {phase: deque(maxlen = frames) for phase in self.phases + ['frame']}
+        self._allocations = {phase: deque(maxlen = frames) for phase in self.phases + ['frame']}
+
+        # totals for the current frame
+        self._frameTimes = dict.fromkeys(self.phases, 0)
+        self._frameAllocations = dict.fromkeys(self.phases, 0)
+        self._frameStart = None
+
+        # the start time and allocated blocks of each running phase
+        self._starts = {}
+
+        # the blocks allocated by timing an empty phase,
+        # which are removed from allocation counts
+        self._allocationOverhead = 0
+        if countAllocations:
+            overheads = []
+            for _ in range(10):
+                self._frameAllocations['events'] = 0
+                self.start('events')
+                self.stop('events')
+                overheads.append(self._frameAllocations['events'])
+            self._allocationOverhead = min(overheads)
+            self._frameAllocations['events'] = 0
+
+    #
+    # timing
+    #
+
+    def startFrame(self):
+
+        '''
+        Starts timing a frame. Called automatically for game profilers.
+        '''
+
+        for phase in self.phases:
+            self._frameTimes[phase] = 0
+            self._frameAllocations[phase] = 0
+        self._frameStart = (perf_counter(), sys.getallocatedblocks() if self.countAllocations else 0)
+
+    def endFrame(self):
+
+        '''
+        Stops timing a frame, and stores the frame's timings. Called automatically for game profilers.
+        '''
+
+        if self._frameStart is None:
+            return
+        startTime, startBlocks = self._frameStart
+        self._times['frame'].append(perf_counter() - startTime)
+        self._allocations['frame'].append(sys.getallocatedblocks() - startBlocks if self.countAllocations else 0)
+        for phase in self.phases:
+            self._times[phase].append(self._frameTimes[phase])
+            self._allocations[phase].append(self._frameAllocations[phase])
+        self._frameStart = None
+
+    def start(self, phase):
+
+        '''
+        Starts timing a phase of the current frame.
+
+        :param str phase: The phase to time.
+        '''
+
+        self._starts[phase] = (perf_counter(), sys.getallocatedblocks() if self.countAllocations else 0)
+
+    def stop(self, phase):
+
+        '''
+        Stops timing a phase of the current frame, adding the time to the phase total.
+
+        :param str phase: The phase to stop timing.
+        '''
+
+        startTime, startBlocks = self._starts.pop(phase)
+        self._frameTimes[phase] += perf_counter() - startTime
+        if self.countAllocations:
+            self._frameAllocations[phase] += sys.getallocatedblocks() - startBlocks - self._allocationOverhead
+
+    def startSpan(self, name):
+
+        '''
+        Starts a named span of time within the current frame, such as a scene update.
+        Spans aren't included in the phase timings, but are recorded by pygamepal.Tracer.
+
+        :param str name: The span name.
+        '''
+
+        pass
+
+    def stopSpan(self):
+
+        '''
+        Stops the most recently started span.
+        '''
+
+        pass
+
+    #
+    # results
+    #
+
+    def getStats(self):
+
+        '''
+        Returns a dictionary of timings for each phase (and the whole 'frame') over recent frames.
+        Each phase has a dictionary containing 'mean', 'p50', 'p95' and 'p99' times (in milliseconds),
+        and 'allocations' (the mean net number of memory blocks allocated per frame, if counted).
+        '''
+
+        stats = {}
+        for phase in ['frame'] + self.phases:
+            times = sorted(self._times[phase])
+            if len(times) == 0:
+                stats[phase] = {'mean': 0, 'p50': 0, 'p95': 0, 'p99': 0, 'allocations': 0}
+                continue
+            stats[phase] = {
+                'mean': sum(times) / len(times) * 1000,
+                'p50': _percentile(times, 50) * 1000,
+                'p95': _percentile(times, 95) * 1000,
+                'p99': _percentile(times, 99) * 1000,
+                'allocations': sum(self._allocations[phase]) / len(times)
+            }
+        return stats
+
+    def reset(self):
+
+        '''
+        Clears all stored timings.
+        '''
+
+        for phase in self._times:
+            self._times[phase].clear()
+            self._allocations[phase].clear()
+
+    def draw(self, surface, position = (10, 10), color = 'white', backgroundColor = (0, 0, 0, 180)):
+
+        '''
+        Draws a table of phase timings (in milliseconds).
+        Called automatically for game profilers if showOverlay is True.
+
+        :param pygame.Surface surface: The surface to draw to.
+        :param (int, int) position: The top-left (x, y) position of the table (default = (10, 10)).
+        :param pygame.Color color: The text color (default = 'white').
+        :param pygame.Color backgroundColor: The background color (default = (0, 0, 0, 180)).
+        '''
+
+        from pygamepal import drawText, smallFont
+
+        stats = self.getStats()
+        rows = [['ms', 'p50', 'p95', 'p99'] + (['allocs'] if self.countAllocations else [])]
+        for phase, phaseStats in stats.items():
+            row = [phase] + ['{:.2f}'.format(phaseStats[p]) for p in ('p50', 'p95', 'p99')]
+            if self.countAllocations:
+                row.append('{:.0f}'.format(phaseStats['allocations']))
+            rows.append(row)
+
+        # draw each column of text separately, so that they line up
+        padding = 4
+        lineHeight = smallFont.get_linesize()
+        columnWidths = [max(smallFont.size(row[i])[0] for row in rows) + padding * 2 for i in range(len(rows[0]))]
+        background = pygame.Surface((sum(columnWidths) + padding, lineHeight * len(rows) + padding * 2), pygame.SRCALPHA)
+        background.fill(backgroundColor)
+        surface.blit(background, position)
+        for r, row in enumerate(rows):
+            x = position[0] + padding
+            for text, columnWidth in zip(row, columnWidths):
+                drawText(surface, text, (x, position[1] + padding + r * lineHeight), font = smallFont, color = color)
+                x += columnWidth
+
+def _percentile(sortedValues, percentile):
+
+    '''
+    Returns a percentile of a sorted list of values (using the nearest rank).
+
+    :param list sortedValues: The sorted values.
+    :param float percentile: The percentile to return (0-100).
+    '''
+
+    index = max(0, min(len(sortedValues) - 1, math.ceil(len(sortedValues) * percentile / 100) - 1))
+    return sortedValues[index]
@@ -0,0 +1,132 @@
+#
+# pygamepal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+
+#
+# reading and writing game input recordings
+# (used by pygamepal.Game)
+#
+# a recording is a gzipped binary file containing a header,
+# followed by one record per frame:
+#   - header: identifier, version, random seed, fps and tick rate
+#   - frame: deltaTime, mouse position, mouse buttons and the number of events,
+#     followed by each event's type and attributes (as JSON)
+#
+
+import gzip
+import json
+import struct
+import pygame
+
+_identifier = b'PGPREC'
+_version = 1
+
+_headerFormat = struct.Struct('<6sBqdd')
+_frameFormat = struct.Struct('<diiBBH')
+_eventFormat = struct.Struct('<IH')
+
+# event attribute types that can be recorded
+_recordableTypes = (bool, int, float, str, type(None))
+
+def _openRecording(filename, seed, fps, tickRate):
+
+    '''
+    Creates a recording file and writes its header, returning the open file.
+
+    :param str filename: The file to record to.
+    :param int seed: The random seed used during the recording.
+    :param int fps: The game fps.
+    :param int tickRate: The game tick rate.
+    '''
+
+    file = gzip.open(filename, 'wb')
+    file.write(_headerFormat.pack(_identifier, _version, seed, fps, tickRate))
+    return file
+
+def _openReplay(filename):
+
+    '''
+    Opens a recording to replay, returning the open file, random seed, fps and tick rate.
+
+    :param str filename: The recording to replay.
+    '''
+
+    file = gzip.open(filename, 'rb')
+    data = file.read(_headerFormat.size)
+    if len(data) < _headerFormat.size:
+        file.close()
+        raise ValueError('Not a pygamepal recording: ' + str(filename))
+    identifier, version, seed, fps, tickRate = _headerFormat.unpack(data)
+    if identifier != _identifier or version != _version:
+        file.close()
+        raise ValueError('Not a pygamepal recording: ' + str(filename))
+    return file, seed, fps, tickRate
+
+def _isRecordable(value):
+
+    '''
+    Returns true if an event attribute value can be recorded.
+
+    :param value: The value to check.
+    '''
+
+    if isinstance(value, (tuple, list)):
+        return all(isinstance(v, _recordableTypes) for v in value)
+    return isinstance(value, _recordableTypes)
+
+def _writeFrame(file, deltaTime, events, mouseButtons, mousePosition):
+
+    '''
+    Writes a single frame of input to a recording.
+
+    :param file: The open recording file.
+    :param float deltaTime: The frame's delta time.
+    :param list events: The frame's pygame events.
+    :param tuple mouseButtons: The mouse button states.
+    :param (int, int) mousePosition: The mouse position.
+    '''
+
+    buttonBits = 0
+    for i, down in enumerate(mouseButtons):
+        if down:
+            buttonBits |= 1 << i
+    data = [_frameFormat.pack(deltaTime, int(mousePosition[0]), int(mousePosition[1]),
+                              len(mouseButtons), buttonBits, len(events))]
+    for event in events:
+        # attributes that can't be recorded (such as windows) are skipped
+        attributes = {k: v for k, v in event.dict.items() if _isRecordable(v)}
+        attributes = json.dumps(attributes, separators=(',', ':')).encode()
+        data.append(_eventFormat.pack(event.type, len(attributes)))
+        data.append(attributes)
+    file.write(b''.join(data))
+
+def _readFrame(file):
+
+    '''
+    Reads a single frame of input from a recording,
+    returning (deltaTime, events, mouseButtons, mousePosition),
+    or None at the end of the recording.
+
+    :param file: The open recording file.
+    '''
+
+    data = file.read(_frameFormat.size)
+    if len(data) < _frameFormat.size:
+        return None
+    deltaTime, x, y, buttonCount, buttonBits, eventCount = _frameFormat.unpack(data)
+    mouseButtons = tuple(buttonBits & (1 << i) != 0 for i in range(buttonCount))
+
+    events = []
+    for _ in range(eventCount):
+        eventType, size = _eventFormat.unpack(file.read(_eventFormat.size))
+        attributes = json.loads(file.read(size))
+        # JSON stores tuples (such as positions) as lists
+        for k, v in attributes.items():
+            if isinstance(v, list):
+                attributes[k] = tuple(v)
+        events.append(pygame.event.Event(eventType, attributes))
+
+    return deltaTime, events, mouseButtons, (x, y)
@@ -6,6 +6,9 @@
 #
 
 import pygame
+import warnings
+from collections.abc import Sequence
+from .globals import _callUpdate
 
 class Scene:
 
@@ -103,8 +106,15 @@ class Scene:
         self.camera = Camera(position=(0, 0), size=game.size, target=(self.game.size[0] / 2, self.game.size[1] / 2))
         # sort sprites by their z (depth) value
         self.sortKey = Scene.sortByLayer
-        # a list of the sprites added to the scene
-        self.sprites = []
+        # a list of the sprites added to the scene, in draw order
+        self._sprites = []
+        # the sprites in the scene, for fast membership checks
+        self._spriteSet = set()
+        # sprites removed from the scene but not yet removed from the list,
+        # which are removed together (at most once per update)
+        self._removedSprites = set()
+        # a read-only view of the sprite list, returned by the sprites property
+        self._spritesView = _SpriteList(self)
 
         self._colliders = []
         self._triggers = []
@@ -112,6 +122,9 @@ class Scene:
         
         self.lighting = Lighting(self.surfaceSize, lightLevel = 1)
 
+        # an optional pygamepal.World, for large numbers of simple entities
+        self.world = None
+
         # run the user-defined sprite init() method
         self.init()
 
@@ -162,21 +175,62 @@ class Scene:
         '''
         self._buttons.remove(button)
 
-    def _update(self):
+    def _storePreviousState(self):
+
+        '''
+        Stores the sprite and camera states before an update, so that
+        drawing can be interpolated between the previous and current states.
+        '''
+
+        if self.camera is not None:
+            self.camera._storePreviousState()
+        self._compactSprites()
+        for sprite in self._sprites:
+            sprite._previousPosition = pygame.math.Vector2(sprite._position)
+
+    def _compactSprites(self):
+
+        '''
+        Removes any sprites removed from the scene from the sprite list.
+        '''
+
+        if len(self._removedSprites) > 0:
+            removedSprites = self._removedSprites
+            # (a new list is created, so that any loop over the old list isn't affected)
+            self._sprites = [s for s in self._sprites if s not in removedSprites]
+            self._removedSprites = set()
+
+    def _update(self, deltaTime = 1):
 
         '''
         Internal update method, called automatically once per frame.
+
+        :param float deltaTime: Time elapsed since the last update (default = 1).
         '''
 
         from pygamepal import Trigger, Collider
 
+        profiler = self.game.profiler
+        if profiler is not None:
+            profiler.startSpan('scene update (' + type(self).__name__ + ')')
+
         # update the frame counter
         self.frame += 1
         # update the scene camera
         if self.camera is not None:
-            self.camera.update()
+            if profiler is not None:
+                profiler.start('camera')
+            self.camera.update(deltaTime)
+            if profiler is not None:
+                profiler.stop('camera')
         # sort the sprites
-        self.sprites.sort(key=self.sortKey)
+        if profiler is not None:
+            profiler.start('sort')
+        self._compactSprites()
+        self._sprites.sort(key=self.sortKey)
+        if profiler is not None:
+            profiler.stop('sort')
+            profiler.start('colliders')
 
         #
         # set scene for colliders
@@ -190,7 +244,7 @@ class Scene:
 
         # set the sprite collider's scene for all sprites
         # in the current scene
-        for sprite in self.sprites:
+        for sprite in self._sprites:
             if hasattr(sprite, 'collider') and sprite.collider is not None:
                 sprite.collider._scene = self
 
@@ -202,11 +256,11 @@ class Scene:
         # by the scene
         for trigger in self._triggers:
             trigger._scene = self
-            trigger.update()
+            trigger.update(deltaTime)
         
         # set the sprite trigger's scene for all sprites
         # in the current scene
-        for sprite in self.sprites:
+        for sprite in self._sprites:
             if hasattr(sprite, 'trigger') and sprite.trigger is not None:
                 sprite.trigger._scene = self
         
@@ -220,33 +274,80 @@ class Scene:
             button._scene = self
             button.update()
 
+        if profiler is not None:
+            profiler.stop('colliders')
+            profiler.start('sprites')
+
         # update each sprite in the scene
-        for s in self.sprites:
-            s._update()
+        # (skipping any removed during this update)
+        spriteSet = self._spriteSet
+        if profiler is not None and profiler.traceSprites:
+            for s in self._sprites:
+                if s in spriteSet:
+                    profiler.startSpan(type(s).__name__)
+                    s._update(deltaTime)
+                    profiler.stopSpan()
+        else:
+            for s in self._sprites:
+                if s in spriteSet:
+                    s._update(deltaTime)
+
+        # update the world entities
+        if self.world is not None:
+            self.world.update(deltaTime)
+
+        if profiler is not None:
+            profiler.stop('sprites')
+            profiler.start('lighting')
 
         # update the lighting
-        self.lighting.update()
+        self.lighting.update(deltaTime)
+
+        if profiler is not None:
+            profiler.stop('lighting')
+            profiler.start('update')
 
         # call the user-defined update() method
-        self.update()
+        _callUpdate(self.update, deltaTime)
+
+        # remove sprites removed during the update, before drawing
+        self._compactSprites()
+
+        if profiler is not None:
+            profiler.stop('update')
+            profiler.stopSpan()
 
-    def _draw(self):
+    def _draw(self, interpolation = 1):
 
         '''
         Internal draw method, called automatically once per frame.
+
+        :param float interpolation: How far between the previous and current update states to draw sprites and the camera (0-1, default = 1).
         '''
 
         from pygamepal import DEBUG
 
+        profiler = self.game.profiler
+        if profiler is not None:
+            profiler.startSpan('scene draw (' + type(self).__name__ + ')')
+            profiler.start('draw')
+
         # clear the surfaces
         self.sceneSurface.fill(self.backgroundColor)
         self.overlaySurface.fill((0, 0, 0, 0))
         # call the user-defined draw() method
         self.draw()
 
-        # draw each scene sprite
-        for sprite in self.sprites:
-            sprite._draw(self.sceneSurface)
+        # draw the world entities and each scene sprite
+        world = self.world
+        viewRect = self.camera.getViewRect(interpolation) if self.camera is not None else None
+        if world is not None and not world.aboveSprites:
+            world.draw(self.sceneSurface, viewRect)
+        self._compactSprites()
+        for sprite in self._sprites:
+            sprite._draw(self.sceneSurface, interpolation)
+        if world is not None and world.aboveSprites:
+            world.draw(self.sceneSurface, viewRect)
 
         # draw each button
         for button in self._buttons:
@@ -261,16 +362,39 @@ class Scene:
             # draw scene colliders
             for collider in self._colliders:
                 collider.draw(self.sceneSurface)
+
+        if profiler is not None:
+            profiler.stop('draw')
+            profiler.start('lighting')
         
-        # draw the lighting onto the scene screen
-        self.lighting.draw(self.sceneSurface)
+        # scene colliders block shadow casting lights
+        self.lighting.colliders = self._colliders
+
+        # draw the lighting onto the scene screen,
+        # only where it can be seen by the camera
+        if self.camera is not None:
+            self.lighting.draw(self.sceneSurface, [viewRect])
+        else:
+            self.lighting.draw(self.sceneSurface)
+
+        if profiler is not None:
+            profiler.stop('lighting')
+            profiler.start('camera')
 
         # use the camera to draw the scene
         if self.camera is not None:
-            self.camera.draw(self.sceneSurface, self.game.screen)
+            self.camera.draw(self.sceneSurface, self.game.screen, interpolation)
+
+        if profiler is not None:
+            profiler.stop('camera')
+            profiler.start('draw')
         
         # draw the overlay scene (without the camera)
         self.game.screen.blit(self.overlaySurface, (0, 0))
+
+        if profiler is not None:
+            profiler.stop('draw')
+            profiler.stopSpan()
     
     #
     # user-defined methods, initially empty
@@ -285,10 +409,13 @@ class Scene:
         
         pass
 
-    def update(self):
+    def update(self, deltaTime = 1):
 
         '''
-        Optional scene method called once per frame.
+        Optional scene method called once per update.
+        (update(self) without a deltaTime argument can also be used.)
+
+        :param float deltaTime: The time since the last update call (default = 1).
         '''
         
         pass
@@ -330,22 +457,164 @@ class Scene:
         '''
         
         # remove from previous scene
-        self.removeSprite(sprite)
+        if sprite.currentScene is not None and sprite.currentScene is not self:
+            sprite.currentScene._removeSprite(sprite)
         # add to new scene
-        if sprite not in self.sprites:
-            self.sprites.append(sprite)
+        if sprite not in self._spriteSet:
+            self._spriteSet.add(sprite)
+            # a sprite removed and added again is still in the list
+            if sprite in self._removedSprites:
+                self._removedSprites.discard(sprite)
+            else:
+                self._sprites.append(sprite)
             sprite.currentScene = self
             sprite.onAddedToScene(self)
+
+    def addSprites(self, sprites):
+
+        '''
+        Adds a list of sprites to the scene (and removes them from other scenes).
+
+        :param list(pygamepal.Sprite) sprites: The sprites to add.
+        '''
+
+        for sprite in sprites:
+            self.addSprite(sprite)
     
     # remove a sprite from the scene
     def removeSprite(self, sprite):
 
         '''
         Removes a sprite from the scene.
+        Sprites acquired from a pygamepal.SpritePool are returned to their pool.
         
         :param pygamepal.Sprite sprite: The sprite to remove.
         '''
         
-        if self.game.currentScene is not None and sprite.currentScene is not None and sprite in self.currentScene.sprites:
+        if sprite.currentScene is self:
+            self._removeSprite(sprite)
+            if sprite._pool is not None:
+                sprite._pool.release(sprite)
+
+    def removeSprites(self, sprites):
+
+        '''
+        Removes a list of sprites from the scene.
+        Sprites acquired from a pygamepal.SpritePool are returned to their pool.
+
+        :param list(pygamepal.Sprite) sprites: The sprites to remove.
+        '''
+
+        for sprite in sprites:
+            self.removeSprite(sprite)
+
+    def _removeSprite(self, sprite):
+
+        '''
+        Removes a sprite from the scene, without returning it to a pool
+        (e.g. when moving it to another scene).
+        The sprite is removed from the sprite list later, so that removing many sprites is fast.
+
+        :param pygamepal.Sprite sprite: The sprite to remove.
+        '''
+
+        if sprite in self._spriteSet:
+            self._spriteSet.discard(sprite)
+            self._removedSprites.add(sprite)
             sprite.onRemovedFromScene(self)
-            sprite.currentScene.sprites.remove(sprite)
\ No newline at end of file
+        sprite.currentScene = None
+
+    #
+    # properties
+    #
+
+    @property
+    def sprites(self):
+        '''
+        Get / set the sprites in the scene, in draw order.
+        (Note: returns a read-only view of the sprites, without copying them. Use addSprite() and removeSprite()
+        to change the scene sprites; changing the list directly (e.g. sprites.append()) is deprecated.)
+        '''
+        return self._spritesView
+
+    @sprites.setter
+    def sprites(self, value):
+        self._sprites = list(value)
+        self._spriteSet = set(self._sprites)
+        self._removedSprites = set()
+
+class _SpriteList(Sequence):
+
+    '''
+    A read-only view of the sprites in a scene, in draw order, returned by pygamepal.Scene.sprites.
+    The list methods that change the sprites (e.g. append() and remove()) are deprecated,
+    and add or remove sprites using the scene's addSprite() and removeSprite() methods.
+
+    :param pygamepal.Scene scene: The scene.
+    '''
+
+    __slots__ = ('_scene',)
+
+    def __init__(self, scene):
+        self._scene = scene
+
+    def __len__(self):
+        self._scene._compactSprites()
+        return len(self._scene._sprites)
+
+    def __getitem__(self, index):
+        self._scene._compactSprites()
+        return self._scene._sprites[index]
+
+    def __iter__(self):
+        self._scene._compactSprites()
+        return iter(self._scene._sprites)
+
+    def __contains__(self, sprite):
+        return sprite in self._scene._spriteSet
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _SpriteList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    #
+    # deprecated list methods
+    #
+
+    def append(self, sprite):
+        _warnSpriteListChange('append')
+        self._scene.addSprite(sprite)
+
+    def extend(self, sprites):
+        _warnSpriteListChange('extend')
+        self._scene.addSprites(sprites)
+
+    def insert(self, index, sprite):
+        # (sprites are drawn in order of the scene's sort key, so the index isn't used)
+        _warnSpriteListChange('insert')
+        self._scene.addSprite(sprite)
+
+    def remove(self, sprite):
+        _warnSpriteListChange('remove')
+        if sprite not in self._scene._spriteSet:
+            raise ValueError('Sprite is not in the scene')
+        self._scene.removeSprite(sprite)
+
+    def clear(self):
+        _warnSpriteListChange('clear')
+        self._scene.removeSprites(list(self))
+
+def _warnSpriteListChange(method):
+
+    '''
+    Warns that a list method used to change the scene sprites is deprecated.
+
+    :param str method: The list method used.
+    '''
+
+    warnings.warn('scene.sprites.' + method + '() is deprecated, use addSprite() and removeSprite() instead',
+                  DeprecationWarning, stacklevel = 3)
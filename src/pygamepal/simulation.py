@@ -0,0 +1,96 @@
+#
+# pygamepal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+
+import multiprocessing
+import random
+import time
+import traceback
+
+def runSimulations(gameClass, count, seed = 0, maxUpdates = None, processes = None, gameArgs = None):
+
+    '''
+    Runs many independent, headless games across all CPU cores, returning a list of results
+    (one per game, in order). Each result is a dictionary containing:
+
+    - 'seed': the random seed used for the game.
+    - 'updates': the number of updates run.
+    - 'gameTime': the (virtual) game time elapsed, in milliseconds.
+    - 'time': the real time taken to run the game, in seconds.
+    - 'summary': the value returned by the game's summary() method (or None if the game raised an error).
+    - 'error': None, or the traceback of the error raised by the game (which doesn't stop the other games).
+
+    Each game runs until it calls quit(), or until maxUpdates updates have run.
+    (Note: gameClass must be defined at the top level of a module, so that it can be used by other processes.)
+
+    :param class gameClass: The pygamepal.Game subclass to run.
+    :param int count: The number of games to run.
+    :param int seed: The random seed for the first game, with each other game using the next seed (default = 0).
+    :param int maxUpdates: The maximum number of updates to run for each game (default = None, which has no maximum).
+    :param int processes: The number of processes to use (default = None, which uses the number of CPUs).
+    :param dict gameArgs: Other arguments to create each game with (default = None).
+    '''
+
+    gameArgs = {} if gameArgs is None else dict(gameArgs)
+    gameArgs.setdefault('headless', True)
+    tasks = [(gameClass, seed + i, maxUpdates, gameArgs) for i in range(count)]
+
+    # (processes are started fresh rather than forked, as SDL state can't be safely forked)
+    pool = multiprocessing.get_context('spawn').Pool(processes)
+    try:
+        # send games to processes in chunks, to reduce communication between processes
+        chunkSize = max(1, count // ((processes or multiprocessing.cpu_count()) * 4))
+        return pool.map(_runSimulation, tasks, chunkSize)
+    finally:
+        # (the pool isn't terminated, as SDL handles the signal
+        # used to terminate worker processes instead of exiting)
+        pool.close()
+        pool.join()
+
+def _runSimulation(task):
+
+    '''
+    Runs a single game in a worker process, returning its result.
+
+    :param tuple task: The (gameClass, seed, maxUpdates, gameArgs) to run.
+    '''
+
+    from pygamepal import Collider, Trigger
+
+    gameClass, seed, maxUpdates, gameArgs = task
+
+    # colliders and triggers are stored for all games, so remember
+    # which existed before this game (as worker processes run many games)
+    colliderCount = len(Collider._allColliders)
+    triggerCount = len(Trigger._allTriggers)
+
+    startTime = time.perf_counter()
+    game = None
+    summary = None
+    error = None
+    try:
+        random.seed(seed)
+        game = gameClass(**gameArgs)
+        game._running = True
+        while game._running and (maxUpdates is None or game.updateCount < maxUpdates):
+            game._runFrame(game.render)
+        summary = game.summary()
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        if game is not None:
+            game.stopRecording()
+        del Collider._allColliders[colliderCount:]
+        del Trigger._allTriggers[triggerCount:]
+
+    return {
+        'seed': seed,
+        'updates': game.updateCount if game is not None else 0,
+        'gameTime': game.gameTime if game is not None else 0,
+        'time': time.perf_counter() - startTime,
+        'summary': summary,
+        'error': error
+    }
@@ -6,6 +6,7 @@
 #
 
 import pygame
+from .globals import _callUpdate
 
 class Sprite(pygame.sprite.Sprite):
 
@@ -48,6 +49,8 @@ class Sprite(pygame.sprite.Sprite):
         from pygamepal import SpriteImage
 
         self.position = position
+        # the position before the last update, used to interpolate drawing
+        self._previousPosition = None
 
         self.collider = collider
         self.trigger = trigger
@@ -78,6 +81,10 @@ class Sprite(pygame.sprite.Sprite):
         self.layer = layer
 
         self.currentScene = None
+        # the pygamepal.SpritePool the sprite was created by (if any),
+        # and whether it is currently waiting in the pool
+        self._pool = None
+        self._inPool = False
 
         self.drawColor = drawColor
 
@@ -109,30 +116,34 @@ class Sprite(pygame.sprite.Sprite):
 
         if self.trigger is not None:
             self.trigger._sprite = self
-            self.trigger.update()
+            self.trigger.update(deltaTime)
 
         #
         # update the sprite image
         #
 
         if self.spriteImage is not None:
-            self.spriteImage.update()
+            self.spriteImage.update(deltaTime)
        
-        self.update()
+        _callUpdate(self.update, deltaTime)
     
-    def _draw(self, surface):
+    def _draw(self, surface, interpolation = 1):
 
         '''
         Draw method called once per frame by a parent pygamepal.Scene.
         Users should not call this function.
         
         :param pygame.Surface surface: The surface to draw the sprite to.
+        :param float interpolation: How far between the previous and current positions to draw the sprite (0-1, default = 1).
         '''
 
         from pygamepal import Game, drawText, smallFont, DEBUG
 
         if self.spriteImage is not None:
-            self.spriteImage.draw(surface, self.position)
+            if interpolation < 1 and self._previousPosition is not None:
+                self.spriteImage.draw(surface, self._previousPosition.lerp(self._position, interpolation))
+            else:
+                self.spriteImage.draw(surface, self.position)
 
         if DEBUG is True:
             
@@ -192,16 +203,32 @@ class Sprite(pygame.sprite.Sprite):
         
         pass
 
-    def update(self):
+    def update(self, deltaTime = 1):
 
         '''
         Optional, user-defined update method.
-        Called automatically once per frame if added to a pygamepal.Game or pygamepal.Scene,
+        Called automatically once per update if added to a pygamepal.Game or pygamepal.Scene,
         but should be called manually if used independently.
+        (update(self) without a deltaTime argument can also be used.)
+
+        :param float deltaTime: The time since the last update call (default = 1).
         '''
         
         pass
 
+    def reset(self, **kwargs):
+
+        '''
+        Optional, user-defined method.
+        Called when the sprite is acquired from a pygamepal.SpritePool, to set up a reused sprite.
+        By default, each argument is set as a sprite attribute (e.g. reset(position = (10, 10))).
+
+        :param kwargs: The arguments passed to pygamepal.SpritePool.acquire().
+        '''
+
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
     def onAddedToScene(self, scene):
 
         '''
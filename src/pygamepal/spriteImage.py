@@ -72,7 +72,7 @@ class SpriteImage():
             return
         
         # increment timer
-        self._animationTimer += 1
+        self._animationTimer += deltaTime
 
         # advance animation if timer reaches the delay value
         if self._animationTimer >= self._textureLists[self._currentState]._animationDelay:
@@ -0,0 +1,132 @@
+#
+# pygamepal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+
+class SpritePool:
+
+    '''
+    Stores sprites that can be reused, so that sprites created and removed often
+    (such as bullets, enemies and pickups) don't need to be created each time.
+
+    acquire() returns a stored sprite (or creates one if none are free), calling the
+    sprite's reset() method with the arguments given. Sprites are returned to the pool
+    when removed from a scene, or by calling release(). For example:
+
+    ``bullets = pygamepal.SpritePool(Bullet, size = 100, texture = bulletTexture)``
+
+    ``scene.addSprite(bullets.acquire(position = (x, y)))``
+
+    :param class spriteClass: The pygamepal.Sprite class (or subclass) to create (default = None, which uses pygamepal.Sprite).
+    :param int size: The number of sprites to create in advance (default = 0).
+    :param spriteArgs: Other arguments to create each sprite with, e.g. texture = bulletTexture.
+    '''
+
+    def __init__(self, spriteClass = None, size = 0, **spriteArgs):
+
+        from pygamepal import Sprite
+
+        self.spriteClass = Sprite if spriteClass is None else spriteClass
+        self.spriteArgs = spriteArgs
+
+        # sprites waiting to be reused
+        self._freeSprites = []
+        # the number of sprites acquired and not yet released
+        self._activeCount = 0
+
+        for _ in range(size):
+            sprite = self._createSprite()
+            sprite._inPool = True
+            self._detach(sprite)
+            self._freeSprites.append(sprite)
+
+    def acquire(self, **kwargs):
+
+        '''
+        Returns a sprite from the pool, creating a new sprite if none are free.
+        The sprite's reset() method is called with the arguments given.
+
+        :param kwargs: Arguments to pass to the sprite's reset() method, e.g. position = (10, 10).
+        '''
+
+        if len(self._freeSprites) > 0:
+            sprite = self._freeSprites.pop()
+        else:
+            sprite = self._createSprite()
+
+        sprite._inPool = False
+        sprite._previousPosition = None
+        # colliders and triggers belong to no scene until the sprite is added to one
+        if sprite.collider is not None:
+            sprite.collider._scene = None
+        if sprite.trigger is not None:
+            sprite.trigger._scene = None
+        self._activeCount += 1
+
+        sprite.reset(**kwargs)
+        return sprite
+
+    def release(self, sprite):
+
+        '''
+        Returns a sprite to the pool, removing it from its scene.
+        (Note: doesn't need to be called for sprites removed from a scene, which are released automatically.)
+
+        :param pygamepal.Sprite sprite: The sprite to release.
+        '''
+
+        if sprite._pool is not self or sprite._inPool:
+            return
+
+        sprite._inPool = True
+        if sprite.currentScene is not None:
+            sprite.currentScene.removeSprite(sprite)
+        self._detach(sprite)
+        self._freeSprites.append(sprite)
+        self._activeCount -= 1
+
+    def _createSprite(self):
+
+        '''
+        Creates a new sprite belonging to the pool.
+        '''
+
+        sprite = self.spriteClass(**self.spriteArgs)
+        sprite._pool = self
+        return sprite
+
+    def _detach(self, sprite):
+
+        '''
+        Stops a pooled sprite's collider and trigger from colliding with anything.
+
+        :param pygamepal.Sprite sprite: The pooled sprite.
+        '''
+
+        # colliders and triggers only collide with others in the same scene,
+        # so pooled sprites are kept in a 'scene' of their own (the pool)
+        if sprite.collider is not None:
+            sprite.collider._scene = self
+        if sprite.trigger is not None:
+            sprite.trigger._scene = self
+            sprite.trigger._collidedTriggers.clear()
+
+    #
+    # properties
+    #
+
+    @property
+    def freeCount(self):
+        '''
+        Get the number of sprites waiting in the pool.
+        '''
+        return len(self._freeSprites)
+
+    @property
+    def activeCount(self):
+        '''
+        Get the number of sprites acquired from the pool and not yet released.
+        '''
+        return self._activeCount
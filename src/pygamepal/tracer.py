@@ -0,0 +1,180 @@
+#
+# pygamepal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+
+import json
+import os
+from time import perf_counter
+from .profiler import Profiler
+
+class Tracer(Profiler):
+
+    '''
+    A profiler that also records a timeline of nested spans (frames, updates, scenes and phases),
+    which can be exported as a Chrome Trace Event file and viewed in Perfetto (ui.perfetto.dev)
+    or chrome://tracing. Set a game's profiler to start tracing, e.g.:
+
+    ``game.profiler = pygamepal.Tracer()``
+
+    Only the most recent spans are kept, so that a game can be traced while running
+    and exported when something interesting (such as a slow frame) happens.
+
+    :param int size: The maximum number of spans to keep (default = 100000).
+    :param bool traceSprites: Also record a span for each sprite update, named after the sprite's class (default = False).
+    :param int frames: The number of recent frames to keep timings for (default = 300).
+    :param bool countAllocations: Also count the net memory blocks allocated (allocated minus freed) in each phase (default = False).
+    :param bool showOverlay: Draw the timings on top of the game each frame (default = False).
+    '''
+
+    def __init__(self, size = 100000, traceSprites = False, frames = 300, countAllocations = False, showOverlay = False):
+
+        # spans are stored in a ring buffer of (name, category, start, duration)
+        self.size = size
+        self.traceSprites = traceSprites
+        self._spans = [None] * size
+        self._nextSpan = 0
+        self._spanCount = 0
+        # the (name, category, start) of each span that has started but not stopped
+        self._openSpans = []
+        self._startTime = perf_counter()
+
+        Profiler.__init__(self, frames, countAllocations, showOverlay)
+        # remove any spans recorded while setting up the profiler
+        self.clear()
+
+    #
+    # recording spans
+    #
+
+    def _startSpan(self, name, category):
+
+        '''
+        Starts a span.
+
+        :param str name: The span name.
+        :param str category: The span category.
+        '''
+
+        self._openSpans.append((name, category, perf_counter()))
+
+    def _stopSpan(self):
+
+        '''
+        Stops the most recently started span, and adds it to the ring buffer.
+        '''
+
+        name, category, start = self._openSpans.pop()
+        self._spans[self._nextSpan] = (name, category, start, perf_counter() - start)
+        self._nextSpan = (self._nextSpan + 1) % self.size
+        self._spanCount = min(self._spanCount + 1, self.size)
+
+    def startFrame(self):
+
+        '''
+        Starts timing a frame. Called automatically for game profilers.
+        '''
+
+        Profiler.startFrame(self)
+        self._startSpan('frame', 'frame')
+
+    def endFrame(self):
+
+        '''
+        Stops timing a frame, and stores the frame's timings. Called automatically for game profilers.
+        '''
+
+        if self._frameStart is not None:
+            self._stopSpan()
+        Profiler.endFrame(self)
+
+    def start(self, phase):
+
+        '''
+        Starts timing a phase of the current frame.
+
+        :param str phase: The phase to time.
+        '''
+
+        Profiler.start(self, phase)
+        self._startSpan(phase, 'phase')
+
+    def stop(self, phase):
+
+        '''
+        Stops timing a phase of the current frame, adding the time to the phase total.
+
+        :param str phase: The phase to stop timing.
+        '''
+
+        self._stopSpan()
+        Profiler.stop(self, phase)
+
+    def startSpan(self, name):
+
+        '''
+        Starts a named span of time within the current frame, such as a scene update.
+
+        :param str name: The span name.
+        '''
+
+        self._startSpan(name, 'span')
+
+    def stopSpan(self):
+
+        '''
+        Stops the most recently started span.
+        '''
+
+        self._stopSpan()
+
+    #
+    # exporting
+    #
+
+    def getSpans(self):
+
+        '''
+        Returns the recorded spans, oldest first, as a list of (name, category, start, duration) tuples.
+        Times are in seconds, with start times measured from when the tracer was created.
+        '''
+
+        first = (self._nextSpan - self._spanCount) % self.size
+        spans = self._spans[first:first + self._spanCount]
+        if first + self._spanCount > self.size:
+            spans += self._spans[:self._nextSpan]
+        return [(name, category, start - self._startTime, duration) for name, category, start, duration in spans]
+
+    def export(self, filename):
+
+        '''
+        Writes the recorded spans to a Chrome Trace Event (JSON) file.
+
+        :param str filename: The file to write to.
+        '''
+
+        pid = os.getpid()
+        events = [{
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': start * 1000000,
+            'dur': duration * 1000000,
+            'pid': pid,
+            'tid': 0
+        } for name, category, start, duration in self.getSpans()]
+
+        with open(filename, 'w') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+
+    def clear(self):
+
+        '''
+        Removes all recorded spans.
+        '''
+
+        self._spans = [None] * self.size
+        self._nextSpan = 0
+        self._spanCount = 0
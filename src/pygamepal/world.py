@@ -0,0 +1,560 @@
+#
+# pygamepal, by Rik Cross
+#  -- homepage: github.com/rik-cross/pygamepal
+#  -- MIT licenced, free to use, modify and distribute
+#  -- run 'pip install pygamepal' to use
+#
+
+import itertools
+import pygame
+
+# numpy is only required for entity worlds
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# marks a component removed during an update
+_removedComponent = object()
+
+class World:
+
+    '''
+    Stores large numbers of simple entities (such as crowds, bullets and foliage) much more efficiently than sprites.
+    Each entity is just an id with some components (such as a position and an image), and entities with the same
+    components are stored together in arrays, so that systems can update all of them at once.
+
+    Add a world to a pygamepal.Scene, where it is updated and drawn automatically alongside the scene's sprites, e.g.:
+
+    ``self.world = pygamepal.World()``
+
+    ``self.world.createEntities(1000, position = positions, velocity = (1, 0), image = bulletTexture)``
+
+    The built-in components are:
+
+    - 'position': the (x, y) position of the top-left of the entity.
+    - 'velocity': the (x, y) distance moved each update (by the built-in movement system).
+    - 'image': a pygame.Surface, drawn at the entity position.
+    - 'collider': the (w, h) size of the entity, used by getEntitiesInRect().
+
+    Other components can be added using defineComponent().
+    Entities created or removed, and components added or removed, during an update
+    are applied at the end of the update (after all systems have run).
+    Requires numpy.
+
+    :param int capacity: The number of entities with the same components to make room for initially (default = 1024).
+    :param bool aboveSprites: Draw entities above (rather than below) the scene sprites (default = False).
+    '''
+
+    def __init__(self, capacity = 1024, aboveSprites = False):
+
+        if numpy is None:
+            raise ImportError('entity worlds require numpy (pip install numpy)')
+
+        self.capacity = capacity
+        self.aboveSprites = aboveSprites
+        # the distance outside the visible area that entities are still drawn,
+        # which should be at least the size of the largest entity image
+        self.cullMargin = 64
+
+        # the (size, type) of each component's values
+        self._components = {
+            'position': (2, numpy.float64),
+            'velocity': (2, numpy.float64),
+            'image': (1, object),
+            'collider': (2, numpy.float64)
+        }
+
+        # entities with the same components, stored against the set of component names
+        self._archetypes = {}
+        # the (archetype, row) of each entity
+        self._locations = {}
+        self._nextEntity = 0
+
+        # systems run each update, as (function, component names)
+        self._systems = []
+        self.addSystem(World.moveSystem, ['position', 'velocity'])
+
+        # entities created and removed, and components added and removed, during an update
+        self._updating = False
+        self._createdEntities = []
+        self._changedComponents = []
+        self._removedEntities = set()
+
+    @staticmethod
+    def moveSystem(deltaTime, position, velocity):
+
+        '''
+        The built-in movement system, which moves entities by their velocity.
+        '''
+
+        position += velocity * deltaTime
+
+    def update(self, deltaTime = 1):
+
+        '''
+        Runs each system. Called automatically if the world belongs to a pygamepal.Scene.
+
+        :param float deltaTime: The time elapsed since the last update (default = 1).
+        '''
+
+        self._updating = True
+        try:
+            for system, componentNames in self._systems:
+                required = frozenset(componentNames) - {'entity'}
+                # (a copy, so that a system creating a new archetype can't change the dictionary)
+                for archetype in list(self._archetypes.values()):
+                    if archetype.count > 0 and required <= archetype.componentNames:
+                        system(deltaTime, *archetype.getColumns(componentNames))
+        finally:
+            self._updating = False
+
+        # create entities, change components and remove entities queued during the update
+        for entities, components in self._createdEntities:
+            self._addEntities(entities, components)
+        self._createdEntities = []
+        for entity, name, value in self._changedComponents:
+            if entity not in self._locations:
+                continue
+            if value is _removedComponent:
+                self.removeComponent(entity, name)
+            else:
+                self.setComponent(entity, name, value)
+        self._changedComponents = []
+        for entity in self._removedEntities:
+            self._removeEntity(entity)
+        self._removedEntities = set()
+
+    def draw(self, surface, viewRect = None):
+
+        '''
+        Draws each entity with a position and image. Called automatically if the world belongs to a pygamepal.Scene.
+
+        :param pygame.Surface surface: The surface to draw to.
+        :param (int, int, int, int) viewRect: The (x, y, w, h) area of the surface that is visible. Entities outside of this area are not drawn (default = None, which draws all entities).
+        '''
+
+        for archetype in self._archetypes.values():
+            if archetype.count == 0 or not {'position', 'image'} <= archetype.componentNames:
+                continue
+            positions, images = archetype.getColumns(['position', 'image'])
+            if viewRect is not None:
+                x, y, w, h = viewRect
+                visible = ((positions[:, 0] > x - self.cullMargin) & (positions[:, 0] < x + w) &
+                           (positions[:, 1] > y - self.cullMargin) & (positions[:, 1] < y + h))
+                positions = positions[visible]
+                images = images[visible]
+            # (converting x and y separately is faster than converting each row)
+            surface.fblits(zip(images.tolist(), zip(positions[:, 0].tolist(), positions[:, 1].tolist())))
+
+    #
+    # components and systems
+    #
+
+    def defineComponent(self, name, size = 1, dtype = float):
+
+        '''
+        Adds a new type of component that entities can have.
+
+        :param str name: The component name.
+        :param int size: The number of values in the component, e.g. 2 for an (x, y) pair (default = 1).
+        :param type dtype: The type of the component's values, as a numpy type (or object for any value) (default = float).
+        '''
+
+        if name == 'entity':
+            raise ValueError("'entity' can't be used as a component name")
+        if name in self._components:
+            raise ValueError('Component already defined: ' + repr(name))
+        self._components[name] = (size, dtype)
+
+    def addSystem(self, system, componentNames):
+
+        '''
+        Adds a system, which is run once per update for each group of entities with all of the components given.
+        The system is called as system(deltaTime, *columns), where each column is a numpy array of
+        component values (one row per entity), in the order of the names given.
+        Use the name 'entity' for an array of entity ids. For example:
+
+        ``def fall(deltaTime, velocity): velocity[:, 1] += 0.1 * deltaTime``
+
+        ``world.addSystem(fall, ['velocity'])``
+
+        (Systems are run in the order they are added, after the built-in movement system.)
+
+        :param func system: The system function.
+        :param list(str) componentNames: The components the system uses.
+        '''
+
+        for name in componentNames:
+            self._checkComponent(name, allowEntity = True)
+        self._systems.append((system, list(componentNames)))
+
+    def removeSystem(self, system):
+
+        '''
+        Removes a system (including the built-in movement system, pygamepal.World.moveSystem).
+
+        :param func system: The system function to remove.
+        '''
+
+        self._systems = [(s, names) for s, names in self._systems if s is not system]
+
+    #
+    # entities
+    #
+
+    def createEntity(self, **components):
+
+        '''
+        Creates an entity with the components given, returning its id.
+
+        :param components: The component values, e.g. position = (10, 10), image = texture.
+        '''
+
+        return int(self.createEntities(1, **components)[0])
+
+    def createEntities(self, count, **components):
+
+        '''
+        Creates a number of entities with the components given, returning a numpy array of their ids.
+        Each component value is either shared by all of the entities, or is a list or array
+        with a value for each entity.
+
+        :param int count: The number of entities to create.
+        :param components: The component values, e.g. position = positions, image = texture.
+        '''
+
+        for name in components:
+            self._checkComponent(name)
+        entities = numpy.arange(self._nextEntity, self._nextEntity + count, dtype = numpy.int64)
+        self._nextEntity += count
+        if self._updating:
+            self._createdEntities.append((entities, components))
+        else:
+            self._addEntities(entities, components)
+        return entities
+
+    def removeEntity(self, entity):
+
+        '''
+        Removes an entity.
+
+        :param int entity: The entity id.
+        '''
+
+        if self._updating:
+            self._removedEntities.add(int(entity))
+        else:
+            self._removeEntity(int(entity))
+
+    def removeEntities(self, entities):
+
+        '''
+        Removes a list (or numpy array) of entities.
+
+        :param list(int) entities: The entity ids.
+        '''
+
+        for entity in entities:
+            self.removeEntity(entity)
+
+    def isAlive(self, entity):
+
+        '''
+        Returns true if an entity exists (and isn't waiting to be removed).
+
+        :param int entity: The entity id.
+        '''
+
+        return int(entity) in self._locations and int(entity) not in self._removedEntities
+
+    def hasComponent(self, entity, name):
+
+        '''
+        Returns true if an entity has a component.
+
+        :param int entity: The entity id.
+        :param str name: The component name.
+        '''
+
+        archetype, _ = self._locations[int(entity)]
+        return name in archetype.componentNames
+
+    def getComponent(self, entity, name):
+
+        '''
+        Returns the value of an entity's component.
+        Values with more than one part (such as positions) are returned as numpy arrays,
+        which can be changed to change the entity.
+
+        :param int entity: The entity id.
+        :param str name: The component name.
+        '''
+
+        archetype, row = self._locations[int(entity)]
+        return archetype.columns[name][row]
+
+    def setComponent(self, entity, name, value):
+
+        '''
+        Sets the value of an entity's component, adding the component if the entity doesn't have it.
+        (Components added during an update are added at the end of the update.)
+
+        :param int entity: The entity id.
+        :param str name: The component name.
+        :param value: The component value.
+        '''
+
+        self._checkComponent(name)
+        entity = int(entity)
+        # (entities created during the update aren't stored yet)
+        if self._updating and (entity not in self._locations or name not in self._locations[entity][0].componentNames):
+            self._changedComponents.append((entity, name, value))
+            return
+        archetype, row = self._locations[entity]
+        if name in archetype.componentNames:
+            archetype.columns[name][row] = value
+        else:
+            components = archetype.getRow(row)
+            components[name] = value
+            self._moveEntity(entity, components)
+
+    def removeComponent(self, entity, name):
+
+        '''
+        Removes a component from an entity.
+        (Components removed during an update are removed at the end of the update.)
+
+        :param int entity: The entity id.
+        :param str name: The component name.
+        '''
+
+        entity = int(entity)
+        if self._updating:
+            self._changedComponents.append((entity, name, _removedComponent))
+            return
+        archetype, row = self._locations[entity]
+        if name in archetype.componentNames:
+            components = archetype.getRow(row)
+            del components[name]
+            self._moveEntity(entity, components)
+
+    def query(self, componentNames):
+
+        '''
+        Returns a list of column lists, one for each group of entities with all of the components given,
+        where each column is a numpy array of component values (as passed to systems).
+
+        :param list(str) componentNames: The components to return, which can include 'entity' for entity ids.
+        '''
+
+        required = frozenset(componentNames) - {'entity'}
+        return [archetype.getColumns(componentNames) for archetype in self._archetypes.values()
+                if archetype.count > 0 and required <= archetype.componentNames]
+
+    def getEntitiesInRect(self, rect):
+
+        '''
+        Returns a list of the entities with a position and collider that intersect an area,
+        e.g. to find the bullets hitting a sprite: world.getEntitiesInRect(sprite.rect).
+
+        :param (int, int, int, int) rect: The (x, y, w, h) area to check.
+        '''
+
+        x, y, w, h = rect
+        entities = []
+        for entityIds, positions, sizes in self.query(['entity', 'position', 'collider']):
+            hit = ((positions[:, 0] < x + w) & (positions[:, 0] + sizes[:, 0] > x) &
+                   (positions[:, 1] < y + h) & (positions[:, 1] + sizes[:, 1] > y))
+            entities.extend(entityIds[hit].tolist())
+        if len(self._removedEntities) > 0:
+            entities = [e for e in entities if e not in self._removedEntities]
+        return entities
+
+    def __len__(self):
+        return sum(archetype.count for archetype in self._archetypes.values())
+
+    #
+    # storing entities
+    #
+
+    def _checkComponent(self, name, allowEntity = False):
+
+        '''
+        Raises an error if a component hasn't been defined.
+
+        :param str name: The component name.
+        :param bool allowEntity: Allow 'entity', which is used to get entity ids but can't be stored (default = False).
+        '''
+
+        if name == 'entity':
+            if allowEntity:
+                return
+            raise ValueError("'entity' can't be used as a component name")
+        if name not in self._components:
+            raise ValueError('Unknown component: ' + repr(name))
+
+    def _getArchetype(self, componentNames):
+
+        '''
+        Returns the archetype storing entities with the components given, creating it if needed.
+
+        :param frozenset componentNames: The component names.
+        '''
+
+        archetype = self._archetypes.get(componentNames)
+        if archetype is None:
+            archetype = _Archetype(componentNames, self._components, self.capacity)
+            self._archetypes[componentNames] = archetype
+        return archetype
+
+    def _addEntities(self, entities, components):
+
+        '''
+        Stores new entities.
+
+        :param numpy.ndarray entities: The entity ids.
+        :param dict components: The component values.
+        '''
+
+        archetype = self._getArchetype(frozenset(components))
+        start = archetype.add(entities, components)
+        self._locations.update(zip(entities.tolist(), zip(itertools.repeat(archetype), range(start, start + len(entities)))))
+
+    def _removeEntity(self, entity):
+
+        '''
+        Removes a stored entity.
+
+        :param int entity: The entity id.
+        '''
+
+        location = self._locations.pop(entity, None)
+        if location is None:
+            return
+        archetype, row = location
+        movedEntity = archetype.remove(row)
+        # the last entity is moved into the removed entity's row
+        if movedEntity is not None:
+            self._locations[movedEntity] = (archetype, row)
+
+    def _moveEntity(self, entity, components):
+
+        '''
+        Moves an entity to the archetype for a new set of components.
+
+        :param int entity: The entity id.
+        :param dict components: The entity's new component values.
+        '''
+
+        self._removeEntity(entity)
+        self._addEntities(numpy.array([entity], dtype = numpy.int64),
+                          {name: [value] for name, value in components.items()})
+
+class _Archetype:
+
+    '''
+    Stores the entities with the same set of components, with an array (column) for each component.
+    Rows after count are unused.
+
+    :param frozenset componentNames: The component names.
+    :param dict definitions: The (size, type) of each component.
+    :param int capacity: The number of entities to make room for initially.
+    '''
+
+    def __init__(self, componentNames, definitions, capacity):
+
+        self.componentNames = componentNames
+        self.count = 0
+        self.entities = numpy.zeros(capacity, numpy.int64)
+        self.columns = {}
+        for name in componentNames:
+            size, dtype = definitions[name]
+            self.columns[name] = numpy.zeros((capacity, size) if size > 1 else capacity, dtype)
+
+    def getColumns(self, componentNames):
+
+        '''
+        Returns the used part of each column (or the entity ids, for 'entity').
+
+        :param list(str) componentNames: The component names.
+        '''
+
+        return [self.entities[:self.count] if name == 'entity' else self.columns[name][:self.count]
+                for name in componentNames]
+
+    def getRow(self, row):
+
+        '''
+        Returns a dictionary of the component values in a row.
+
+        :param int row: The row.
+        '''
+
+        return {name: column[row].copy() if column.ndim > 1 else column[row] for name, column in self.columns.items()}
+
+    def add(self, entities, components):
+
+        '''
+        Adds rows for new entities, returning the first new row.
+
+        :param numpy.ndarray entities: The entity ids.
+        :param dict components: The component values (shared by all entities, or one per entity).
+        '''
+
+        start = self.count
+        end = start + len(entities)
+        if end > len(self.entities):
+            self._resize(end)
+        self.entities[start:end] = entities
+        for name, column in self.columns.items():
+            value = components[name]
+            # (shared objects such as surfaces are set directly, rather than converted to arrays)
+            if column.dtype == object and not isinstance(value, (list, numpy.ndarray)):
+                column[start:end].fill(value)
+            else:
+                column[start:end] = value
+        self.count = end
+        return start
+
+    def remove(self, row):
+
+        '''
+        Removes a row by moving the last row into it,
+        returning the id of the entity moved (or None if no entity was moved).
+
+        :param int row: The row.
+        '''
+
+        last = self.count - 1
+        movedEntity = None
+        if row != last:
+            self.entities[row] = self.entities[last]
+            for column in self.columns.values():
+                column[row] = column[last]
+            movedEntity = int(self.entities[row])
+        # (so that removed images can be freed)
+        for column in self.columns.values():
+            if column.dtype == object:
+                column[last] = None
+        self.count = last
+        return movedEntity
+
+    def _resize(self, count):
+
+        '''
+        Makes room for at least the number of rows given, doubling the capacity as needed.
+
+        :param int count: The number of rows needed.
+        '''
+
+        capacity = max(1, len(self.entities))
+        while capacity < count:
+            capacity *= 2
+        entities = numpy.zeros(capacity, numpy.int64)
+        entities[:self.count] = self.entities[:self.count]
+        self.entities = entities
+        for name, column in self.columns.items():
+            newColumn = numpy.zeros((capacity,) + column.shape[1:], column.dtype)
+            newColumn[:self.count] = column[:self.count]
+            self.columns[name] = newColumn
@@ -18,8 +18,9 @@ class MyGame(pygamepal.Game):
         # replace 'pass' below with your code
         pass
 
-    def update(self, deltaTime):
+    def update(self, deltaTime = 1):
         # replace 'pass' below with your code
+        # (deltaTime is the time since the last update, measured in frames)
         pass
 
     def draw(self):